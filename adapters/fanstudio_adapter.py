@@ -17,11 +17,25 @@ from .base_adapter import BaseAdapter
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import FANSTUDIO_WARNING_SOURCES, FANSTUDIO_REPORT_SOURCES
 from utils.logger import get_logger
 from utils import timezone_utils
 
 logger = get_logger()
 
+# 数据源分类（由 config 中的单一列表派生，用于按类型选择解析方法）
+_WARNING_SOURCE_SET = frozenset(FANSTUDIO_WARNING_SOURCES)
+_REPORT_SOURCE_SET = frozenset(FANSTUDIO_REPORT_SOURCES)
+# initial_all 中各数据源的处理顺序：地震预警（优先级最高） > 地震速报 > 气象预警
+_PRIORITY_SOURCES = FANSTUDIO_WARNING_SOURCES + FANSTUDIO_REPORT_SOURCES + ('weatheralarm',)
+# parse() 取 initial_all 中第一条有效数据时的顺序（速报中 p2pquake 排在 cwa 之后）
+_P2PQUAKE_POS = FANSTUDIO_REPORT_SOURCES.index('cwa') + 1
+_FIRST_MATCH_PRIORITY_SOURCES = (
+    FANSTUDIO_WARNING_SOURCES
+    + FANSTUDIO_REPORT_SOURCES[:_P2PQUAKE_POS] + ('p2pquake',) + FANSTUDIO_REPORT_SOURCES[_P2PQUAKE_POS:]
+    + ('weatheralarm',)
+)
+
 # 地名修正工具（延迟加载）
 _place_name_fixer = None
 
@@ -114,19 +128,8 @@ class FanStudioAdapter(BaseAdapter):
             logger.info(f"[FanStudio适配器] 启用的数据源名称集合: {sorted(enabled_source_names)}")
             
             results = []
-            # 所有数据源（按优先级排序）
-            priority_sources = [
-                # 地震预警（优先级最高）
-                'cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew',
-                # 地震速报
-                'cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'hko', 
-                'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn',
-                # 气象预警
-                'weatheralarm'
-            ]
-            
-            # 处理所有有效数据源（只处理启用的）
-            for source_type in priority_sources:
+            # 处理所有有效数据源（只处理启用的，按优先级排序）
+            for source_type in _PRIORITY_SOURCES:
                 # 检查该数据源是否启用
                 if source_type not in enabled_source_names:
                     logger.debug(f"[FanStudio] 数据源 {source_type} 未启用（enabled_source_names={sorted(enabled_source_names)}），跳过")
@@ -188,15 +191,6 @@ class FanStudioAdapter(BaseAdapter):
                 if self.data_source_type == 'all':
                     # 遍历所有数据源，返回第一个有效的数据
                     # 优先级：预警 > 速报 > 气象预警
-                    priority_sources = [
-                        # 地震预警（优先级最高）
-                        'cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew',
-                        # 地震速报
-                        'cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'p2pquake', 'hko', 
-                        'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn',
-                        # 气象预警
-                        'weatheralarm'
-                    ]
                     
                     # 获取启用的数据源列表
                     enabled_sources = getattr(self, '_enabled_sources', {})
@@ -220,7 +214,7 @@ class FanStudioAdapter(BaseAdapter):
                                 enabled_source_names.add('p2pquake')
                     
                     # 按优先级查找第一个有效数据（只查找启用的数据源）
-                    for source_type in priority_sources:
+                    for source_type in _FIRST_MATCH_PRIORITY_SOURCES:
                         # 检查该数据源是否启用
                         if source_type not in enabled_source_names:
                             continue  # 跳过未启用的数据源
@@ -305,10 +299,9 @@ class FanStudioAdapter(BaseAdapter):
             # 根据数据源类型选择不同的解析方法
             if source_type == 'weatheralarm':
                 result = self._parse_weather(data)
-            elif source_type in ['cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa',
-                                'hko', 'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn']:
+            elif source_type in _REPORT_SOURCE_SET:
                 result = self._parse_earthquake_report(data, source_type)
-            elif source_type in ['cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew']:
+            elif source_type in _WARNING_SOURCE_SET:
                 result = self._parse_earthquake_warning(data, source_type)
             else:
                 # 默认按速报处理
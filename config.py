@@ -11,6 +11,7 @@ import threading
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import urlparse
 
 from utils.logger import get_logger
 
@@ -26,6 +27,68 @@ CHANGELOG_TEXT = """版本 2.2.2
 1、修复桌面中文路径启动报错问题；
 2、新增 版本号"""
 
+# 数据源 URL 表（固定使用 fanstudio.tech；加载、默认配置与设置页共用，避免每次拼接）
+FANSTUDIO_BASE_DOMAIN = "fanstudio.tech"
+FANSTUDIO_ALL_URL = f"wss://ws.{FANSTUDIO_BASE_DOMAIN}/all"
+FANSTUDIO_WEATHER_URL = f"wss://ws.{FANSTUDIO_BASE_DOMAIN}/weatheralarm"  # 气象预警
+# Fan Studio预警 / 速报 对应的单项数据源名称（按优先级排序）及其 URL
+FANSTUDIO_WARNING_SOURCES = ('cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew')
+FANSTUDIO_REPORT_SOURCES = ('cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'hko',
+                            'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn')
+FANSTUDIO_WARNING_URLS = tuple(f"wss://ws.{FANSTUDIO_BASE_DOMAIN}/{source}" for source in FANSTUDIO_WARNING_SOURCES)
+FANSTUDIO_REPORT_URLS = tuple(f"wss://ws.{FANSTUDIO_BASE_DOMAIN}/{source}" for source in FANSTUDIO_REPORT_SOURCES)
+# Fan Studio 的主机名后缀（正式/备用域名），用于区分 Fan Studio 与其他 WebSocket 数据源
+_FANSTUDIO_HOST_SUFFIXES = ('fanstudio.tech', 'fanstudio.hk')
+_WS_URL_PREFIXES = ('ws://', 'wss://')
+# P2PQuake HTTP 数据源：日本气象厅地震情报、日本气象厅海啸预报（默认开启）
+P2PQUAKE_HTTP_URLS = (
+    "https://api.p2pquake.net/v2/history?codes=551&limit=3",
+    "https://api.p2pquake.net/v2/jma/tsunami?limit=1",
+)
+# Wolfx HTTP 数据源（默认关闭）
+WOLFX_HTTP_URLS = (
+    "https://api.wolfx.jp/sc_eew.json", "https://api.wolfx.jp/jma_eew.json",
+    "https://api.wolfx.jp/fj_eew.json", "https://api.wolfx.jp/cenc_eew.json",
+    "https://api.wolfx.jp/cwa_eew.json", "https://api.wolfx.jp/cenc_eqlist.json",
+    "https://api.wolfx.jp/jma_eqlist.json",
+)
+# Wolfx / NIED WebSocket 数据源（默认关闭）
+OPTIONAL_WSS_URLS = (
+    "wss://ws-api.wolfx.jp/all_eew",
+    "wss://ws-api.wolfx.jp/sc_eew", "wss://ws-api.wolfx.jp/jma_eew", "wss://ws-api.wolfx.jp/fj_eew",
+    "wss://ws-api.wolfx.jp/cenc_eew", "wss://ws-api.wolfx.jp/cwa_eew",
+    "wss://ws-api.wolfx.jp/cenc_eqlist", "wss://ws-api.wolfx.jp/jma_eqlist",
+    "wss://sismotide.top/nied",
+)
+
+
+def is_fanstudio_url(url: str) -> bool:
+    """
+    判断 URL 是否为 Fan Studio 数据源
+    按解析出的主机名判断，兼容用户配置中不带 ws. 子域名、带端口、大小写或协议不同的写法
+    """
+    if 'fanstudio' not in url.lower():
+        return False
+    try:
+        host = urlparse(url).hostname
+    except ValueError:
+        return False
+    return bool(host) and host.endswith(_FANSTUDIO_HOST_SUFFIXES)
+
+
+def _json_identical(a: Any, b: Any) -> bool:
+    """
+    按序列化结果严格比较两个 JSON 值
+    区分类型（True/1/1.0 用 == 比较相等，但写出的 JSON 不同）及 dict 键顺序
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(_json_identical(v, b[k]) for k, v in a.items())
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(map(_json_identical, a, b))
+    return a == b
+
 
 @dataclass
 class GUIConfig:
@@ -43,6 +106,7 @@ class GUIConfig:
     timezone: str = "Asia/Shanghai"  # 显示时区（IANA 名称），默认北京时间
     last_seen_changelog_version: str = ""  # 上次已读的更新说明版本，用于弹窗仅展示一次
     use_gpu_rendering: bool = False  # True=GPU(OpenGL) 渲染，False=CPU(软件) 渲染，默认 CPU
+    qt_translation_dir: str = ""  # 上次成功加载 Qt 中文翻译的目录，启动时优先直接加载
     
     def validate(self) -> bool:
         """验证配置有效性"""
@@ -188,6 +252,9 @@ class Config:
         # 配置变更回调
         self._config_callbacks: List[Callable] = []
         
+        # 各顶层 section 上次写入时的 (值, JSON 片段)，内容未变的 section 直接复用片段
+        self._section_json_cache: Dict[str, tuple] = {}
+        
         # 配置文件路径：C:\Users\账户名\AppData\Roaming\subtitl\settings.json
         # 日志文件：C:\Users\账户名\AppData\Roaming\subtitl\log.txt（或log_YYYYMMDD.txt）
         # 翻译缓存：C:\Users\账户名\AppData\Roaming\subtitl\translation_cache.json
@@ -255,6 +322,7 @@ class Config:
                 'timezone': self.gui_config.timezone,
                 'last_seen_changelog_version': self.gui_config.last_seen_changelog_version,
                 'use_gpu_rendering': self.gui_config.use_gpu_rendering,
+                'qt_translation_dir': self.gui_config.qt_translation_dir,
             },
             'MESSAGE_CONFIG': {
                 'max_message_length': self.message_config.max_message_length,
@@ -321,6 +389,15 @@ class Config:
                         return True
         return False
     
+    def _section_json(self, key: str, value: Any) -> str:
+        """返回顶层 section 的 JSON 片段（与 json.dump(indent=2) 的嵌套缩进一致），内容与类型均未变时复用缓存"""
+        cached = self._section_json_cache.get(key)
+        if cached is not None and _json_identical(cached[0], value):
+            return cached[1]
+        text = json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        self._section_json_cache[key] = (value, text)
+        return text
+    
     def _write_config_dict(self, config_data: Dict[str, Any]) -> bool:
         """将配置 dict 原子写入配置文件。"""
         if not self.config_file:
@@ -328,8 +405,16 @@ class Config:
         import shutil
         temp_file = self.config_file.with_suffix('.tmp')
         try:
+            if config_data:
+                body = ',\n'.join(
+                    f'  {json.dumps(key, ensure_ascii=False)}: {self._section_json(key, value)}'
+                    for key, value in config_data.items()
+                )
+                text = '{\n' + body + '\n}'
+            else:
+                text = '{}'
             with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+                f.write(text)
             shutil.move(str(temp_file), str(self.config_file))
             return True
         except Exception as e:
@@ -423,42 +508,11 @@ class Config:
             # 加载数据源配置
             self.enabled_sources = config_data.get('ENABLED_SOURCES', {})
             
-            # 确定基础域名和all数据源URL（固定使用fanstudio.tech）
-            base_domain = "fanstudio.tech"
-            all_url = f"wss://ws.{base_domain}/all"
-            
-            # 所有数据源列表（默认全部启用）
-            all_warning_sources = ['cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew']
-            all_report_sources = ['cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'hko', 
-                                 'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn']
-            weather_source = 'weatheralarm'  # 气象预警
+            all_url = FANSTUDIO_ALL_URL
 
             # 如果配置文件中没有数据源配置，使用默认配置（启用所有数据源）
             if not self.enabled_sources:
-                self.enabled_sources = {all_url: True}  # all数据源始终启用
-                # 添加气象预警数据源
-                self.enabled_sources[f"wss://ws.{base_domain}/{weather_source}"] = True
-                # 添加所有预警数据源
-                for source in all_warning_sources:
-                    self.enabled_sources[f"wss://ws.{base_domain}/{source}"] = True
-                # 添加所有速报数据源
-                for source in all_report_sources:
-                    self.enabled_sources[f"wss://ws.{base_domain}/{source}"] = True
-                # 添加HTTP数据源
-                self.enabled_sources["https://api.p2pquake.net/v2/history?codes=551&limit=3"] = True  # 日本气象厅地震情报
-                self.enabled_sources["https://api.p2pquake.net/v2/jma/tsunami?limit=1"] = True  # 日本气象厅海啸预报
-                # Wolfx HTTP / WSS、NIED WSS（默认关闭）
-                for u in ["https://api.wolfx.jp/sc_eew.json", "https://api.wolfx.jp/jma_eew.json", "https://api.wolfx.jp/fj_eew.json",
-                          "https://api.wolfx.jp/cenc_eew.json", "https://api.wolfx.jp/cwa_eew.json",
-                          "https://api.wolfx.jp/cenc_eqlist.json", "https://api.wolfx.jp/jma_eqlist.json"]:
-                    self.enabled_sources[u] = False
-                self.enabled_sources["wss://ws-api.wolfx.jp/all_eew"] = False
-                for u in ["wss://ws-api.wolfx.jp/sc_eew", "wss://ws-api.wolfx.jp/jma_eew", "wss://ws-api.wolfx.jp/fj_eew",
-                          "wss://ws-api.wolfx.jp/cenc_eew", "wss://ws-api.wolfx.jp/cwa_eew",
-                          "wss://ws-api.wolfx.jp/cenc_eqlist", "wss://ws-api.wolfx.jp/jma_eqlist"]:
-                    self.enabled_sources[u] = False
-                self.enabled_sources["wss://sismotide.top/nied"] = False
-
+                self.enabled_sources = self._default_enabled_sources()
                 logger.info("配置文件中没有数据源配置，使用默认配置（启用所有数据源）")
             else:
                 # 配置文件中已有数据源配置，尊重用户的设置
@@ -472,89 +526,17 @@ class Config:
                         logger.warning(f"all数据源被禁用，但这是必需的，已自动启用: {all_url}")
                         self.enabled_sources[all_url] = True
                 
-                # 对于其他数据源，如果配置文件中没有，则添加并默认启用（向后兼容）
+                # 对于其他数据源，如果配置文件中没有，则按默认值添加（向后兼容）
                 # 但如果配置文件中已经存在（无论是true还是false），则尊重用户的设置
-                weather_url = f"wss://ws.{base_domain}/{weather_source}"
-                if weather_url not in self.enabled_sources:
-                    self.enabled_sources[weather_url] = True
-                    logger.debug(f"添加缺失的气象预警数据源: {weather_source}")
-                # 如果已存在，尊重用户的设置，不强制启用
-                
-                # 确保所有预警数据源在配置中存在（如果不存在则默认启用，如果存在则尊重用户设置）
-                for source in all_warning_sources:
-                    url = f"wss://ws.{base_domain}/{source}"
+                for url, enabled in self._default_enabled_sources().items():
                     if url not in self.enabled_sources:
-                        self.enabled_sources[url] = True
-                        logger.debug(f"添加缺失的预警数据源: {source}")
-                # 如果已存在，尊重用户的设置，不强制启用
-                
-                # 确保所有速报数据源在配置中存在（如果不存在则默认启用，如果存在则尊重用户设置）
-                for source in all_report_sources:
-                    url = f"wss://ws.{base_domain}/{source}"
-                    if url not in self.enabled_sources:
-                        self.enabled_sources[url] = True
-                        logger.debug(f"添加缺失的速报数据源: {source}")
-                # 如果已存在，尊重用户的设置，不强制启用
-                
-                # 确保HTTP数据源在配置中存在（如果不存在则默认启用，如果存在则尊重用户设置）
-                http_sources = {
-                    "https://api.p2pquake.net/v2/history?codes=551&limit=3": "日本气象厅地震情报 (p2pquake)",
-                }
-                for http_url, source_name in http_sources.items():
-                    if http_url not in self.enabled_sources:
-                        self.enabled_sources[http_url] = True
-                        logger.debug(f"添加缺失的HTTP数据源: {source_name}")
-                if "https://api.p2pquake.net/v2/jma/tsunami?limit=1" not in self.enabled_sources:
-                    self.enabled_sources["https://api.p2pquake.net/v2/jma/tsunami?limit=1"] = True
-                    logger.debug("添加缺失的 P2PQuake 海啸预报数据源")
-                # Wolfx HTTP 数据源（默认关闭）
-                wolfx_http_sources = [
-                    "https://api.wolfx.jp/sc_eew.json", "https://api.wolfx.jp/jma_eew.json",
-                    "https://api.wolfx.jp/fj_eew.json", "https://api.wolfx.jp/cenc_eew.json",
-                    "https://api.wolfx.jp/cwa_eew.json", "https://api.wolfx.jp/cenc_eqlist.json",
-                    "https://api.wolfx.jp/jma_eqlist.json",
-                ]
-                for http_url in wolfx_http_sources:
-                    if http_url not in self.enabled_sources:
-                        self.enabled_sources[http_url] = False
-                        logger.debug(f"添加缺失的 Wolfx HTTP 数据源: {http_url}")
-                # Wolfx / NIED WebSocket 数据源（默认关闭）
-                wolfx_wss = ["wss://ws-api.wolfx.jp/all_eew",
-                             "wss://ws-api.wolfx.jp/sc_eew", "wss://ws-api.wolfx.jp/jma_eew", "wss://ws-api.wolfx.jp/fj_eew",
-                             "wss://ws-api.wolfx.jp/cenc_eew", "wss://ws-api.wolfx.jp/cwa_eew",
-                             "wss://ws-api.wolfx.jp/cenc_eqlist", "wss://ws-api.wolfx.jp/jma_eqlist",
-                             "wss://sismotide.top/nied"]
-                for wss_url in wolfx_wss:
-                    if wss_url not in self.enabled_sources:
-                        self.enabled_sources[wss_url] = False
-                        logger.debug(f"添加缺失的 WSS 数据源: {wss_url}")
-                # 如果已存在，尊重用户的设置，不强制启用
+                        self.enabled_sources[url] = enabled
+                        logger.debug("添加缺失的数据源: %s", url)
 
             # 根据服务器选择更新URL
             self._update_urls_for_server_selection()
             
-            # 提取WebSocket URL（只包含all数据源和其他非fanstudio数据源）
-            # all数据源必须包含，单项fanstudio数据源不直接连接，只作为过滤器
-            base_domain = "fanstudio.tech"
-            all_url = f"wss://ws.{base_domain}/all"
-            
-            # 确保all数据源在enabled_sources中且为True
-            self.enabled_sources[all_url] = True
-            
-            ws_urls = []
-            # all数据源必须包含（无论enabled_sources中的状态）
-            ws_urls.append(all_url)
-            logger.debug(f"已添加all数据源到ws_urls: {all_url}")
-            
-            # 添加其他非fanstudio数据源
-            for url in self.enabled_sources.keys():
-                if url.startswith(('ws://', 'wss://')) and url != all_url:
-                    if 'fanstudio.tech' not in url and 'fanstudio.hk' not in url:
-                        if self.enabled_sources.get(url, False):
-                            ws_urls.append(url)
-                            logger.debug(f"已添加非fanstudio数据源到ws_urls: {url}")
-            
-            self.ws_urls = ws_urls
+            self.rebuild_ws_urls()
             
             logger.info(f"配置加载成功，启用 {len(self.ws_urls)} 个WebSocket数据源")
             self._notify_config_changed()
@@ -612,6 +594,10 @@ class Config:
                         merged[key] = {**existing.get(key, {}), **our_value}
                     else:
                         merged[key] = our_value
+                if _json_identical(merged, existing):
+                    # 内容与文件一致（如未修改直接点保存），无需重写
+                    logger.debug("配置未变化，跳过写入")
+                    return True
                 config_data = merged
             else:
                 config_data = our_config
@@ -637,55 +623,22 @@ class Config:
         self.translation_config = TranslationConfig()
         self.log_config = LogConfig()
         # 默认启用所有数据源（固定使用fanstudio.tech）
-        base_domain = "fanstudio.tech"
-        all_url = f"wss://ws.{base_domain}/all"
-        # 所有预警和速报数据源（对应Fan Studio预警和Fan Studio速报）
-        warning_sources = ['cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew']
-        report_sources = ['cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'hko', 
-                         'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn']
-        weather_source = 'weatheralarm'  # 气象预警
-
-        self.enabled_sources = {all_url: True}  # all数据源始终启用
-        # 添加气象预警数据源（默认开启）
-        self.enabled_sources[f"wss://ws.{base_domain}/{weather_source}"] = True
-        # 添加所有预警数据源（Fan Studio预警）
-        for source in warning_sources:
-            self.enabled_sources[f"wss://ws.{base_domain}/{source}"] = True
-        # 添加所有速报数据源（Fan Studio速报）
-        for source in report_sources:
-            self.enabled_sources[f"wss://ws.{base_domain}/{source}"] = True
-        # 添加HTTP数据源
-        self.enabled_sources["https://api.p2pquake.net/v2/history?codes=551&limit=3"] = True  # 日本气象厅地震情报
-        self.enabled_sources["https://api.p2pquake.net/v2/jma/tsunami?limit=1"] = True  # 日本气象厅海啸预报
-        # Wolfx HTTP（默认关闭）
-        for u in ["https://api.wolfx.jp/sc_eew.json", "https://api.wolfx.jp/jma_eew.json", "https://api.wolfx.jp/fj_eew.json",
-                  "https://api.wolfx.jp/cenc_eew.json", "https://api.wolfx.jp/cwa_eew.json",
-                  "https://api.wolfx.jp/cenc_eqlist.json", "https://api.wolfx.jp/jma_eqlist.json"]:
-            self.enabled_sources[u] = False
-        # Wolfx / NIED WebSocket（默认关闭）
-        self.enabled_sources["wss://ws-api.wolfx.jp/all_eew"] = False
-        for u in ["wss://ws-api.wolfx.jp/sc_eew", "wss://ws-api.wolfx.jp/jma_eew", "wss://ws-api.wolfx.jp/fj_eew",
-                  "wss://ws-api.wolfx.jp/cenc_eew", "wss://ws-api.wolfx.jp/cwa_eew",
-                  "wss://ws-api.wolfx.jp/cenc_eqlist", "wss://ws-api.wolfx.jp/jma_eqlist"]:
-            self.enabled_sources[u] = False
-        self.enabled_sources["wss://sismotide.top/nied"] = False
+        self.enabled_sources = self._default_enabled_sources()
 
-        # 提取WebSocket URL（只包含all数据源和其他非fanstudio数据源）
-        ws_urls = []
-        # all数据源必须包含
-        ws_urls.append(all_url)
-        logger.debug(f"已添加all数据源到ws_urls: {all_url}")
-        
-        # 添加其他非fanstudio数据源
-        for url in self.enabled_sources.keys():
-            if url.startswith(('ws://', 'wss://')) and url != all_url:
-                if 'fanstudio.tech' not in url and 'fanstudio.hk' not in url:
-                    ws_urls.append(url)
-                    logger.debug(f"已添加非fanstudio数据源到ws_urls: {url}")
-        
-        self.ws_urls = ws_urls
+        self.rebuild_ws_urls()
         logger.info(f"已应用默认配置，默认启用 {len(self.ws_urls)} 个WebSocket数据源（Fan Studio All + 默认数据源）: {self.ws_urls}")
     
+    @staticmethod
+    def _default_enabled_sources() -> Dict[str, bool]:
+        """默认数据源启用状态：Fan Studio all/气象预警/预警/速报与 P2PQuake 开启，Wolfx、NIED 关闭"""
+        sources = {FANSTUDIO_ALL_URL: True, FANSTUDIO_WEATHER_URL: True}  # all数据源始终启用
+        sources.update(dict.fromkeys(FANSTUDIO_WARNING_URLS, True))
+        sources.update(dict.fromkeys(FANSTUDIO_REPORT_URLS, True))
+        sources.update(dict.fromkeys(P2PQUAKE_HTTP_URLS, True))
+        sources.update(dict.fromkeys(WOLFX_HTTP_URLS, False))
+        sources.update(dict.fromkeys(OPTIONAL_WSS_URLS, False))
+        return sources
+    
     def update_enabled_sources(self, sources: Dict[str, bool]):
         """更新启用的数据源"""
         self.enabled_sources.update(sources)
@@ -693,29 +646,23 @@ class Config:
         # 根据服务器选择更新URL
         self._update_urls_for_server_selection()
         
-        # 提取WebSocket URL（只包含all数据源和其他非fanstudio数据源）
-        # all数据源必须包含，单项fanstudio数据源不直接连接，只作为过滤器
-        base_domain = "fanstudio.tech"
-        all_url = f"wss://ws.{base_domain}/all"
-        
-        # 确保all数据源在enabled_sources中且为True
-        self.enabled_sources[all_url] = True
-        
-        ws_urls = []
-        # all数据源必须包含（无论enabled_sources中的状态）
-        ws_urls.append(all_url)
-        
-        # 添加其他非fanstudio数据源
-        for url in self.enabled_sources.keys():
-            if url.startswith(('ws://', 'wss://')) and url != all_url:
-                if 'fanstudio.tech' not in url and 'fanstudio.hk' not in url:
-                    if self.enabled_sources.get(url, False):
-                        ws_urls.append(url)
-        
-        self.ws_urls = ws_urls
+        self.rebuild_ws_urls()
         logger.info(f"更新数据源配置，当前启用 {len(self.ws_urls)} 个WebSocket数据源: {self.ws_urls}")
         self._notify_config_changed()
     
+    def rebuild_ws_urls(self) -> List[str]:
+        """
+        根据 enabled_sources 重建 ws_urls（all数据源 + 已启用的非fanstudio WebSocket数据源）
+        all数据源必须包含且始终启用，单项fanstudio数据源不直接连接，只作为过滤器
+        """
+        all_url = FANSTUDIO_ALL_URL
+        self.enabled_sources[all_url] = True
+        self.ws_urls = [all_url] + [
+            url for url, enabled in self.enabled_sources.items()
+            if enabled and url.lower().startswith(_WS_URL_PREFIXES) and not is_fanstudio_url(url)
+        ]
+        return self.ws_urls
+    
     def _update_urls_for_server_selection(self):
         """
         根据服务器选择（正式/备用）更新URL中的域名
@@ -732,7 +679,7 @@ class Config:
                 if 'fanstudio.hk' in url:
                     new_url = url.replace('fanstudio.hk', 'fanstudio.tech')
                     new_enabled_sources[new_url] = enabled
-                    logger.debug(f"已更新URL: {url} -> {new_url}")
+                    logger.debug("已更新URL: %s -> %s", url, new_url)
                 else:
                     # 其他URL保持不变
                     new_enabled_sources[url] = enabled
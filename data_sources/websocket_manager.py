@@ -341,13 +341,9 @@ class WebSocketManager:
     async def start_all_connections(self):
         """启动所有数据源连接"""
         config = Config()
-        enabled_urls = []
-        
         # 获取启用的WebSocket URL
-        for url in config.ws_urls:
-            if config.enabled_sources.get(url, True):
-                enabled_urls.append(url)
-                self.enabled_sources[url] = True
+        enabled_urls = [url for url in config.ws_urls if config.enabled_sources.get(url, True)]
+        self.enabled_sources.update(dict.fromkeys(enabled_urls, True))
         
         if not enabled_urls:
             logger.warning("ws_urls为空，没有可连接的数据源！")
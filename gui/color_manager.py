@@ -158,27 +158,27 @@ class Color48Picker(QDialog):
         button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.setSpacing(10)
         
-        # 恢复默认按钮（如果有默认颜色）
-        if self.default_color:
-            reset_btn = QPushButton("恢复默认")
-            reset_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF9800;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px 15px;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #F57C00;
-                }
-                QPushButton:pressed {
-                    background-color: #E65100;
-                }
-            """)
-            reset_btn.clicked.connect(self._reset_to_default)
-            button_layout.addWidget(reset_btn)
+        # 恢复默认按钮（仅在有默认颜色时显示）
+        self.reset_btn = QPushButton("恢复默认")
+        self.reset_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #FF9800;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 8px 15px;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: #F57C00;
+            }
+            QPushButton:pressed {
+                background-color: #E65100;
+            }
+        """)
+        self.reset_btn.clicked.connect(self._reset_to_default)
+        self.reset_btn.setVisible(bool(self.default_color))
+        button_layout.addWidget(self.reset_btn)
         
         button_layout.addStretch()
         
@@ -227,6 +227,19 @@ class Color48Picker(QDialog):
         
         main_layout.addWidget(button_frame)
     
+    def set_colors(self, initial_color: str, default_color: Optional[str] = None):
+        """
+        重新设置初始颜色与默认颜色，便于复用同一个选择器实例
+        
+        Args:
+            initial_color: 初始颜色值（十六进制格式）
+            default_color: 默认颜色值（十六进制格式），为None时隐藏恢复默认按钮
+        """
+        self.selected_color = initial_color.upper() if initial_color else "#000000"
+        self.default_color = default_color.upper() if default_color else None
+        self.reset_btn.setVisible(bool(self.default_color))
+        self._update_preview()
+    
     def _on_color_clicked(self, color: str):
         """颜色按钮点击事件"""
         self.selected_color = color.upper()
@@ -27,7 +27,7 @@ from utils.message_processor import MessageProcessor
 from utils.logger import get_logger
 from utils import timezone_utils
 
-from .scrolling_text import ScrollingText, ScrollingTextCPU
+from .scrolling_text import ScrollingText, ScrollingTextCPU, image_cache_path
 from .message_manager import MessageQueue, MessageBuffer, MessageItem
 
 logger = get_logger()
@@ -597,39 +597,19 @@ class MainWindow(QMainWindow):
                     # 如果图片在缓存中，立即显示
                     # 直接检查缓存，避免文件系统操作导致的阻塞
                     if image_path:
-                        from pathlib import Path
                         try:
-                            img_path = Path(image_path)
-                            # 尝试解析路径（使用try-except避免阻塞）
-                            try:
-                                img_path_resolved = str(img_path.resolve())
-                            except (OSError, PermissionError) as e:
-                                logger.debug(f"解析图片路径时出错（非阻塞）: {e}")
-                                img_path_resolved = str(image_path)  # 使用原始路径
-                            
-                            current_height = self.scrolling_text.height()
-                            cache_key = f"{img_path_resolved}_{current_height}"
-                            
-                            with self.scrolling_text._image_cache_lock:
-                                if cache_key in self.scrolling_text._image_cache:
-                                    found_pixmap = self.scrolling_text._image_cache[cache_key]
-                                    self.scrolling_text.current_image = found_pixmap
-                                    self.scrolling_text._cached_image_width = found_pixmap.width() + 10
-                                    self.scrolling_text.set_loading(False)
-                                    self.scrolling_text.update()
-                                    logger.info(f"已更新当前显示消息的图片: {image_path}")
-                                    return
+                            found = self.scrolling_text._find_cached_image(image_cache_path(image_path))
+                            if found is not None:
+                                self.scrolling_text._show_image(found)
+                                self.scrolling_text.set_loading(False)
+                                self.scrolling_text.update()
+                                logger.info(f"已更新当前显示消息的图片: {image_path}")
+                                return
                             
                             # 如果不在缓存中，异步加载
                             self.scrolling_text._current_load_task_id += 1
                             current_task_id = self.scrolling_text._current_load_task_id
-                            thread = threading.Thread(
-                                target=self.scrolling_text._load_image_async,
-                                args=(image_path, current_task_id),
-                                daemon=True,
-                                name="ImageLoader"
-                            )
-                            thread.start()
+                            self.scrolling_text._load_image_async(image_path, current_task_id)
                         except Exception as e:
                             logger.debug(f"检查图片缓存时出错（非阻塞）: {e}")
                             logger.info(f"已触发当前显示消息的图片异步加载: {image_path}")
@@ -6,10 +6,14 @@
 """
 
 from PyQt5.QtWidgets import QOpenGLWidget, QWidget
-from PyQt5.QtCore import QTimer, Qt, QRectF, pyqtSignal
-from PyQt5.QtGui import QPainter, QFont, QColor, QPixmap, QImage, QFontMetrics, QSurfaceFormat, QOpenGLContext
+from PyQt5.QtCore import QTimer, Qt, QRectF, QSize, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QFont, QColor, QPixmap, QImage, QImageReader, QPixmapCache, QFontMetrics, QStaticText, QTransform, QSurfaceFormat, QOpenGLContext
 from typing import Optional, Dict, Tuple, Any
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+import os
+import sys
 import threading
 import time
 
@@ -18,34 +22,186 @@ from utils.logger import get_logger
 logger = get_logger()
 
 
+# 预加载任务使用的 task_id（只写入缓存，不更新显示）
+_PRELOAD_TASK_ID = -1
+# 图片解码线程池的最大线程数
+_IMAGE_LOADER_THREADS = 4
+# 预加载解码任务在线程池队列中的优先级（低于显示请求的默认优先级 0，只占用空闲线程）
+_PRELOAD_PRIORITY = -1
+# QPixmapCache 容量（KB）；QPixmapCache 为进程内全局缓存，只需设置一次
+_PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+def image_cache_path(image_path: str) -> str:
+    """图片缓存/去重使用的路径键：规范化后驻留（sys.intern），同一路径在各处共用同一字符串对象及其哈希"""
+    return sys.intern(os.path.normpath(image_path))
+
+
+# 可选的 libjpeg-turbo 解码器（PyTurboJPEG）：None 表示尚未尝试加载，False 表示不可用
+_turbo_jpeg: Any = None
+_turbo_jpeg_lock = threading.Lock()
+
+
+def _get_turbo_jpeg():
+    """获取 PyTurboJPEG 解码器实例（首次调用时加载，未安装时返回 None 并回退到 QImageReader）"""
+    global _turbo_jpeg
+    if _turbo_jpeg is None:
+        with _turbo_jpeg_lock:
+            if _turbo_jpeg is None:
+                try:
+                    from turbojpeg import TurboJPEG
+                    _turbo_jpeg = TurboJPEG()
+                    logger.info("使用 libjpeg-turbo 解码 JPEG 图片")
+                except Exception as e:
+                    logger.debug(f"PyTurboJPEG 不可用，使用 QImageReader 解码图片: {e}")
+                    _turbo_jpeg = False
+    return _turbo_jpeg or None
+
+
+def _decode_jpeg_turbo(jpeg, image_path: str, target_height: int) -> QImage:
+    """使用 libjpeg-turbo 解码 JPEG：解码时按 DCT 缩放因子直接缩小，再平滑缩放到目标高度"""
+    from turbojpeg import TJPF_RGBA
+    with open(image_path, 'rb') as f:
+        data = f.read()
+    _, height, _, _ = jpeg.decode_header(data)
+    scaling_factor = None
+    if target_height > 0 and height > target_height:
+        # 选择缩小后高度仍不低于目标高度的最小缩放因子
+        candidates = [
+            (num, denom) for num, denom in jpeg.scaling_factors
+            if num < denom and -(-height * num // denom) >= target_height
+        ]
+        if candidates:
+            scaling_factor = min(candidates, key=lambda f: f[0] / f[1])
+    array = jpeg.decode(data, pixel_format=TJPF_RGBA, scaling_factor=scaling_factor)
+    h, w = array.shape[:2]
+    # QImage 不持有 numpy 缓冲区，copy() 后再交给主线程
+    image = QImage(array.data, w, h, array.strides[0], QImage.Format_RGBA8888).copy()
+    if target_height > 0 and image.height() > target_height:
+        image = image.scaledToHeight(target_height, Qt.SmoothTransformation)
+    return image
+
+
+@dataclass
+class CachedPix:
+    """缓存图片及其派生尺寸（命中时计算一次，绘制时直接读取，避免每帧调用 width()/height()）"""
+    __slots__ = ('pixmap', 'width_pad', 'height')
+    pixmap: QPixmap
+    width_pad: int  # 图片宽度 + 与文本之间的间距
+    height: int
+
+    @classmethod
+    def from_pixmap(cls, pixmap: QPixmap) -> 'CachedPix':
+        return cls(pixmap, pixmap.width() + 10, pixmap.height())
+
+
+class _LoadImageTask(QRunnable):
+    """图片解码任务（在 QThreadPool 工作线程中执行）
+
+    JPEG 优先使用 libjpeg-turbo（若已安装 PyTurboJPEG）解码，其余格式或解码失败时
+    使用 QImageReader 按目标高度直接解码为 QImage，通过 _image_ready 信号交回主线程；
+    QPixmap 只能在主线程创建，由主线程完成转换。
+    """
+
+    def __init__(self, widget, image_path: str, target_height: int):
+        super().__init__()
+        self.widget = widget
+        self.image_path = image_path
+        self.target_height = target_height
+
+    def run(self):
+        image = QImage()
+        img_path_resolved = self.image_path
+        try:
+            img_path = Path(self.image_path)
+            if not img_path.exists():
+                logger.error(f"图片文件不存在: {self.image_path}")
+            else:
+                # 使用绝对路径作为缓存键，确保与预加载时的格式一致
+                img_path_resolved = str(img_path.resolve())
+                jpeg = _get_turbo_jpeg() if img_path.suffix.lower() in ('.jpg', '.jpeg') else None
+                if jpeg is not None:
+                    try:
+                        image = _decode_jpeg_turbo(jpeg, self.image_path, self.target_height)
+                    except Exception as e:
+                        logger.debug(f"libjpeg-turbo 解码失败，改用 QImageReader: {self.image_path} ({e})")
+                        image = QImage()
+                if image.isNull():
+                    reader = QImageReader(self.image_path)
+                    size = reader.size()
+                    if size.isValid() and self.target_height > 0 and size.height() > self.target_height:
+                        new_width = int(size.width() * self.target_height / size.height())
+                        reader.setScaledSize(QSize(new_width, self.target_height))
+                    image = reader.read()
+                    if image.isNull():
+                        logger.error(f"图片加载失败: {self.image_path} ({reader.errorString()})")
+        except Exception as e:
+            logger.error(f"异步加载图片失败: {e}")
+        try:
+            self.widget._image_ready.emit(image, self.image_path, img_path_resolved, self.target_height)
+        except RuntimeError:
+            # 控件已销毁
+            pass
+
+
 class _ScrollingTextMixin:
     """滚动文本逻辑混入（与 QOpenGLWidget 或 QWidget 组合使用）"""
     scroll_completed = pyqtSignal()
+    _image_ready = pyqtSignal(QImage, str, str, int)
+    # 预加载扫描线程找到的图片路径列表，交回主线程登记并提交解码
+    _preload_scanned = pyqtSignal(list, int)
+    # 所有滚动组件共享的图片解码线程池（限制并发解码数量）
+    _loader_pool: Optional[QThreadPool] = None
+    _pixmap_cache_configured = False
 
     def _init_scrolling(self, config):
         """初始化滚动组件状态（由 ScrollingText / ScrollingTextCPU 的 __init__ 调用）"""
         self.config = config
         self.x_position = 0.0
+        self._last_paint_x = None
         self.current_text = ""
-        self.current_color = QColor('#01FF00')
+        self.current_color = self._qc('#01FF00')
         self.current_message_type = None
         self.current_parsed_data = None
+        self._msg_processor = None
         self.current_image_path = None
         self.current_image = None
+        self._current_image_height = 0
         self.current_text_image = None
+        self._last_render_key = None
+        self._composite_pixmap: Optional[QPixmap] = None
+        self._static_text: Optional[QStaticText] = None
+        # 直接绘制回退路径使用的画笔，随 QStaticText 一同准备，避免每帧由 QColor 隐式构造 QPen
+        self._text_pen: Optional[QPen] = None
         self.font = QFont("SimSun", config.gui_config.font_size)
         if not self.font.exactMatch():
             self.font = QFont("宋体", config.gui_config.font_size)
         self.font.setBold(True)
         logger.info(f"使用字体: {self.font.family()}, 大小: {config.gui_config.font_size}pt, 加粗: 是")
-        self._image_cache: Dict[str, QPixmap] = {}
-        self._image_cache_lock = threading.Lock()
+        self._load_pil_font()
+        # 图片缓存使用 Qt 自带的 QPixmapCache（LRU，按字节数限制容量；只在主线程读写）
+        self._configure_pixmap_cache()
+        # 图片路径（每个路径只保留一种尺寸） -> (缓存时使用的目标高度, QPixmapCache.Key)；
+        # QPixmapCache 使用 insert 返回的句柄存取，不再以字符串为键；
+        # 按路径 LRU 淘汰，超出容量时同时从 QPixmapCache 中移除
+        self._image_cache_index: "OrderedDict[str, Tuple[int, QPixmapCache.Key]]" = OrderedDict()
+        self._image_cache_cap = 128  # 气象预警图片约数十张，每张可能有规范化、解析两种路径键
+        # 最近一次命中的 (路径, 目标高度, CachedPix)
+        self._last_probe: Optional[Tuple[str, int, CachedPix]] = None
         self._text_texture_cache: Dict[Tuple[str, str, int], QPixmap] = {}
         self._text_texture_cache_lock = threading.Lock()
         self._current_load_task_id = 0
+        # 正在解码的图片：(规范化路径, 目标高度) -> 最新请求的 task_id，预加载与显示请求共用，
+        # 重复请求合并为一次解码（只在主线程读写）
+        self._inflight: Dict[Tuple[str, int], int] = {}
+        # 尚未完成的预加载解码（键同 _inflight），全部完成时输出日志
+        self._preload_keys: set = set()
+        # 本轮事件循环内解码完成、待批量写入缓存的预加载结果
+        self._preload_results: list = []
+        self._get_loader_pool()
+        self._image_ready.connect(self._on_image_ready, Qt.QueuedConnection)
+        self._preload_scanned.connect(self._submit_preloads, Qt.QueuedConnection)
         self._cached_text_width = 0
         self._cached_image_width = 0
-        self._last_scroll_time = time.time()
+        self._last_scroll_time = time.monotonic_ns()
         self._is_loading = False
         self._loading_lock = threading.Lock()
         self._is_scrolling = False
@@ -58,83 +214,137 @@ class _ScrollingTextMixin:
         self.timer.start(timer_interval)
         logger.info(f"定时器间隔设置为: {timer_interval}ms (目标帧率: {target_fps}fps, VSync: {'开启' if config.gui_config.vsync_enabled else '关闭'})")
         self._timer_interval = timer_interval
+        self._applied_bg_color = config.gui_config.bg_color
         self.setStyleSheet(f"background-color: {config.gui_config.bg_color};")
+        # 绘制时每帧使用的背景色与垂直中心，仅在配置/尺寸变化时更新
+        self._bg_qcolor = self._qc(config.gui_config.bg_color)
+        self._center_y = self.height() / 2.0
         QTimer.singleShot(1000, self._preload_weather_images)
 
     def _paint_content(self, painter: QPainter):
-        """统一的绘制逻辑（供 paintGL / paintEvent 调用）"""
+        """统一的绘制逻辑（供 paintGL / paintEvent 调用）。
+
+        实例上的 _paint_content 会被 _select_paint_routine 替换为与当前状态对应的专用例程
+        （合成位图 / 图片+文本 / 纯文本），每帧无需再判断图片与合成状态。
+        """
+        self._select_paint_routine()
+        self._paint_content(painter)
+
+    def _select_paint_routine(self):
+        """按当前图片与合成状态选择每帧使用的绘制例程（图片或合成结果变化时调用）"""
+        if self._composite_pixmap is not None:
+            self._paint_content = self._paint_composite
+        elif self.current_image:
+            self._paint_content = self._paint_with_image
+        else:
+            self._paint_content = self._paint_text_only
+
+    def _paint_background(self, painter: QPainter) -> bool:
+        """填充背景，返回是否有文本需要继续绘制"""
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self._bg_qcolor)
+        return bool(self.current_text)
+
+    def _paint_composite(self, painter: QPainter):
+        """图片+文本已合成为一张位图，每帧只需一次 drawPixmap"""
+        if not self._paint_background(painter):
+            return
+        composite = self._composite_pixmap
+        x = int(self.x_position)
+        if x < self.width() and x + self._cached_image_width + self._cached_text_width > 0:
+            painter.drawPixmap(x, int(self._center_y - composite.height() / 2.0), composite)
+
+    def _paint_with_image(self, painter: QPainter):
+        """图片与文本分别绘制（未能合成时）"""
+        if not self._paint_background(painter):
+            return
+        image_y = self._center_y - self._current_image_height / 2.0
+        painter.drawPixmap(int(self.x_position), int(image_y), self.current_image)
+        self._paint_text(painter, int(self.x_position + self._cached_image_width))
+
+    def _paint_text_only(self, painter: QPainter):
+        """纯文本（无图片）"""
+        if not self._paint_background(painter):
+            return
+        self._paint_text(painter, int(self.x_position))
+
+    def _paint_text(self, painter: QPainter, text_x: int):
+        """在 text_x 处绘制文本：优先使用预渲染文本图片，否则回退为直接绘制"""
+        if text_x >= self.width() or text_x + self._cached_text_width <= 0:
+            return
+        center_y = self._center_y
+        if self.current_text_image:
+            text_image_y = center_y - self.current_text_image.height() / 2.0
+            painter.drawPixmap(text_x, int(text_image_y), self.current_text_image)
+            return
+        painter.setFont(self.font)
+        text_pen = self._text_pen
+        painter.setPen(text_pen if text_pen is not None else self.current_color)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        static_text = self._static_text
+        if static_text is not None:
+            # 预排版的文本，每帧只回放字形，不再重新排版
+            painter.drawStaticText(text_x, int(center_y - static_text.size().height() / 2.0), static_text)
+        else:
+            text_rect = QRectF(text_x, 0, self._cached_text_width, self.height())
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.current_text)
+
+    def _load_pil_font(self):
+        """加载 PIL 宋体字体及测量用画布（初始化及字号变化时调用，渲染时复用）"""
+        self._pil_font = None
+        self._pil_measure_draw = None
         try:
-            painter.setRenderHint(QPainter.Antialiasing)
-            bg_color = QColor(self.config.gui_config.bg_color)
-            painter.fillRect(self.rect(), bg_color)
-            if not self.current_text:
-                return
-            center_y = self.height() / 2.0
-            image_x = self.x_position
-            if self.current_image:
-                image_y = center_y - self.current_image.height() / 2.0
-                painter.drawPixmap(int(image_x), int(image_y), self.current_image)
-                image_x += self._cached_image_width
-            text_x = int(image_x)
-            if self.current_text_image:
-                text_image_y = center_y - self.current_text_image.height() / 2.0
-                if text_x < self.width() and text_x + self._cached_text_width > 0:
-                    painter.drawPixmap(text_x, int(text_image_y), self.current_text_image)
-            else:
-                painter.setFont(self.font)
-                painter.setPen(self.current_color)
-                painter.setRenderHint(QPainter.TextAntialiasing)
-                if text_x < self.width() and text_x + self._cached_text_width > 0:
-                    text_rect = QRectF(text_x, 0, self._cached_text_width, self.height())
-                    painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.current_text)
+            from PIL import Image, ImageDraw, ImageFont
+        except ImportError:
+            logger.warning("PIL库未安装，无法使用文本预渲染优化")
+            return
+        font_size = self.config.gui_config.font_size
+        pil_font = None
+        try:
+            import platform
+            if platform.system() == "Windows":
+                simsun_fonts = [
+                    ("C:/Windows/Fonts/simsun.ttc", 0),
+                    ("C:/Windows/Fonts/simsun.ttc", 1),
+                    ("C:/Windows/Fonts/simsun.ttf", 0),
+                ]
+                for font_path, font_index in simsun_fonts:
+                    if Path(font_path).exists():
+                        try:
+                            pil_font = ImageFont.truetype(font_path, font_size, index=font_index)
+                            break
+                        except (OSError, IndexError):
+                            try:
+                                pil_font = ImageFont.truetype(font_path, font_size)
+                                break
+                            except Exception:
+                                continue
+                        except Exception:
+                            continue
+            if pil_font is None:
+                pil_font = ImageFont.load_default()
+                logger.warning("PIL无法加载宋体，使用默认字体")
         except Exception as e:
-            logger.error(f"绘制失败: {e}")
-            import traceback
-            logger.exception("详细错误信息:")
+            logger.warning(f"加载PIL字体时出错: {e}，使用默认字体")
+            pil_font = ImageFont.load_default()
+        self._pil_font = pil_font
+        self._pil_measure_draw = ImageDraw.Draw(Image.new('RGBA', (1, 1), (0, 0, 0, 0)))
 
     def _render_text_to_image(self, text: str, color: QColor) -> Optional[QPixmap]:
         """
         将文本预渲染为图片（纹理缓存），供 ScrollingText / ScrollingTextCPU 共用。
         """
-        if not text:
+        if not text or self._pil_font is None:
             return None
         cache_key = (text, color.name(), self.config.gui_config.font_size)
-        with self._text_texture_cache_lock:
-            if cache_key in self._text_texture_cache:
-                return self._text_texture_cache[cache_key]
+        # 读取不加锁（dict.get 在 GIL 下是原子的），锁只用于写入与淘汰
+        cached = self._text_texture_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            temp_img = Image.new('RGBA', (1, 1), (0, 0, 0, 0))
-            temp_draw = ImageDraw.Draw(temp_img)
-            pil_font = None
-            try:
-                import platform
-                if platform.system() == "Windows":
-                    simsun_fonts = [
-                        ("C:/Windows/Fonts/simsun.ttc", 0),
-                        ("C:/Windows/Fonts/simsun.ttc", 1),
-                        ("C:/Windows/Fonts/simsun.ttf", 0),
-                    ]
-                    for font_path, font_index in simsun_fonts:
-                        if Path(font_path).exists():
-                            try:
-                                pil_font = ImageFont.truetype(font_path, self.config.gui_config.font_size, index=font_index)
-                                break
-                            except (OSError, IndexError):
-                                try:
-                                    pil_font = ImageFont.truetype(font_path, self.config.gui_config.font_size)
-                                    break
-                                except Exception:
-                                    continue
-                            except Exception:
-                                continue
-                if pil_font is None:
-                    pil_font = ImageFont.load_default()
-                    logger.warning("PIL无法加载宋体，使用默认字体")
-            except Exception as e:
-                logger.warning(f"加载PIL字体时出错: {e}，使用默认字体")
-                pil_font = ImageFont.load_default()
-            bbox = temp_draw.textbbox((0, 0), text, font=pil_font)
+            from PIL import Image, ImageDraw
+            pil_font = self._pil_font
+            bbox = self._pil_measure_draw.textbbox((0, 0), text, font=pil_font)
             font_size = self.config.gui_config.font_size
             pad_h = max(20, int(font_size * 0.6))
             pad_v = max(20, int(font_size * 0.5))
@@ -154,13 +364,115 @@ class _ScrollingTextMixin:
                     del self._text_texture_cache[oldest_key]
             self._cached_text_width = text_width
             return pixmap
-        except ImportError:
-            logger.warning("PIL库未安装，无法使用文本预渲染优化")
-            return None
         except Exception as e:
             logger.error(f"文本预渲染失败: {e}")
             return None
 
+    @staticmethod
+    def _pixmap_cache_get(cache_key: "QPixmapCache.Key") -> Optional[QPixmap]:
+        """按句柄从 QPixmapCache 中查找图片，未命中（或已被淘汰）返回 None"""
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    def _image_target_height(self) -> int:
+        """图片缩放目标高度（窗口高度的 80%，控件尚未布局时使用配置中的窗口高度）"""
+        window_height = self.height() if self.height() > 10 else self.config.gui_config.window_height
+        return int(window_height * 0.8)
+
+    def _find_cached_image(self, cache_path: str) -> Optional[CachedPix]:
+        """按路径（image_cache_path 规范化后或解析后的绝对路径）查找缓存图片。
+
+        每个路径只缓存一种尺寸：缓存图片比目标高度大时直接从缓存缩小（不再读盘解码）；
+        缓存的是缩小过的图片且目标高度明显更大时视为未命中，按新高度重新解码。
+        """
+        target_height = self._image_target_height()
+        # 快速路径：与上次命中的路径、高度相同（稳定状态下的常见情况）时直接复用
+        last_probe = self._last_probe
+        if last_probe is not None and last_probe[1] == target_height and last_probe[0] == cache_path:
+            return last_probe[2]
+        cached = self._image_cache_index.get(cache_path)
+        if cached is None:
+            return None
+        cached_height, pixmap_key = cached
+        pixmap = self._pixmap_cache_get(pixmap_key)
+        if pixmap is None:
+            # 已被 QPixmapCache 淘汰，同步移除索引
+            del self._image_cache_index[cache_path]
+            return None
+        if pixmap.height() > target_height:
+            pixmap = pixmap.scaledToHeight(target_height, Qt.SmoothTransformation)
+            # 共用同一句柄的路径（规范化路径与解析路径）一并替换为缩小后的图片
+            shared = [path for path, (_, key) in self._image_cache_index.items() if key == pixmap_key]
+            self._store_pixmap(shared, pixmap, target_height)
+        elif pixmap.height() >= cached_height and target_height > cached_height * 1.05:
+            return None
+        else:
+            self._image_cache_index.move_to_end(cache_path)
+        entry = CachedPix.from_pixmap(pixmap)
+        self._last_probe = (cache_path, target_height, entry)
+        return entry
+
+    def _show_image(self, entry: CachedPix):
+        """显示图片（主线程），绘制所需的尺寸直接取自 entry"""
+        self.current_image = entry.pixmap
+        self._current_image_height = entry.height
+        self._cached_image_width = entry.width_pad
+        self._rebuild_composite()
+
+    def _store_pixmap(self, cache_paths, pixmap: QPixmap, target_height: int):
+        """写入 QPixmapCache 一次，多个路径共用同一句柄（替换各路径原有尺寸），按路径 LRU 淘汰"""
+        pixmap_key = QPixmapCache.insert(pixmap)
+        if not pixmap_key.isValid():
+            return
+        index = self._image_cache_index
+        for cache_path in cache_paths:
+            old = index.pop(cache_path, None)
+            if old is not None and old[1] != pixmap_key:
+                QPixmapCache.remove(old[1])
+            while len(index) >= self._image_cache_cap:
+                _, (_, old_key) = index.popitem(last=False)
+                QPixmapCache.remove(old_key)
+            index[cache_path] = (target_height, pixmap_key)
+
+    def _cache_image(self, image_path: str, img_path_resolved: str, pixmap: QPixmap, target_height: int):
+        """写入图片缓存（主线程），同时以规范化路径和解析后的路径为键，任一种路径查找都能命中"""
+        norm_path = image_cache_path(image_path)
+        self._store_pixmap({norm_path, sys.intern(img_path_resolved)}, pixmap, target_height)
+        if target_height == self._image_target_height():
+            self._last_probe = (norm_path, target_height, CachedPix.from_pixmap(pixmap))
+
+    def _rebuild_composite(self):
+        """将当前图片与文本图片合成为一张位图（每条消息只合成一次），任一缺失时清空合成结果"""
+        self._composite_pixmap = None
+        if self.current_image and self.current_text_image:
+            try:
+                img_h = self.current_image.height()
+                txt_h = self.current_text_image.height()
+                height = max(img_h, txt_h)
+                composite = QPixmap(self._cached_image_width + self._cached_text_width, height)
+                composite.fill(Qt.transparent)
+                p = QPainter(composite)
+                p.drawPixmap(0, (height - img_h) // 2, self.current_image)
+                p.drawPixmap(self._cached_image_width, (height - txt_h) // 2, self.current_text_image)
+                p.end()
+                self._composite_pixmap = composite
+            except Exception as e:
+                logger.debug(f"合成图片与文本失败，回退为分别绘制: {e}")
+                self._composite_pixmap = None
+        self._select_paint_routine()
+
+    def _prepare_static_text(self, text: str):
+        """直接绘制回退路径：测量文本宽度并预排版为 QStaticText"""
+        metrics = QFontMetrics(self.font)
+        self._cached_text_width = metrics.width(text)
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.PlainText)
+        static_text.prepare(QTransform(), self.font)
+        self._static_text = static_text
+        self._text_pen = QPen(self.current_color)
+
     def _preload_weather_images(self):
         """预加载气象预警图片到缓存（异步），供 ScrollingText / ScrollingTextCPU 共用。"""
         def scan_images_async():
@@ -175,74 +487,40 @@ class _ScrollingTextMixin:
                     logger.debug(f"检查图片目录时出错（非阻塞）: {e}")
                     return
                 try:
-                    image_files = list(weather_images_dir.glob("*.jpg"))
+                    # 单次 scandir 遍历，目录为绝对路径时 entry.path 已是绝对路径，无需逐个 resolve()
+                    with os.scandir(weather_images_dir) as it:
+                        entries = [e for e in it if e.is_file(follow_symlinks=False) and e.name.lower().endswith('.jpg')]
                 except (OSError, PermissionError) as e:
                     logger.debug(f"扫描图片文件时出错（非阻塞）: {e}")
                     return
-                if not image_files:
+                if not entries:
                     logger.warning(f"气象预警图片目录中没有找到 .jpg 文件: {weather_images_dir}")
                     return
-                image_paths = []
-                for image_file in image_files:
-                    try:
-                        image_path_str = str(image_file.resolve())
-                    except (OSError, PermissionError) as e:
-                        logger.debug(f"解析图片路径时出错（非阻塞）: {e}")
-                        image_path_str = str(image_file)
-                    image_paths.append((image_path_str, str(image_file)))
-                logger.info(f"开始异步预加载 {len(image_paths)} 张气象预警图片...")
-                import queue
-                if not hasattr(self, '_preload_queue'):
-                    self._preload_queue = queue.Queue()
-                for image_path_str, image_file_path in image_paths:
-                    self._preload_queue.put((image_path_str, image_file_path))
-                QTimer.singleShot(0, self._load_images_from_queue)
+                # 交回主线程登记到 _inflight 后再提交解码，与显示请求共用去重
+                self._preload_scanned.emit([entry.path for entry in entries], target_height)
+            except RuntimeError:
+                # 控件已销毁
+                pass
             except Exception as e:
                 logger.error(f"预加载气象预警图片失败: {e}", exc_info=True)
+        target_height = self._image_target_height()
         thread = threading.Thread(target=scan_images_async, daemon=True, name="WeatherImagePreloader")
         thread.start()
 
-    def _load_images_from_queue(self):
-        """从队列中加载图片（主线程），供 ScrollingText / ScrollingTextCPU 共用。"""
-        if not hasattr(self, '_preload_queue'):
-            return
-        try:
-            import queue
-            window_height = self.height() if self.height() > 10 else self.config.gui_config.window_height
-            target_height = int(window_height * 0.8)
-            try:
-                image_path_str, image_file_path = self._preload_queue.get_nowait()
-            except queue.Empty:
-                if hasattr(self, '_preload_started') and self._preload_started:
-                    logger.info("气象预警图片预加载完成")
-                    self._preload_started = False
-                return
-            if not hasattr(self, '_preload_started'):
-                self._preload_started = True
-                logger.info(f"开始异步预加载图片，目标高度: {target_height}px (窗口高度: {window_height}px)")
-            try:
-                cache_key = f"{image_path_str}_{target_height}"
-                with self._image_cache_lock:
-                    if cache_key in self._image_cache:
-                        QTimer.singleShot(0, self._load_images_from_queue)
-                        return
-                pixmap = QPixmap(image_file_path)
-                if pixmap.isNull():
-                    logger.error(f"预加载图片加载失败: {image_file_path}")
-                    QTimer.singleShot(0, self._load_images_from_queue)
-                    return
-                if pixmap.height() > target_height:
-                    ratio = target_height / pixmap.height()
-                    new_width = int(pixmap.width() * ratio)
-                    pixmap = pixmap.scaled(new_width, target_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                with self._image_cache_lock:
-                    self._image_cache[cache_key] = pixmap
-                QTimer.singleShot(10, self._load_images_from_queue)
-            except Exception as e:
-                logger.error(f"预加载图片失败 {image_file_path}: {e}")
-                QTimer.singleShot(0, self._load_images_from_queue)
-        except Exception as e:
-            logger.error(f"从队列加载图片时出错: {e}")
+    def _submit_preloads(self, image_paths: list, target_height: int):
+        """登记并提交预加载解码（主线程）：已在解码中的图片不重复提交"""
+        pool = self._get_loader_pool()
+        submitted = 0
+        for image_path in image_paths:
+            key = (image_cache_path(image_path), target_height)
+            if key in self._inflight:
+                continue
+            self._inflight[key] = _PRELOAD_TASK_ID
+            self._preload_keys.add(key)
+            pool.start(_LoadImageTask(self, image_path, target_height), _PRELOAD_PRIORITY)
+            submitted += 1
+        # 各图片由线程池并发解码为 QImage，主线程只需 QPixmap.fromImage 并写入缓存
+        logger.info(f"开始异步预加载 {submitted} 张气象预警图片，目标高度: {target_height}px")
 
     def is_scrolling(self) -> bool:
         """检查是否正在滚动（供 ScrollingText / ScrollingTextCPU 共用）"""
@@ -254,7 +532,7 @@ class _ScrollingTextMixin:
         try:
             if self.timer.isActive():
                 self.timer.stop()
-                logger.debug("定时器已暂停（无内容或不可见）")
+                logger.debug_fast("定时器已暂停（无内容或不可见）")
         except RuntimeError:
             pass
 
@@ -263,7 +541,7 @@ class _ScrollingTextMixin:
         try:
             if self.current_text and self.isVisible() and not self.timer.isActive():
                 self.timer.start(self._timer_interval)
-                logger.debug("定时器已恢复运行")
+                logger.debug_fast("定时器已恢复运行")
         except RuntimeError:
             pass
 
@@ -274,6 +552,11 @@ class _ScrollingTextMixin:
         if self.current_text:
             self._ensure_timer_running()
 
+    def resizeEvent(self, event):
+        """尺寸变化时更新绘制用的垂直中心（供 ScrollingTextCPU 使用，ScrollingText 在 resizeGL 中处理）"""
+        QWidget.resizeEvent(self, event)
+        self._center_y = self.height() / 2.0
+
     def hideEvent(self, event):
         """窗口隐藏/最小化时暂停定时器（供 ScrollingText / ScrollingTextCPU 共用）"""
         self._ensure_timer_stopped()
@@ -289,14 +572,18 @@ class _ScrollingTextMixin:
                 self._is_scrolling = False
             self._ensure_timer_stopped()
             return
-        current_time = time.time()
-        delta_time = current_time - self._last_scroll_time
-        self._last_scroll_time = current_time
-        if delta_time > 0.1:
-            delta_time = 0.1
+        # 单调时钟（纳秒整数），不受系统校时影响
+        now = time.monotonic_ns()
+        delta_time = min((now - self._last_scroll_time) * 1e-9, 0.1)
+        self._last_scroll_time = now
         pixels_per_second = self.config.gui_config.text_speed * 60.0
         move_distance = -pixels_per_second * delta_time
         self.x_position += move_distance
+        # 整数像素位置未变化时（低速/高帧率下的亚像素移动）不重绘，也无需检查是否滚出
+        new_px = int(self.x_position)
+        if new_px == self._last_paint_x:
+            return
+        self._last_paint_x = new_px
         total_width = 0
         if self.current_image:
             total_width += self._cached_image_width
@@ -333,66 +620,93 @@ class _ScrollingTextMixin:
         with self._loading_lock:
             return self._is_loading
 
+    # 颜色字符串 -> QColor 缓存：颜色取值在进程生命周期内基本固定，避免重复解析十六进制字符串
+    # 注意：返回的 QColor 为共享对象，调用方只读使用，不要就地修改
+    _COLOR_QOBJ_CACHE: Dict[str, QColor] = {}
+
+    @classmethod
+    def _qc(cls, color_str: str) -> QColor:
+        """获取缓存的 QColor（按大写颜色字符串去重）"""
+        key = color_str.upper()
+        color = cls._COLOR_QOBJ_CACHE.get(key)
+        if color is None:
+            color = cls._COLOR_QOBJ_CACHE.setdefault(key, QColor(color_str))
+        return color
+
+    def _get_msg_processor(self):
+        """懒加载 MessageProcessor（构造时会初始化翻译服务，只创建一次）"""
+        if self._msg_processor is None:
+            from utils.message_processor import MessageProcessor
+            self._msg_processor = MessageProcessor()
+        return self._msg_processor
+
+    def _weather_color(self, parsed_data: Optional[Dict[str, Any]]) -> QColor:
+        if parsed_data:
+            color_str = self._get_msg_processor().get_message_color('weather', parsed_data)
+            return self._get_validated_color(color_str, 'weather')
+        if self.current_color.isValid() and self.current_color.name().upper() != self.config.gui_config.bg_color.upper():
+            return self.current_color
+        return self._get_validated_color('#FFF500', 'weather')
+
+    def _report_color(self, parsed_data: Optional[Dict[str, Any]]) -> QColor:
+        return self._get_validated_color(self.config.message_config.report_color, 'report')
+
+    def _warning_color(self, parsed_data: Optional[Dict[str, Any]]) -> QColor:
+        return self._get_validated_color(self.config.message_config.warning_color, 'warning')
+
+    def _custom_text_color(self, parsed_data: Optional[Dict[str, Any]]) -> QColor:
+        color_str = getattr(self.config.message_config, 'custom_text_color', None) or '#01FF00'
+        return self._get_validated_color(color_str, 'custom_text')
+
+    _MESSAGE_COLOR_HANDLERS = {
+        'weather': _weather_color,
+        'report': _report_color,
+        'warning': _warning_color,
+        'custom_text': _custom_text_color,
+    }
+
     def _get_color_for_message_type(self, message_type: Optional[str], parsed_data: Optional[Dict[str, Any]] = None) -> QColor:
         """根据消息类型获取文本颜色（供 ScrollingText / ScrollingTextCPU 共用）"""
+        handler = self._MESSAGE_COLOR_HANDLERS.get(message_type)
         try:
-            if message_type == 'weather':
-                if parsed_data:
-                    from utils.message_processor import MessageProcessor
-                    processor = MessageProcessor()
-                    color_str = processor.get_message_color('weather', parsed_data)
-                    return self._get_validated_color(color_str, message_type)
-                if self.current_color.isValid() and self.current_color.name().upper() != self.config.gui_config.bg_color.upper():
-                    return self.current_color
-                return self._get_validated_color('#FFF500', message_type)
-            elif message_type == 'report':
-                return self._get_validated_color(self.config.message_config.report_color, message_type)
-            elif message_type == 'warning':
-                return self._get_validated_color(self.config.message_config.warning_color, message_type)
-            elif message_type == 'custom_text':
-                color_str = getattr(self.config.message_config, 'custom_text_color', None) or '#01FF00'
-                return self._get_validated_color(color_str, message_type)
-            else:
+            if handler is None:
                 return self._get_validated_color('#01FF00', message_type)
+            return handler(self, parsed_data)
         except Exception as e:
             logger.error(f"获取消息颜色失败: {e}", exc_info=True)
-            if message_type == 'weather':
-                if self.current_color.isValid() and self.current_color.name().upper() != self.config.gui_config.bg_color.upper():
-                    return self.current_color
-                return self._get_validated_color('#FFF500', message_type)
-            elif message_type == 'report':
-                return self._get_validated_color(self.config.message_config.report_color, message_type)
-            elif message_type == 'warning':
-                return self._get_validated_color(self.config.message_config.warning_color, message_type)
-            elif message_type == 'custom_text':
-                return self._get_validated_color(getattr(self.config.message_config, 'custom_text_color', None) or '#01FF00', message_type)
-            return self._get_validated_color('#01FF00', message_type)
+        # 回退：忽略解析数据（气象预警使用当前颜色或默认颜色）；回退仍失败时使用默认绿色
+        try:
+            if handler is not None:
+                return handler(self, None)
+        except Exception as e:
+            logger.error(f"获取消息默认颜色失败: {e}")
+        return self._qc('#01FF00')
 
     def _get_validated_color(self, color_str: str, message_type: Optional[str] = None) -> QColor:
         """验证并修正颜色（供 ScrollingText / ScrollingTextCPU 共用）"""
         try:
-            color = QColor(color_str)
+            color = self._qc(color_str)
             if not color.isValid():
-                color = QColor('#01FF00')
+                color = self._qc('#01FF00')
             bg_color_str = self.config.gui_config.bg_color
-            bg_color = QColor(bg_color_str)
+            bg_color = self._qc(bg_color_str)
             if color.rgb() == bg_color.rgb():
                 if message_type == 'report':
-                    color = QColor(self.config.message_config.report_color)
+                    color = self._qc(self.config.message_config.report_color)
                 elif message_type == 'warning':
-                    color = QColor(self.config.message_config.warning_color)
+                    color = self._qc(self.config.message_config.warning_color)
                 elif message_type == 'weather':
-                    color = QColor('#FFF500')
+                    color = self._qc('#FFF500')
                 elif message_type == 'custom_text':
-                    color = QColor(getattr(self.config.message_config, 'custom_text_color', None) or '#01FF00')
+                    color = self._qc(getattr(self.config.message_config, 'custom_text_color', None) or '#01FF00')
                 else:
-                    color = QColor('#01FF00')
+                    color = self._qc('#01FF00')
                 if color.rgb() == bg_color.rgb():
-                    color = QColor('#FFFFFF') if bg_color_str.upper() in ('BLACK', '#000000', 'BLACK') else QColor('#FFFF00')
+                    color = self._qc('#FFFFFF') if bg_color_str.upper() in ('BLACK', '#000000', 'BLACK') else self._qc('#FFFF00')
             return color
         except Exception as e:
             logger.error(f"验证颜色失败: {e}", exc_info=True)
-            return QColor('#FFFFFF')
+            return self._qc('#FFFFFF')
 
     def apply_config_changes(self):
         """应用配置变更（热修改），供 ScrollingText / ScrollingTextCPU 共用。OpenGL 仅在有 format/setFormat 时更新 VSync。"""
@@ -401,9 +715,12 @@ class _ScrollingTextMixin:
             new_text_speed = self.config.gui_config.text_speed
             logger.info(f"滚动速度已更新（配置热修改）: {new_text_speed:.1f}")
             new_font_size = self.config.gui_config.font_size
-            if self.font.pointSize() != new_font_size:
+            old_font_size = self.font.pointSize()
+            font_size_changed = (old_font_size != new_font_size)
+            if font_size_changed:
                 self.font.setPointSize(new_font_size)
-                logger.info(f"字体大小已更新: {self.font.pointSize()}pt -> {new_font_size}pt")
+                logger.info(f"字体大小已更新: {old_font_size}pt -> {new_font_size}pt")
+                self._load_pil_font()
                 with self._text_texture_cache_lock:
                     self._text_texture_cache.clear()
             # 仅 OpenGL 控件有 format/setFormat，ScrollingTextCPU 跳过
@@ -427,7 +744,11 @@ class _ScrollingTextMixin:
             except RuntimeError:
                 pass
             new_bg_color = self.config.gui_config.bg_color
-            self.setStyleSheet(f"background-color: {new_bg_color};")
+            bg_changed = (self._applied_bg_color != new_bg_color)
+            if bg_changed:
+                self._applied_bg_color = new_bg_color
+                self._bg_qcolor = self._qc(new_bg_color)
+                self.setStyleSheet(f"background-color: {new_bg_color};")
             if self.current_text and self.current_message_type:
                 old_color = self.current_color.name().upper()
                 if self.current_message_type == 'weather':
@@ -438,126 +759,121 @@ class _ScrollingTextMixin:
                 color_updated = (old_color != new_color_str)
                 if color_updated:
                     self.current_color = new_color_obj
-                self.current_text_image = None
-                self._cached_text_width = 0
-                with self._text_texture_cache_lock:
-                    self._text_texture_cache.clear()
-                if self.current_text:
+                # 仅字体/颜色/背景变化会使已渲染的文本纹理失效，速度/帧率/VSync 变化无需重新渲染
+                if font_size_changed or color_updated or bg_changed:
+                    self.current_text_image = None
+                    self._last_render_key = None
+                    self._static_text = None
+                    self._cached_text_width = 0
+                    with self._text_texture_cache_lock:
+                        self._text_texture_cache.clear()
                     try:
                         self.current_text_image = self._render_text_to_image(self.current_text, self.current_color)
                         if self.current_text_image:
                             self._cached_text_width = self.current_text_image.width()
-                        self.update()
+                        else:
+                            self._prepare_static_text(self.current_text)
                     except Exception as e:
                         logger.error(f"重新渲染文本时出错: {e}")
-                        self.update()
+                    self._rebuild_composite()
             logger.debug("滚动文本组件配置热修改应用完成")
         except Exception as e:
             logger.error(f"应用滚动文本组件配置热修改失败: {e}")
             import traceback
             logger.exception("详细错误信息:")
-        self._last_scroll_time = time.time()
+        self._last_scroll_time = time.monotonic_ns()
         self.update()
 
     def reset_position(self):
         """重置文本位置到右侧（供 ScrollingText / ScrollingTextCPU 共用）"""
         self.x_position = float(self.width() if self.width() > 1 else self.config.gui_config.window_width)
+        self._last_paint_x = None
+
+    @classmethod
+    def _get_loader_pool(cls) -> QThreadPool:
+        """获取共享的图片解码线程池（首次调用时在主线程创建）"""
+        if cls._loader_pool is None:
+            pool = QThreadPool()
+            pool.setMaxThreadCount(_IMAGE_LOADER_THREADS)
+            cls._loader_pool = pool
+        return cls._loader_pool
+
+    @classmethod
+    def _configure_pixmap_cache(cls):
+        """设置全局 QPixmapCache 容量（只设置一次，且不调小其他组件已设置的更大容量）"""
+        if cls._pixmap_cache_configured:
+            return
+        if QPixmapCache.cacheLimit() < _PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
+        cls._pixmap_cache_configured = True
 
     def _load_image_async(self, image_path: str, task_id: int):
-        """异步加载图片"""
+        """异步加载图片（在主线程调用，解码交给线程池中的 _LoadImageTask 完成）"""
         try:
-            logger.info(f"开始异步加载图片: {image_path}, task_id: {task_id}")
-            
-            img_path = Path(image_path)
-            if not img_path.exists():
-                logger.error(f"图片文件不存在: {image_path}")
-                self.set_loading(False)
+            target_height = self._image_target_height()
+            key = (image_cache_path(image_path), target_height)
+            if key in self._inflight:
+                # 同一图片已在解码中（包括预加载）：不重复提交，完成后按最新的 task_id 显示
+                self._inflight[key] = task_id
+                logger.debug("图片已在加载中，合并请求: %s, task_id: %s", image_path, task_id)
                 return
-            
-            # 检查缓存（使用绝对路径，确保与预加载时的格式一致）
-            img_path_resolved = str(img_path.resolve())
-            current_height = self.height()
-            cache_key = f"{img_path_resolved}_{current_height}"
-            
-            # 尝试多个可能的高度（因为窗口高度可能变化）
-            found_pixmap = None
-            found_key = None
-            with self._image_cache_lock:
-                # 先检查精确匹配
-                if cache_key in self._image_cache:
-                    found_pixmap = self._image_cache[cache_key]
-                    found_key = cache_key
-                else:
-                    # 尝试查找附近高度的缓存（±20px范围内）
-                    for offset in range(-20, 21, 5):  # 每5px检查一次
-                        test_height = current_height + offset
-                        if test_height > 0:
-                            test_key = f"{img_path_resolved}_{test_height}"
-                            if test_key in self._image_cache:
-                                found_pixmap = self._image_cache[test_key]
-                                found_key = test_key
-                                logger.debug(f"找到附近高度的缓存: {test_key} (当前高度: {current_height})")
-                                break
-            
-            if found_pixmap:
-                logger.info(f"从缓存中获取图片: {found_key}, task_id: {task_id}, current_task_id: {self._current_load_task_id}")
-                # 在主线程中更新显示（使用QTimer确保在主线程中执行）
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(0, lambda: self._update_image_display(found_pixmap, task_id))
-                return
-            
-            # 直接使用QPixmap加载图片（不转换格式）
-            pixmap = QPixmap(image_path)
-            if pixmap.isNull():
-                logger.error(f"图片加载失败: {image_path}")
+            logger.info("开始异步加载图片: %s, task_id: %s", image_path, task_id)
+            self._inflight[key] = task_id
+            self._get_loader_pool().start(_LoadImageTask(self, image_path, target_height))
+        except Exception as e:
+            logger.error(f"异步加载图片失败: {e}")
+            self.set_loading(False)
+
+    def _on_image_ready(self, image: QImage, image_path: str, img_path_resolved: str, target_height: int):
+        """图片解码完成（主线程，经 _image_ready 信号排队调用）：转换为 QPixmap、写入缓存并更新显示"""
+        key = (image_cache_path(image_path), target_height)
+        task_id = self._inflight.pop(key, _PRELOAD_TASK_ID)
+        if key in self._preload_keys:
+            self._preload_keys.discard(key)
+            if not self._preload_keys:
+                logger.info("气象预警图片预加载完成")
+        if task_id == _PRELOAD_TASK_ID:
+            if not image.isNull():
+                if not self._preload_results:
+                    QTimer.singleShot(0, self._flush_preload_results)
+                self._preload_results.append((image, image_path, img_path_resolved, target_height))
+            return
+        if image.isNull():
+            if task_id == self._current_load_task_id:
                 self.set_loading(False)
-                return
-            
-            logger.debug(f"图片加载成功: {pixmap.width()}x{pixmap.height()}")
-            
-            # 如果需要，调整大小
-            target_height = int(self.height() * 0.8)
-            if pixmap.height() > target_height:
-                ratio = target_height / pixmap.height()
-                new_width = int(pixmap.width() * ratio)
-                pixmap = pixmap.scaled(new_width, target_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logger.debug(f"图片已缩放: {pixmap.width()}x{pixmap.height()}")
-            
+            return
+        try:
+            pixmap = QPixmap.fromImage(image)
+            logger.debug("图片加载成功: %dx%d", pixmap.width(), pixmap.height())
             # 缓存图片（使用绝对路径，确保与预加载时的格式一致）
-            cache_key = f"{img_path_resolved}_{self.height()}"
-            with self._image_cache_lock:
-                self._image_cache[cache_key] = pixmap
-                logger.debug(f"图片已缓存: {cache_key}")
-                # 不限制预加载图片的缓存大小
-                # 只限制非预加载图片的缓存（通过检查缓存大小，但预加载的图片应该已经在缓存中了）
-                if len(self._image_cache) > 200:  # 增加缓存大小限制，因为现在有预加载的图片
-                    # 只删除非预加载的图片（如果缓存键不包含预加载的路径）
-                    # 这里简化处理，直接限制总缓存大小
-                    oldest_key = next(iter(self._image_cache))
-                    del self._image_cache[oldest_key]
-            
-            # 在主线程中更新显示（使用QTimer确保在主线程中执行）
-            from PyQt5.QtCore import QTimer
-            QTimer.singleShot(0, lambda: self._update_image_display(pixmap, task_id))
-            
+            self._cache_image(image_path, img_path_resolved, pixmap, target_height)
+            logger.debug("图片已缓存: %s", img_path_resolved)
         except Exception as e:
             logger.error(f"异步加载图片失败: {e}")
             self.set_loading(False)
-    
-    def _update_image_display(self, pixmap: QPixmap, task_id: int):
+            return
+        self._update_image_display(CachedPix.from_pixmap(pixmap), task_id)
+
+    def _flush_preload_results(self):
+        """将积累的预加载结果一次性写入缓存（主线程）；预加载图片不更新最近命中记录"""
+        results, self._preload_results = self._preload_results, []
+        for image, image_path, img_path_resolved, target_height in results:
+            paths = {image_cache_path(image_path), sys.intern(img_path_resolved)}
+            self._store_pixmap(paths, QPixmap.fromImage(image), target_height)
+
+    def _update_image_display(self, entry: CachedPix, task_id: int):
         """更新图片显示（在主线程中执行）"""
-        logger.debug(f"尝试更新图片显示: task_id={task_id}, current_task_id={self._current_load_task_id}")
+        logger.debug("尝试更新图片显示: task_id=%s, current_task_id=%s", task_id, self._current_load_task_id)
         if task_id != self._current_load_task_id:
-            logger.warning(f"任务已过期，忽略图片显示更新: task_id={task_id}, current_task_id={self._current_load_task_id}")
+            logger.warning("任务已过期，忽略图片显示更新: task_id=%s, current_task_id=%s", task_id, self._current_load_task_id)
             self.set_loading(False)
             return
         
         try:
-            self.current_image = pixmap
-            self._cached_image_width = pixmap.width() + 10
+            self._show_image(entry)
             self.set_loading(False)
             self.update()  # 触发重绘
-            logger.info(f"✓ 气象预警图片已显示，宽度: {pixmap.width()}px, 高度: {pixmap.height()}px")
+            logger.info("✓ 气象预警图片已显示，宽度: %dpx, 高度: %dpx", entry.width_pad - 10, entry.height)
         except Exception as e:
             logger.error(f"更新图片显示失败: {e}")
             self.set_loading(False)
@@ -577,7 +893,7 @@ class _ScrollingTextMixin:
         # 如果正在滚动且不是强制更新，则忽略
         with self._scrolling_lock:
             if self._is_scrolling and not force:
-                logger.debug(f"当前正在滚动，忽略新消息: {text[:50]}... (force={force})")
+                logger.debug("当前正在滚动，忽略新消息: %.50s... (force=%s)", text, force)
                 return False
         
         self.set_loading(True)
@@ -589,7 +905,7 @@ class _ScrollingTextMixin:
             # 从配置中获取颜色（确保使用最新配置）
             config_color = self._get_color_for_message_type(message_type, parsed_data)
             self.current_color = config_color
-            logger.info(f"update_text: 使用配置中的颜色 - 消息类型: {message_type}, 颜色: {config_color.name().upper()}")
+            logger.info("update_text: 使用配置中的颜色 - 消息类型: %s, 颜色: %s", message_type, config_color.name().upper())
         else:
             # 验证并设置颜色（确保颜色有效且不与背景颜色相同）
             self.current_color = self._get_validated_color(color, message_type)
@@ -598,18 +914,23 @@ class _ScrollingTextMixin:
         self.current_image_path = image_path
         
         # 调试日志
-        logger.info(f"更新文本: {text[:50]}..., 颜色: {color}, 图片路径: {image_path if image_path else '无'}, 窗口尺寸: {self.width()}x{self.height()}, 初始X位置: {self.width() if self.width() > 1 else self.config.gui_config.window_width}")
+        logger.info("更新文本: %.50s..., 颜色: %s, 图片路径: %s, 窗口尺寸: %dx%d, 初始X位置: %s",
+                    text, color, image_path or '无', self.width(), self.height(),
+                    self.width() if self.width() > 1 else self.config.gui_config.window_width)
         
         # 更新位置 - 从窗口右侧开始
         initial_x = float(self.width() if self.width() > 1 else self.config.gui_config.window_width)
         self.x_position = initial_x
-        self._last_scroll_time = time.time()
-        logger.info(f"文本初始位置设置为: {self.x_position}")
+        self._last_paint_x = None
+        self._last_scroll_time = time.monotonic_ns()
+        logger.info("文本初始位置设置为: %s", self.x_position)
         
         # 清除旧图片
         self.current_image = None
-        self.current_text_image = None
+        self._current_image_height = 0
         self._cached_image_width = 0
+        self._composite_pixmap = None
+        self._select_paint_routine()
         
         # 设置滚动状态
         with self._scrolling_lock:
@@ -619,27 +940,33 @@ class _ScrollingTextMixin:
         self._current_load_task_id += 1
         current_task_id = self._current_load_task_id
         
-        # 尝试预渲染文本为图片
-        # 注意：如果字体不支持某些字符（如繁体字），预渲染可能会失败或显示不正确
-        # 此时应该回退到直接绘制
-        text_image = self._render_text_to_image(text, self.current_color)
-        if text_image:
-            # 检查预渲染的图片是否有效（宽度应该大于0）
-            if text_image.width() > 0:
-                self.current_text_image = text_image
-                self._cached_text_width = text_image.width()
-                logger.debug(f"使用预渲染文本图片，宽度: {self._cached_text_width}")
-            else:
-                # 预渲染失败，清除并使用直接绘制
-                self.current_text_image = None
-                metrics = QFontMetrics(self.font)
-                self._cached_text_width = metrics.width(text)
-                logger.warning(f"预渲染文本图片失败，使用直接绘制，宽度: {self._cached_text_width}")
+        # 文本、颜色、字号均未变化（如重复显示加载提示）时直接复用当前文本图片
+        render_key = (text, self.current_color.name(), self.config.gui_config.font_size)
+        if render_key == self._last_render_key and self.current_text_image is not None:
+            logger.debug("文本未变化，复用已渲染的文本图片，宽度: %s", self._cached_text_width)
         else:
-            # 使用QFontMetrics测量文本宽度
-            metrics = QFontMetrics(self.font)
-            self._cached_text_width = metrics.width(text)
-            logger.debug(f"使用直接绘制文本，宽度: {self._cached_text_width}")
+            self.current_text_image = None
+            self._last_render_key = None
+            self._static_text = None
+            # 尝试预渲染文本为图片
+            # 注意：如果字体不支持某些字符（如繁体字），预渲染可能会失败或显示不正确
+            # 此时应该回退到直接绘制
+            text_image = self._render_text_to_image(text, self.current_color)
+            if text_image:
+                # 检查预渲染的图片是否有效（宽度应该大于0）
+                if text_image.width() > 0:
+                    self.current_text_image = text_image
+                    self._cached_text_width = text_image.width()
+                    self._last_render_key = render_key
+                    logger.debug("使用预渲染文本图片，宽度: %s", self._cached_text_width)
+                else:
+                    # 预渲染失败，清除并使用直接绘制
+                    self._prepare_static_text(text)
+                    logger.warning("预渲染文本图片失败，使用直接绘制，宽度: %s", self._cached_text_width)
+            else:
+                # 使用QFontMetrics测量文本宽度
+                self._prepare_static_text(text)
+                logger.debug("使用直接绘制文本，宽度: %s", self._cached_text_width)
         
         # 如果没有图片，取消加载状态
         if not image_path:
@@ -649,61 +976,24 @@ class _ScrollingTextMixin:
             # 直接检查缓存，避免文件系统操作导致的阻塞
             # 如果缓存中没有，异步加载会处理文件不存在的情况
             try:
-                img_path = Path(image_path)
-                # 尝试解析路径（使用try-except避免阻塞）
-                try:
-                    img_path_resolved = str(img_path.resolve())
-                except (OSError, PermissionError) as e:
-                    logger.debug(f"解析图片路径时出错（非阻塞）: {e}")
-                    img_path_resolved = str(image_path)  # 使用原始路径
-                
-                current_height = self.height()
-                cache_key = f"{img_path_resolved}_{current_height}"
-                
-                # 尝试多个可能的高度（因为窗口高度可能变化）
-                # 检查当前高度，以及附近的高度（±20px范围内）
-                found_pixmap = None
-                found_key = None
-                with self._image_cache_lock:
-                    # 先检查精确匹配
-                    if cache_key in self._image_cache:
-                        found_pixmap = self._image_cache[cache_key]
-                        found_key = cache_key
-                    else:
-                        # 尝试查找附近高度的缓存（±20px范围内）
-                        for offset in range(-20, 21, 5):  # 每5px检查一次
-                            test_height = current_height + offset
-                            if test_height > 0:
-                                test_key = f"{img_path_resolved}_{test_height}"
-                                if test_key in self._image_cache:
-                                    found_pixmap = self._image_cache[test_key]
-                                    found_key = test_key
-                                    logger.debug(f"找到附近高度的缓存: {test_key} (当前高度: {current_height})")
-                                    break
-                
-                if found_pixmap:
-                    logger.info(f"图片已在缓存中，立即显示: {found_key}")
-                    self.current_image = found_pixmap
-                    self._cached_image_width = found_pixmap.width() + 10
+                # 缓存键使用规范化后的路径（纯字符串操作），resolve() 由解码线程完成
+                cache_path = image_cache_path(image_path)
+                found = self._find_cached_image(cache_path)
+                if found:
+                    logger.info("图片已在缓存中，立即显示: %s", cache_path)
+                    self._show_image(found)
                     self.set_loading(False)
                     self._ensure_timer_running()
                     self.update()  # 触发重绘
-                    logger.info(f"✓ 气象预警图片已立即显示，宽度: {found_pixmap.width()}px, 高度: {found_pixmap.height()}px")
+                    logger.info("✓ 气象预警图片已立即显示，宽度: %dpx, 高度: %dpx", found.width_pad - 10, found.height)
                     return True
                 else:
-                    logger.info(f"图片不在缓存中，开始异步加载: {image_path}")
+                    logger.info("图片不在缓存中，开始异步加载: %s", image_path)
             except Exception as e:
                 logger.warning(f"检查图片缓存时出错: {e}")
             
             # 如果不在缓存中，异步加载图片（异步加载会处理文件不存在的情况）
-            logger.info(f"启动异步图片加载线程: {image_path}, task_id: {current_task_id}")
-            thread = threading.Thread(
-                target=self._load_image_async,
-                args=(image_path, current_task_id),
-                daemon=True,
-                name="ImageLoader"
-            )
-            thread.start()
+            self._load_image_async(image_path, current_task_id)
         
         self._ensure_timer_running()
         self.update()  # 触发重绘
@@ -720,13 +1010,15 @@ class ScrollingText(QOpenGLWidget, _ScrollingTextMixin):
         fmt.setRenderableType(QSurfaceFormat.OpenGL)
         fmt.setProfile(QSurfaceFormat.CompatibilityProfile)
         fmt.setVersion(2, 1)
-        fmt.setDepthBufferSize(24)
-        fmt.setStencilBufferSize(8)
+        # 仅用 QPainter 绘制二维位图与文本（无深度测试、无复杂裁剪路径），不申请深度/模板缓冲
+        fmt.setDepthBufferSize(0)
+        fmt.setStencilBufferSize(0)
         fmt.setSamples(0)
         fmt.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
         fmt.setOption(QSurfaceFormat.DeprecatedFunctions, False)
         super().__init__()
         self.setFormat(fmt)
+        self._gl_painter = QPainter()
         self._init_scrolling(config)
         logger.info(f"滚动组件使用 QOpenGLWidget 硬件加速（VSync: {'开启' if config.gui_config.vsync_enabled else '关闭'}）")
     
@@ -751,13 +1043,22 @@ class ScrollingText(QOpenGLWidget, _ScrollingTextMixin):
     
     def resizeGL(self, width: int, height: int):
         """OpenGL窗口大小改变时调用（QOpenGLWidget要求）"""
-        # OpenGL视口会自动更新，无需手动设置
-        pass
+        # OpenGL视口会自动更新，无需手动设置；仅更新绘制用的垂直中心
+        self._center_y = height / 2.0
     
     def paintGL(self):
         """OpenGL绘制方法（QOpenGLWidget要求，替代paintEvent）"""
-        painter = QPainter(self)
-        self._paint_content(painter)
+        # 复用同一个 QPainter 对象，每帧只 begin/end
+        painter = self._gl_painter
+        if not painter.begin(self):
+            return
+        try:
+            self._paint_content(painter)
+        except Exception as e:
+            logger.error(f"绘制失败: {e}")
+            logger.exception("详细错误信息:")
+        finally:
+            painter.end()
 
 
 class ScrollingTextCPU(_ScrollingTextMixin, QWidget):
@@ -774,5 +1075,12 @@ class ScrollingTextCPU(_ScrollingTextMixin, QWidget):
     def paintEvent(self, event):
         """软件绘制（QWidget）"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        self._paint_content(painter)
+        # 图片与文本位图均已按绘制尺寸预先缩放、按 1:1 绘制，只有设备像素比不为 1
+        # （位图会被再次缩放）时才需要双线性过滤
+        if self.devicePixelRatioF() != 1.0:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        try:
+            self._paint_content(painter)
+        except Exception as e:
+            logger.error(f"绘制失败: {e}")
+            logger.exception("详细错误信息:")
@@ -9,23 +9,27 @@
 from PyQt5.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QTabWidget, QLabel, QPushButton, QCheckBox, QSlider, QSpinBox, QDoubleSpinBox,
-    QLineEdit, QScrollArea, QMessageBox, QFrame, QColorDialog,
-    QRadioButton, QButtonGroup, QPlainTextEdit, QComboBox
+    QLineEdit, QScrollArea, QMessageBox, QFrame, QColorDialog, QFormLayout, QLayout,
+    QRadioButton, QButtonGroup, QPlainTextEdit, QComboBox, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QUrl
-from PyQt5.QtGui import QFont, QDesktopServices, QColor
-from typing import Optional, Dict, Any
+from PyQt5.QtCore import Qt, pyqtSignal, QUrl, QTimer, QSignalBlocker, QRunnable, QThreadPool, QMetaObject
+from PyQt5.QtGui import QFont, QDesktopServices, QColor, QStandardItemModel, QStandardItem, QPainter, QPen
+from typing import Optional, Dict, Any, Callable
 from pathlib import Path
-import re
+from functools import partial
+from dataclasses import dataclass
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import Config, APP_VERSION
+from config import (
+    Config, APP_VERSION, FANSTUDIO_ALL_URL, FANSTUDIO_BASE_DOMAIN,
+    FANSTUDIO_WARNING_URLS, FANSTUDIO_REPORT_URLS, FANSTUDIO_WEATHER_URL, is_fanstudio_url,
+)
 from utils.logger import get_logger
 from utils.resource_path import get_resource_path, get_executable_path
-from .color_manager import Color48Picker
+from utils.message_processor import split_weather_headline
 
 logger = get_logger()
 
@@ -34,18 +38,24 @@ MARGIN_TAB = 16
 SPACING_TAB = 16
 SPACING_BLOCK = 20
 
-# 共用 QSS（区块标题、正文标签、输入控件、保存按钮）
-STYLE_SECTION_TITLE = "font-weight: bold; font-size: 13pt; color: #333333; margin-bottom: 4px;"
-STYLE_LABEL = "font-size: 13px; color: #555555;"
-STYLE_HINT = "font-size: 12px; color: #888888;"
-STYLE_SLIDER = """
-    QSlider::groove:horizontal {
+# 共用 QSS（窗口背景、区块标题、正文标签、输入控件、保存按钮）
+# 在设置窗口上统一设置一次，控件通过 role 属性 / objectName 匹配，避免逐个控件解析样式表
+STYLE_SETTINGS_WINDOW = """
+    * { background-color: white; }
+    QLabel[role="section"] { font-weight: bold; font-size: 13pt; color: #333333; margin-bottom: 4px; }
+    QLabel[role="label"], QRadioButton[role="label"], QCheckBox[role="label"] { font-size: 13px; color: #555555; }
+    QLabel[role="hint"] { font-size: 12px; color: #888888; }
+    QLabel[role="sliderValue"] { font-size: 13px; color: #333333; }
+    QLabel[role="colorValue"] { font-size: 13px; color: #333333; font-family: monospace; }
+    QPushButton[role="colorButton"] { font-size: 13px; padding: 4px 10px; }
+    QPushButton[role="colorReset"] { font-size: 12px; padding: 4px 10px; }
+    QSlider#settingsSlider::groove:horizontal {
         border: 1px solid #CCCCCC;
         height: 6px;
         background: #E0E0E0;
         border-radius: 3px;
     }
-    QSlider::handle:horizontal {
+    QSlider#settingsSlider::handle:horizontal {
         background: #4A90E2;
         border: 1px solid #4A90E2;
         width: 16px;
@@ -53,29 +63,23 @@ STYLE_SLIDER = """
         margin: -5px 0;
         border-radius: 8px;
     }
-    QSlider::handle:horizontal:hover { background: #357ABD; }
-"""
-STYLE_SPINBOX = """
-    QSpinBox, QDoubleSpinBox {
+    QSlider#settingsSlider::handle:horizontal:hover { background: #357ABD; }
+    QSpinBox#settingsSpinBox, QDoubleSpinBox#settingsSpinBox {
         padding: 6px;
         border: 1px solid #CCCCCC;
         border-radius: 4px;
         font-size: 13px;
     }
-    QSpinBox:focus, QDoubleSpinBox:focus { border: 1px solid #4A90E2; }
-"""
-STYLE_COMBOBOX = """
-    QComboBox {
+    QSpinBox#settingsSpinBox:focus, QDoubleSpinBox#settingsSpinBox:focus { border: 1px solid #4A90E2; }
+    QComboBox#settingsComboBox {
         padding: 6px;
         border: 1px solid #CCCCCC;
         border-radius: 4px;
         font-size: 13px;
         min-height: 20px;
     }
-    QComboBox:focus { border: 1px solid #4A90E2; }
-"""
-STYLE_SAVE_BTN = """
-    QPushButton {
+    QComboBox#settingsComboBox:focus { border: 1px solid #4A90E2; }
+    QPushButton#saveButton {
         background-color: #4CAF50;
         color: white;
         border: none;
@@ -84,14 +88,173 @@ STYLE_SAVE_BTN = """
         font-weight: bold;
         padding: 8px 20px;
     }
-    QPushButton:hover { background-color: #45a049; }
-    QPushButton:pressed { background-color: #3d8b40; }
+    QPushButton#saveButton:hover { background-color: #45a049; }
+    QPushButton#saveButton:pressed { background-color: #3d8b40; }
+    QPushButton#selectAllButton {
+        background-color: #4A90E2;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 8px 20px;
+    }
+    QPushButton#selectAllButton:hover { background-color: #357ABD; }
+    QPushButton#selectAllButton:pressed { background-color: #2E5F8F; }
+    QLineEdit#apiEntry {
+        padding: 8px;
+        border: 1px solid #CCCCCC;
+        border-radius: 4px;
+        font-size: 13px;
+    }
+    QLineEdit#apiEntry:focus { border: 1px solid #4A90E2; }
+    QWidget#translationHintFrame, QWidget#translationHintFrame QWidget {
+        background-color: #FFF9E6;
+        border: 1px solid #FFE082;
+        border-radius: 4px;
+        padding: 10px;
+    }
+    QCheckBox[role="translationOption"] { font-size: 14px; padding: 5px; }
+    QLabel[role="translationInfo"] { color: #666666; font-size: 12px; padding-left: 25px; line-height: 1.5; }
+    QCheckBox#logCheckBox { font-size: 14px; padding: 5px; }
+    QCheckBox#logCheckBox::indicator { width: 18px; height: 18px; }
+    QLabel[role="logDesc"] { color: #888; font-size: 12px; padding-left: 30px; padding-bottom: 10px; }
+    QSpinBox#logSpinBox {
+        font-size: 14px;
+        padding: 5px;
+        border: 1px solid #ccc;
+        border-radius: 3px;
+    }
+    QFrame[role="aboutSeparator"] { background-color: #E0E0E0; max-height: 1px; }
+    QLabel[role="aboutBody"] { color: #555555; font-size: 13px; padding-left: 10px; padding-bottom: 2px; }
+    QLabel[role="thanksText"] { color: #555555; font-size: 13px; line-height: 1.4; }
 """
 
 
+# 「Fan Studio预警 / 速报」复选框的键（代表一组单项数据源，本身不是 URL）
+_FANSTUDIO_GROUP_KEYS = frozenset(("fanstudio_warning", "fanstudio_report"))
+
+
+def _format_tenths(value: int) -> str:
+    """滑块值（以 0.1 为单位）显示为一位小数"""
+    return f"{value / 10.0:.1f}"
+
+
+def _format_px(value: int) -> str:
+    """滑块值显示为像素"""
+    return f"{value}px"
+
+
+# 时区下拉框共用的数据模型（首次打开设置窗口时创建，之后各实例直接复用）
+_TZ_MODEL: Optional[QStandardItemModel] = None
+
+
+def _get_tz_model() -> QStandardItemModel:
+    """获取时区下拉框模型：显示文本 + IANA ID（存于 Qt.UserRole，供 findData/currentData 使用）"""
+    global _TZ_MODEL
+    if _TZ_MODEL is None:
+        from utils.timezone_names_zh import get_tz_options
+        model = QStandardItemModel()
+        for display, iana_id in get_tz_options():
+            item = QStandardItem(display)
+            item.setData(iana_id, Qt.UserRole)
+            model.appendRow(item)
+        _TZ_MODEL = model
+    return _TZ_MODEL
+
+
+class _ColorSwatch(QWidget):
+    """颜色预览块：直接绘制纯色圆角矩形，修改颜色只需重绘，不必重新设置并解析样式表"""
+
+    def __init__(self, color: str, parent=None):
+        super().__init__(parent)
+        self._color = QColor(color)
+
+    def set_color(self, color: str):
+        self._color = QColor(color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(Qt.black, 1))
+        painter.setBrush(self._color)
+        painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 3, 3)
+        painter.end()
+
+
+@dataclass
+class _DisplayVars:
+    """「外观与显示」页中需要保存的控件引用"""
+    __slots__ = ('speed', 'font_size', 'width', 'height', 'opacity',
+                 'vsync_enabled', 'target_fps', 'timezone')
+    speed: QSlider
+    font_size: QSlider
+    width: QSpinBox
+    height: QSpinBox
+    opacity: QSlider
+    vsync_enabled: QCheckBox
+    target_fps: QSpinBox
+    timezone: QComboBox
+
+
+class _RestartBatchTask(QRunnable):
+    """重启批处理任务（在 QThreadPool 工作线程中执行）
+
+    写入临时批处理并以分离方式启动，成功后以排队调用让主线程退出程序；
+    失败时通过窗口的 _restart_batch_failed 信号交回主线程，改用延迟 Popen。
+    """
+
+    def __init__(self, window, exe_path: str, args):
+        super().__init__()
+        self.window = window
+        self.exe_path = exe_path
+        self.args = args
+
+    def run(self):
+        import subprocess
+        import tempfile
+        try:
+            fd, bat_path = tempfile.mkstemp(suffix=".bat", prefix="restart_")
+            os.close(fd)
+            # Windows 下 cmd 按系统 ANSI(如 GBK) 解析 .bat，用 gbk 写入以便中文路径正确
+            bat_encoding = "gbk" if os.name == "nt" else "utf-8"
+            exe_dir = os.path.dirname(self.exe_path)
+            with open(bat_path, "w", encoding=bat_encoding) as f:
+                f.write("@echo off\n")
+                f.write("ping 127.0.0.1 -n 3 > nul\n")  # 约 2 秒延迟
+                # 先切换到 exe 所在目录再启动，便于 onedir 下新进程正确找到同目录的 python313.dll 等
+                f.write(f'cd /d "{exe_dir}"\n')
+                arg_str = " ".join(f'"{a}"' for a in self.args)
+                f.write(f'start "" "{self.exe_path}" {arg_str}\n')
+                f.write("del \"%~f0\"\n")  # 批处理删除自身
+            # 分离方式启动批处理，当前进程退出后批处理仍会执行
+            subprocess.Popen(
+                ["cmd", "/c", bat_path],
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0,
+            )
+        except Exception as e:
+            self.window._restart_batch_failed.emit(str(e))
+            return
+        QMetaObject.invokeMethod(QApplication.instance(), "quit", Qt.QueuedConnection)
+
+
 class SettingsWindow(QDialog):
     """设置窗口"""
     
+    # 重启批处理在工作线程中写入失败时发出（携带错误信息），由主线程改用延迟启动
+    _restart_batch_failed = pyqtSignal(str)
+    
+    # 「数据源」标签页的位置（标签页顺序见 _setup_ui）
+    DATA_SOURCE_TAB_INDEX = 1
+    SAVE_DEBOUNCE_MS = 300  # 配置写盘合并窗口（毫秒）
+    # 颜色类型 -> (保存当前值的属性名, 默认颜色)
+    COLOR_TYPES = {
+        'report': ('current_report_color', '#00FFFF'),  # 默认青色
+        'warning': ('current_warning_color', '#FF0000'),  # 默认红色
+        'custom_text': ('current_custom_text_color', '#01FF00'),  # 默认绿色
+    }
+    
     def __init__(self, parent=None):
         """
         初始化设置窗口
@@ -108,21 +271,48 @@ class SettingsWindow(QDialog):
         
         # 数据源分类定义
         self.source_vars = {}
-        self.individual_source_urls = []  # 存储所有单项数据源的URL
-        self.fanstudio_source_urls = []  # 存储所有Fan Studio单项数据源的URL（不包括All源）
+        self._source_items = ()  # 批量勾选时遍历的 (URL, 复选框)，数据源页创建完成后生成
+        self.individual_source_urls = set()  # 所有单项数据源的URL（数据源页创建完成后冻结）
+        self.fanstudio_source_urls = set()  # 所有Fan Studio单项数据源的URL（不包括All源）
         self._updating_mutual_exclusion = False  # 防止回调循环的标志
+        self._wolfx_individual_checked_count = 0  # 已勾选的 Wolfx 单项预警 (WSS) 数量
         self._is_all_selected = False  # 标记当前是否处于全选状态
+        self.select_all_btn = None  # 数据源页的「全选」按钮，创建数据源页时赋值
+        self._screen_geom = None  # 缓存的屏幕尺寸，见 _screen_geometry
+        self._screen_signals_connected = False
+        self._last_adjust_key = None  # 上次调整后的 (窗口几何, 父窗口几何)
+        self._color_picker = None  # 首次修改颜色时才创建，之后复用
+        self._color_picker_type = None  # 当前颜色选择器对应的颜色类型
+        self._color_widgets = {}  # 颜色类型 -> (预览色块, 色值标签)，创建外观页时填充
+        self._confirm_box = None  # 「确认 / 取消」提示框，首次使用时创建，之后复用（见 _confirm）
+        self._confirm_accept_btn = None
+        # 配置写盘合并：短时间内多次保存只写一次文件（重启或退出前立即写入）
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.config.save_config)
+        QApplication.instance().aboutToQuit.connect(self._flush_pending_save)
+        self._restart_batch_failed.connect(self._restart_with_delayed_start)
         # 初始化基础URL（必须在初始化列表之后调用，因为创建标签页时会使用这些列表）
         self._update_base_urls()
         
         # 设置UI（只在初始化时调用一次）
         self._setup_ui()
     
+    def _schedule_save(self):
+        """安排将配置写入文件（SAVE_DEBOUNCE_MS 内的多次保存合并为一次写入）"""
+        self._save_timer.start()
+    
+    def _flush_pending_save(self):
+        """若有尚未写入的配置，立即写入文件（重启、退出前调用）"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.config.save_config()
+    
     def _update_base_urls(self):
         """更新基础URL（固定使用fanstudio.tech）"""
-        base_domain = "fanstudio.tech"
-        self.all_source_url = f"wss://ws.{base_domain}/all"
-        self.base_domain = base_domain
+        self.all_source_url = FANSTUDIO_ALL_URL
+        self.base_domain = FANSTUDIO_BASE_DOMAIN
     
     def _setup_ui(self):
         """设置UI（只在初始化时调用一次）"""
@@ -130,8 +320,7 @@ class SettingsWindow(QDialog):
         self.setWindowTitle("设置")
         
         # 获取屏幕尺寸，确保窗口不超出屏幕
-        from PyQt5.QtWidgets import QApplication
-        screen = QApplication.desktop().screenGeometry()
+        screen = self._screen_geometry()
         max_width = min(520, screen.width() - 40)  # 初始宽度 520，留出边距
         max_height = min(550, screen.height() - 100)  # 高度 550，留出边距（含任务栏）
         
@@ -142,8 +331,8 @@ class SettingsWindow(QDialog):
         # 使用非模态窗口，避免阻塞主界面事件循环
         self.setModal(False)
         
-        # 设置窗口背景为白色
-        self.setStyleSheet("background-color: white;")
+        # 设置窗口背景为白色，并统一提供各控件共用的样式
+        self.setStyleSheet(STYLE_SETTINGS_WINDOW)
         
         # 创建主布局
         main_layout = QVBoxLayout(self)
@@ -155,17 +344,40 @@ class SettingsWindow(QDialog):
         main_layout.addWidget(self.notebook)
         
         # 标签页顺序：外观与显示、数据源、翻译、日志、关于
-        self._create_appearance_tab()
-        self._create_data_source_tab()
-        self._create_translation_tab()
-        self._create_log_tab()
-        self._create_about_tab()
+        # 先放入空白占位页，首次切换到某页时才创建其内容（未访问的页不创建控件）
+        self._tab_builders: Dict[int, Callable[[], QWidget]] = {}
+        for title, builder in (
+            ("外观与显示", self._create_appearance_tab),
+            ("数据源", self._create_data_source_tab),
+            ("翻译", self._create_translation_tab),
+            ("日志", self._create_log_tab),
+            ("关于", self._create_about_tab),
+        ):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[self.notebook.addTab(placeholder, title)] = builder
+        self.notebook.currentChanged.connect(self._build_tab)
+        self._build_tab(self.notebook.currentIndex())
         
         # 创建底部按钮区域
         self._create_bottom_buttons(main_layout)
-        
-        # 居中显示
-        self._center_window()
+        # 居中显示由 showEvent 完成（显示时窗口尺寸才最终确定）
+    
+    def _build_tab(self, index: int):
+        """创建指定标签页的内容（每页只创建一次），放入该页的占位控件中"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        if not self._tab_builders:
+            # 所有页都已创建，之后切换标签页无需再进入本方法
+            self.notebook.currentChanged.disconnect(self._build_tab)
+        # 创建期间暂停标签页区域的重绘，内容全部放入后只布局、绘制一次
+        self.notebook.setUpdatesEnabled(False)
+        try:
+            self.notebook.widget(index).layout().addWidget(builder())
+        finally:
+            self.notebook.setUpdatesEnabled(True)
     
     def showEvent(self, event):
         """窗口显示时的事件处理，确保窗口不超出屏幕"""
@@ -173,10 +385,37 @@ class SettingsWindow(QDialog):
         # 在显示后再次调整窗口位置和大小，确保不超出屏幕
         self._adjust_window_to_screen()
     
+    @staticmethod
+    def _update_slider_label(label: QLabel, formatter: Callable[[int], str], value: int):
+        """滑块数值标签的共用槽：显示文本确有变化时才 setText，拖动中相同的显示值不重复刷新"""
+        text = formatter(value)
+        if label.text() != text:
+            label.setText(text)
+    
+    def _screen_geometry(self):
+        """屏幕尺寸（首次查询后缓存，屏幕增减或主屏切换时失效）"""
+        if self._screen_geom is None:
+            app = QApplication.instance()
+            if not self._screen_signals_connected:
+                app.screenAdded.connect(self._invalidate_screen_geometry)
+                app.screenRemoved.connect(self._invalidate_screen_geometry)
+                app.primaryScreenChanged.connect(self._invalidate_screen_geometry)
+                self._screen_signals_connected = True
+            self._screen_geom = QApplication.desktop().screenGeometry()
+        return self._screen_geom
+    
+    def _invalidate_screen_geometry(self, *_):
+        """屏幕配置变化时清除缓存的屏幕尺寸"""
+        self._screen_geom = None
+    
     def _adjust_window_to_screen(self):
         """调整窗口大小和位置，确保不超出屏幕"""
-        from PyQt5.QtWidgets import QApplication
-        screen = QApplication.desktop().screenGeometry()
+        # 窗口位置/尺寸与父窗口位置均未变化（上次调整后未被移动）时无需重新计算
+        parent = self.parent()
+        adjust_key = (self.geometry().getRect(), parent.geometry().getRect() if parent else None)
+        if adjust_key == self._last_adjust_key:
+            return
+        screen = self._screen_geometry()
         
         # 获取当前窗口尺寸
         window_width = self.width()
@@ -195,8 +434,8 @@ class SettingsWindow(QDialog):
             self.resize(window_width, window_height)
         
         # 计算理想位置（居中或相对于父窗口）
-        if self.parent():
-            parent_geometry = self.parent().geometry()
+        if parent:
+            parent_geometry = parent.geometry()
             x = parent_geometry.x() + (parent_geometry.width() - window_width) // 2
             y = parent_geometry.y() + (parent_geometry.height() - window_height) // 2
         else:
@@ -219,6 +458,7 @@ class SettingsWindow(QDialog):
             y = screen.height() - window_height - 10
         
         self.move(x, y)
+        self._last_adjust_key = (self.geometry().getRect(), parent.geometry().getRect() if parent else None)
     
     def _center_window(self):
         """窗口居中显示，确保不超出屏幕"""
@@ -233,6 +473,8 @@ class SettingsWindow(QDialog):
         main_layout = QVBoxLayout(scrollable_widget)
         main_layout.setContentsMargins(MARGIN_TAB, MARGIN_TAB, MARGIN_TAB, MARGIN_TAB)
         main_layout.setSpacing(SPACING_TAB)
+        # 内容尺寸由布局的最小/最大尺寸一次确定，减少显示时的反复重新布局
+        main_layout.setSizeConstraint(QLayout.SetMinAndMaxSize)
         
         # ---------- 1. 基本显示 ----------
         block1 = QWidget()
@@ -240,70 +482,71 @@ class SettingsWindow(QDialog):
         block1_layout.setContentsMargins(0, 0, 0, 0)
         block1_layout.setSpacing(12)
         sec1 = QLabel("基本显示")
-        sec1.setStyleSheet(STYLE_SECTION_TITLE)
+        sec1.setProperty("role", "section")
         block1_layout.addWidget(sec1)
         
+        # 滚动速度、字体大小：标签 + (滑块, 数值) 的表单行，由 QFormLayout 统一对齐标签列
+        slider_form = QFormLayout()
+        slider_form.setContentsMargins(0, 0, 0, 0)
+        slider_form.setHorizontalSpacing(10)
+        slider_form.setVerticalSpacing(12)
+        
         # 滚动速度
-        speed_row = QWidget()
-        speed_row_layout = QHBoxLayout(speed_row)
-        speed_row_layout.setContentsMargins(0, 0, 0, 0)
-        speed_row_layout.setSpacing(10)
         speed_label = QLabel("滚动速度:")
-        speed_label.setStyleSheet(STYLE_LABEL)
+        speed_label.setProperty("role", "label")
         speed_slider = QSlider(Qt.Horizontal)
         speed_slider.setMinimum(1)
         speed_slider.setMaximum(200)
         speed_slider.setValue(int(self.config.gui_config.text_speed * 10))
-        speed_slider.setStyleSheet(STYLE_SLIDER)
+        speed_slider.setObjectName("settingsSlider")
         speed_label_value = QLabel(f"{self.config.gui_config.text_speed:.1f}")
-        speed_label_value.setStyleSheet("font-size: 13px; color: #333333; min-width: 40px;")
-        speed_slider.valueChanged.connect(lambda v: speed_label_value.setText(f"{v / 10.0:.1f}"))
-        speed_row_layout.addWidget(speed_label)
-        speed_row_layout.addWidget(speed_slider)
-        speed_row_layout.addWidget(speed_label_value)
-        block1_layout.addWidget(speed_row)
+        speed_label_value.setProperty("role", "sliderValue")
+        speed_label_value.setMinimumWidth(40)
+        speed_slider.valueChanged.connect(partial(self._update_slider_label, speed_label_value, _format_tenths))
+        speed_field = QHBoxLayout()
+        speed_field.setSpacing(10)
+        speed_field.addWidget(speed_slider)
+        speed_field.addWidget(speed_label_value)
+        slider_form.addRow(speed_label, speed_field)
         
         # 字体大小
-        font_row = QWidget()
-        font_row_layout = QHBoxLayout(font_row)
-        font_row_layout.setContentsMargins(0, 0, 0, 0)
-        font_row_layout.setSpacing(10)
         font_label = QLabel("字体大小:")
-        font_label.setStyleSheet(STYLE_LABEL)
+        font_label.setProperty("role", "label")
         font_slider = QSlider(Qt.Horizontal)
         font_slider.setMinimum(10)
         font_slider.setMaximum(100)
         font_slider.setValue(self.config.gui_config.font_size)
-        font_slider.setStyleSheet(STYLE_SLIDER)
+        font_slider.setObjectName("settingsSlider")
         font_label_value = QLabel(f"{self.config.gui_config.font_size}px")
-        font_label_value.setStyleSheet("font-size: 13px; color: #333333; min-width: 50px;")
-        font_slider.valueChanged.connect(lambda v: font_label_value.setText(f"{v}px"))
-        font_row_layout.addWidget(font_label)
-        font_row_layout.addWidget(font_slider)
-        font_row_layout.addWidget(font_label_value)
-        block1_layout.addWidget(font_row)
+        font_label_value.setProperty("role", "sliderValue")
+        font_label_value.setMinimumWidth(50)
+        font_slider.valueChanged.connect(partial(self._update_slider_label, font_label_value, _format_px))
+        font_field = QHBoxLayout()
+        font_field.setSpacing(10)
+        font_field.addWidget(font_slider)
+        font_field.addWidget(font_label_value)
+        slider_form.addRow(font_label, font_field)
+        block1_layout.addLayout(slider_form)
         
         # 显示时区
-        from utils.timezone_names_zh import get_tz_options, iana_to_display
-        timezone_options = get_tz_options()
+        from utils.timezone_names_zh import iana_to_display
         timezone_label = QLabel("显示时区:")
-        timezone_label.setStyleSheet(STYLE_LABEL)
+        timezone_label.setProperty("role", "label")
         block1_layout.addWidget(timezone_label)
         timezone_combo = QComboBox()
         timezone_combo.setEditable(False)
-        for display, iana_id in timezone_options:
-            timezone_combo.addItem(display, iana_id)
-        current_tz = getattr(self.config.gui_config, 'timezone', 'Asia/Shanghai')
+        timezone_combo.setModel(_get_tz_model())
+        current_tz = self.config.gui_config.timezone
         idx = timezone_combo.findData(current_tz)
         if idx < 0:
             idx = timezone_combo.findText(iana_to_display(current_tz))
         if idx < 0:
             idx = timezone_combo.findText("UTC+8 北京")
         timezone_combo.setCurrentIndex(max(0, idx))
-        timezone_combo.setStyleSheet(STYLE_COMBOBOX)
+        timezone_combo.setObjectName("settingsComboBox")
         block1_layout.addWidget(timezone_combo)
         timezone_hint = QLabel("修改时区后需重启软件生效。")
-        timezone_hint.setStyleSheet(STYLE_HINT)
+        timezone_hint.setProperty("role", "hint")
         block1_layout.addWidget(timezone_hint)
         main_layout.addWidget(block1)
         main_layout.addSpacing(SPACING_BLOCK)
@@ -314,24 +557,24 @@ class SettingsWindow(QDialog):
         block2_layout.setContentsMargins(0, 0, 0, 0)
         block2_layout.setSpacing(12)
         sec2 = QLabel("窗口")
-        sec2.setStyleSheet(STYLE_SECTION_TITLE)
+        sec2.setProperty("role", "section")
         block2_layout.addWidget(sec2)
         size_row = QHBoxLayout()
         size_row.setSpacing(15)
         width_label = QLabel("窗口宽度:")
-        width_label.setStyleSheet(STYLE_LABEL)
+        width_label.setProperty("role", "label")
         width_spin = QSpinBox()
         width_spin.setMinimum(200)
         width_spin.setMaximum(3000)
         width_spin.setValue(self.config.gui_config.window_width)
-        width_spin.setStyleSheet(STYLE_SPINBOX)
+        width_spin.setObjectName("settingsSpinBox")
         height_label = QLabel("窗口高度:")
-        height_label.setStyleSheet(STYLE_LABEL)
+        height_label.setProperty("role", "label")
         height_spin = QSpinBox()
         height_spin.setMinimum(50)
         height_spin.setMaximum(500)
         height_spin.setValue(self.config.gui_config.window_height)
-        height_spin.setStyleSheet(STYLE_SPINBOX)
+        height_spin.setObjectName("settingsSpinBox")
         size_row.addWidget(width_label)
         size_row.addWidget(width_spin)
         size_row.addWidget(height_label)
@@ -339,22 +582,21 @@ class SettingsWindow(QDialog):
         size_row.addStretch()
         block2_layout.addLayout(size_row)
         opacity_label = QLabel("窗口透明度:")
-        opacity_label.setStyleSheet(STYLE_LABEL)
+        opacity_label.setProperty("role", "label")
         block2_layout.addWidget(opacity_label)
-        opacity_row = QWidget()
-        opacity_row_layout = QHBoxLayout(opacity_row)
-        opacity_row_layout.setContentsMargins(0, 0, 0, 0)
+        opacity_row_layout = QHBoxLayout()
         opacity_slider = QSlider(Qt.Horizontal)
         opacity_slider.setMinimum(1)
         opacity_slider.setMaximum(10)
         opacity_slider.setValue(int(self.config.gui_config.opacity * 10))
-        opacity_slider.setStyleSheet(STYLE_SLIDER)
+        opacity_slider.setObjectName("settingsSlider")
         opacity_label_value = QLabel(f"{self.config.gui_config.opacity:.1f}")
-        opacity_label_value.setStyleSheet("font-size: 13px; color: #333333; min-width: 40px;")
-        opacity_slider.valueChanged.connect(lambda v: opacity_label_value.setText(f"{v / 10.0:.1f}"))
+        opacity_label_value.setProperty("role", "sliderValue")
+        opacity_label_value.setMinimumWidth(40)
+        opacity_slider.valueChanged.connect(partial(self._update_slider_label, opacity_label_value, _format_tenths))
         opacity_row_layout.addWidget(opacity_slider)
         opacity_row_layout.addWidget(opacity_label_value)
-        block2_layout.addWidget(opacity_row)
+        block2_layout.addLayout(opacity_row_layout)
         main_layout.addWidget(block2)
         main_layout.addSpacing(SPACING_BLOCK)
         
@@ -364,13 +606,13 @@ class SettingsWindow(QDialog):
         block3_layout.setContentsMargins(0, 0, 0, 0)
         block3_layout.setSpacing(12)
         sec3 = QLabel("性能与渲染")
-        sec3.setStyleSheet(STYLE_SECTION_TITLE)
+        sec3.setProperty("role", "section")
         block3_layout.addWidget(sec3)
         render_row = QHBoxLayout()
         cpu_radio = QRadioButton("CPU 渲染（软件）")
         gpu_radio = QRadioButton("GPU 渲染（OpenGL）")
-        cpu_radio.setStyleSheet(STYLE_LABEL)
-        gpu_radio.setStyleSheet(STYLE_LABEL)
+        cpu_radio.setProperty("role", "label")
+        gpu_radio.setProperty("role", "label")
         if self.config.gui_config.use_gpu_rendering:
             gpu_radio.setChecked(True)
         else:
@@ -381,33 +623,29 @@ class SettingsWindow(QDialog):
         render_row.addWidget(gpu_radio)
         render_row.addStretch()
         block3_layout.addLayout(render_row)
-        perf_row = QWidget()
-        perf_row_layout = QHBoxLayout(perf_row)
-        perf_row_layout.setContentsMargins(0, 0, 0, 0)
+        perf_row_layout = QHBoxLayout()
         perf_row_layout.setSpacing(16)  # VSync 与目标帧率组之间的间距
         vsync_checkbox = QCheckBox("启用垂直同步")
         vsync_checkbox.setChecked(self.config.gui_config.vsync_enabled)
-        vsync_checkbox.setStyleSheet(STYLE_LABEL)
+        vsync_checkbox.setProperty("role", "label")
         fps_label = QLabel("目标帧率:")
-        fps_label.setStyleSheet(STYLE_LABEL)
+        fps_label.setProperty("role", "label")
         fps_spin = QSpinBox()
         fps_spin.setMinimum(1)
         fps_spin.setMaximum(240)
         fps_spin.setValue(self.config.gui_config.target_fps)
         fps_spin.setToolTip("1–240 fps。开启 VSync 时实际帧率跟随显示器。")
-        fps_spin.setStyleSheet(STYLE_SPINBOX)
+        fps_spin.setObjectName("settingsSpinBox")
         # 目标帧率子组：标签 + 输入框 + 单位，内部紧凑 8px
-        fps_group = QWidget()
-        fps_group_layout = QHBoxLayout(fps_group)
-        fps_group_layout.setContentsMargins(0, 0, 0, 0)
+        fps_group_layout = QHBoxLayout()
         fps_group_layout.setSpacing(8)
         fps_group_layout.addWidget(fps_label)
         fps_group_layout.addWidget(fps_spin)
         fps_group_layout.addWidget(QLabel("fps"))
         perf_row_layout.addWidget(vsync_checkbox)
-        perf_row_layout.addWidget(fps_group)
+        perf_row_layout.addLayout(fps_group_layout)
         perf_row_layout.addStretch()
-        block3_layout.addWidget(perf_row)
+        block3_layout.addLayout(perf_row_layout)
         main_layout.addWidget(block3)
         main_layout.addSpacing(SPACING_BLOCK)
         
@@ -417,42 +655,40 @@ class SettingsWindow(QDialog):
         block4_layout.setContentsMargins(0, 0, 0, 0)
         block4_layout.setSpacing(12)
         sec4 = QLabel("颜色")
-        sec4.setStyleSheet(STYLE_SECTION_TITLE)
+        sec4.setProperty("role", "section")
         block4_layout.addWidget(sec4)
         report_color_value = self.config.message_config.report_color.upper()
         warning_color_value = self.config.message_config.warning_color.upper()
-        custom_text_color_value = getattr(self.config.message_config, 'custom_text_color', '#01FF00').upper()
+        custom_text_color_value = self.config.message_config.custom_text_color.upper()
         self.current_report_color = report_color_value
         self.current_warning_color = warning_color_value
         self.current_custom_text_color = custom_text_color_value
         
         def _add_color_row(parent_layout, label_text, color_value, color_type):
-            row = QWidget()
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(0, 0, 0, 0)
+            row_layout = QHBoxLayout()
             row_layout.setSpacing(10)
             lbl = QLabel(label_text)
-            lbl.setStyleSheet("font-size: 13px; color: #555555;")
+            lbl.setProperty("role", "label")
             lbl.setMinimumWidth(120)  # 统一标签宽度，三行颜色预览/色值/按钮纵向对齐
             row_layout.addWidget(lbl)
-            preview = QLabel()
+            preview = _ColorSwatch(color_value)
             preview.setFixedSize(40, 25)
-            preview.setStyleSheet(f"background-color: {color_value}; border: 1px solid #000; border-radius: 3px;")
             row_layout.addWidget(preview)
             value_label = QLabel(color_value)
             value_label.setMinimumWidth(80)
-            value_label.setStyleSheet("font-size: 13px; color: #333333; font-family: monospace;")
+            value_label.setProperty("role", "colorValue")
             row_layout.addWidget(value_label)
             btn = QPushButton("修改颜色")
-            btn.setStyleSheet("font-size: 13px; padding: 4px 10px;")
+            btn.setProperty("role", "colorButton")
             btn.clicked.connect(lambda: self._open_color_picker(color_type))
             row_layout.addWidget(btn)
             reset_btn = QPushButton("恢复默认")
-            reset_btn.setStyleSheet("font-size: 12px; padding: 4px 10px;")
+            reset_btn.setProperty("role", "colorReset")
             reset_btn.clicked.connect(lambda: self._reset_color(color_type))
             row_layout.addWidget(reset_btn)
             row_layout.addStretch()
-            parent_layout.addWidget(row)
+            parent_layout.addLayout(row_layout)
+            self._color_widgets[color_type] = (preview, value_label)
             return preview, value_label
         
         self.report_color_preview, self.report_color_label = _add_color_row(block4_layout, "地震信息颜色:", report_color_value, 'report')
@@ -467,10 +703,10 @@ class SettingsWindow(QDialog):
         block5_layout.setContentsMargins(0, 0, 0, 0)
         block5_layout.setSpacing(12)
         sec5 = QLabel("自定义文本")
-        sec5.setStyleSheet(STYLE_SECTION_TITLE)
+        sec5.setProperty("role", "section")
         block5_layout.addWidget(sec5)
         custom_hint = QLabel("在「数据源」页选择「自定义文本」后，非预警时将显示此处编辑的文本。修改并保存后立即生效，无需重启。")
-        custom_hint.setStyleSheet(STYLE_HINT)
+        custom_hint.setProperty("role", "hint")
         custom_hint.setWordWrap(True)
         block5_layout.addWidget(custom_hint)
         self.custom_text_edit = QPlainTextEdit()
@@ -481,36 +717,49 @@ class SettingsWindow(QDialog):
         main_layout.addWidget(block5)
         
         # 保存变量引用（供 _save_appearance_settings 使用）
-        self.display_vars = {
-            'speed': speed_slider,
-            'font_size': font_slider,
-            'width': width_spin,
-            'height': height_spin,
-            'opacity': opacity_slider,
-            'vsync_enabled': vsync_checkbox,
-            'target_fps': fps_spin,
-            'timezone': timezone_combo,
-        }
+        self.display_vars = _DisplayVars(
+            speed=speed_slider,
+            font_size=font_slider,
+            width=width_spin,
+            height=height_spin,
+            opacity=opacity_slider,
+            vsync_enabled=vsync_checkbox,
+            target_fps=fps_spin,
+            timezone=timezone_combo,
+        )
         self.render_vars = {'use_gpu_rendering': gpu_radio}
         
         main_layout.addStretch()
         
         # 保存按钮
-        button_frame = QWidget()
-        button_layout = QHBoxLayout(button_frame)
+        button_layout = QHBoxLayout()
         button_layout.setContentsMargins(0, 10, 0, 0)
         button_layout.addStretch()
-        save_btn = QPushButton("保存")
-        save_btn.setMinimumWidth(120)
-        save_btn.setMinimumHeight(35)
-        save_btn.setStyleSheet(STYLE_SAVE_BTN)
-        save_btn.clicked.connect(self._save_appearance_settings)
+        save_btn = self._make_save_button(self._save_appearance_settings)
         button_layout.addWidget(save_btn)
         button_layout.addStretch()
-        main_layout.addWidget(button_frame)
+        main_layout.addLayout(button_layout)
         
         scroll_area.setWidget(scrollable_widget)
-        self.notebook.addTab(scroll_area, "外观与显示")
+        return scroll_area
+    
+    @staticmethod
+    def _make_save_button(slot: Callable[[], Any]) -> QPushButton:
+        """创建各标签页底部统一尺寸的「保存」按钮（样式由窗口样式表的 #saveButton 提供）"""
+        btn = QPushButton("保存")
+        btn.setMinimumWidth(120)
+        btn.setMinimumHeight(35)
+        btn.setObjectName("saveButton")
+        btn.clicked.connect(slot)
+        return btn
+    
+    @staticmethod
+    def _make_section_title(text: str, font: QFont, padding_top: int = 15) -> QLabel:
+        """创建数据源页的分区标题（各标题共用同一个 QFont）"""
+        label = QLabel(text)
+        label.setFont(font)
+        label.setStyleSheet(f"color: #000000; padding-top: {padding_top}px; padding-bottom: 5px;")
+        return label
     
     def _create_data_source_tab(self):
         """创建数据源设置标签页"""
@@ -523,6 +772,7 @@ class SettingsWindow(QDialog):
         scroll_layout = QVBoxLayout(scrollable_widget)
         scroll_layout.setContentsMargins(MARGIN_TAB, MARGIN_TAB, MARGIN_TAB, MARGIN_TAB)
         scroll_layout.setSpacing(SPACING_TAB)
+        scroll_layout.setSizeConstraint(QLayout.SetMinAndMaxSize)
         
         # 说明文字
         info_label = QLabel("提示：预警数据源只解析预警数据，历史数据源只解析速报数据。修改数据源后需重启程序生效。")
@@ -535,55 +785,24 @@ class SettingsWindow(QDialog):
         font.setPointSize(16)
         
         # 地震预警
-        warning_label = QLabel("地震预警")
-        warning_label.setFont(font)
-        warning_label.setStyleSheet("color: #000000; padding-top: 10px; padding-bottom: 5px;")
-        scroll_layout.addWidget(warning_label)
+        scroll_layout.addWidget(self._make_section_title("地震预警", font, padding_top=10))
         
-        # Fan Studio预警
-        fs_warning_label = QLabel("Fan Studio预警")
+        # 地震预警数据源（Fan Studio、Wolfx、NIED）
         fs_warning_font = QFont()
         fs_warning_font.setBold(True)
         fs_warning_font.setPointSize(15)
-        fs_warning_label.setFont(fs_warning_font)
-        scroll_layout.addWidget(fs_warning_label)
-        # Fan Studio预警：只解析预警数据
-        self._add_source_checkbox(scrollable_widget, "fanstudio_warning", "Fan Studio预警（解析所有预警数据）", default_value=True)
-
-        # Wolfx 预警（地震预警区：HTTP + WSS 全预警 与 WSS 单项互斥）
-        wolfx_warning_label = QLabel("Wolfx 预警")
-        wolfx_warning_label.setFont(fs_warning_font)
-        scroll_layout.addWidget(wolfx_warning_label)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/sc_eew.json", "四川地震局预警 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/jma_eew.json", "日本气象厅预警 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/fj_eew.json", "福建地震局预警 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/cenc_eew.json", "中国地震预警网预警 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/cwa_eew.json", "台湾气象署预警 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/all_eew", "Wolfx 全预警 (WSS)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/sc_eew", "四川地震局预警 (WSS)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/jma_eew", "日本气象厅预警 (WSS)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/fj_eew", "福建地震局预警 (WSS)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/cenc_eew", "中国地震预警网预警 (WSS)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/cwa_eew", "台湾气象署预警 (WSS)", default_value=False)
+        self._add_source_groups(scrollable_widget, self.WARNING_SOURCE_GROUPS, fs_warning_font)
+        # Wolfx 预警区：HTTP + WSS 全预警 与 WSS 单项互斥
         self._setup_wolfx_eew_mutual_exclusion()
-
-        # NIED 数据源（地震预警区）
-        nied_label = QLabel("NIED 数据源")
-        nied_label.setFont(fs_warning_font)
-        scroll_layout.addWidget(nied_label)
-        self._add_source_checkbox(scrollable_widget, "wss://sismotide.top/nied", "日本防災科研所预警 (WSS)", default_value=False)
         
         # 地震速报 / 自定义文本 二选一（仅允许：地震预警+地震速报 或 地震预警+自定义文本）
-        mode_label = QLabel("非预警时显示")
-        mode_label.setFont(font)
-        mode_label.setStyleSheet("color: #000000; padding-top: 15px; padding-bottom: 5px;")
-        scroll_layout.addWidget(mode_label)
+        scroll_layout.addWidget(self._make_section_title("非预警时显示", font))
         self.report_mode_group = QButtonGroup(scrollable_widget)
         self.radio_report = QRadioButton("地震速报")
         self.radio_custom_text = QRadioButton("自定义文本")
         self.report_mode_group.addButton(self.radio_report)
         self.report_mode_group.addButton(self.radio_custom_text)
-        use_custom = getattr(self.config.message_config, 'use_custom_text', False)
+        use_custom = self.config.message_config.use_custom_text
         self.radio_report.setChecked(not use_custom)
         self.radio_custom_text.setChecked(use_custom)
         scroll_layout.addWidget(self.radio_report)
@@ -594,33 +813,17 @@ class SettingsWindow(QDialog):
         scroll_layout.addWidget(mode_hint)
         
         # 地震历史
-        history_label = QLabel("地震历史")
-        history_label.setFont(font)
-        history_label.setStyleSheet("color: #000000; padding-top: 15px; padding-bottom: 5px;")
-        scroll_layout.addWidget(history_label)
-        
-        # Fan Studio速报
-        fs_report_label = QLabel("Fan Studio速报")
-        fs_report_label.setFont(fs_warning_font)
-        scroll_layout.addWidget(fs_report_label)
-        # Fan Studio速报：只解析速报数据
-        self._add_source_checkbox(scrollable_widget, "fanstudio_report", "Fan Studio速报（解析所有速报数据）", default_value=True)
-        
-        # 日本气象厅地震情报
-        p2p_label = QLabel("日本气象厅地震情报")
-        p2p_label.setFont(fs_warning_font)
-        scroll_layout.addWidget(p2p_label)
-        self._add_source_checkbox(scrollable_widget, "https://api.p2pquake.net/v2/history?codes=551&limit=3", "日本气象厅地震情报", default_value=True)
-        self._add_source_checkbox(scrollable_widget, "https://api.p2pquake.net/v2/jma/tsunami?limit=1", "日本气象厅海啸预报", default_value=True)
-
-        # Wolfx 速报（地震历史区：HTTP + WSS 单项）
-        wolfx_report_label = QLabel("Wolfx 速报")
-        wolfx_report_label.setFont(fs_warning_font)
-        scroll_layout.addWidget(wolfx_report_label)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/cenc_eqlist.json", "中国地震台网中心速报 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "https://api.wolfx.jp/jma_eqlist.json", "日本气象厅速报 (HTTP)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/cenc_eqlist", "中国地震台网中心速报 (WSS)", default_value=False)
-        self._add_source_checkbox(scrollable_widget, "wss://ws-api.wolfx.jp/jma_eqlist", "日本气象厅速报 (WSS)", default_value=False)
+        scroll_layout.addWidget(self._make_section_title("地震历史", font))
+        
+        # 地震历史数据源（Fan Studio、日本气象厅、Wolfx）
+        self._add_source_groups(scrollable_widget, self.REPORT_SOURCE_GROUPS, fs_warning_font)
+        # 复选框已全部创建：冻结单项数据源集合，固定批量勾选的遍历序列（跳过空URL和all数据源）
+        self.individual_source_urls = frozenset(self.individual_source_urls)
+        self.fanstudio_source_urls = frozenset(self.fanstudio_source_urls)
+        self._source_items = tuple(
+            (url, checkbox) for url, checkbox in self.source_vars.items()
+            if url and url != self.all_source_url
+        )
         
         scroll_layout.addStretch()
         
@@ -634,101 +837,117 @@ class SettingsWindow(QDialog):
         self.select_all_btn = QPushButton("全选")
         self.select_all_btn.setMinimumWidth(100)
         self.select_all_btn.setMinimumHeight(35)
-        self.select_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4A90E2;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #357ABD;
-            }
-            QPushButton:pressed {
-                background-color: #2E5F8F;
-            }
-        """)
+        self.select_all_btn.setObjectName("selectAllButton")
         self.select_all_btn.clicked.connect(self._toggle_select_all)
         button_layout.addWidget(self.select_all_btn)
         
         button_layout.addSpacing(10)
         
         # 保存按钮
-        save_btn = QPushButton("保存")
-        save_btn.setMinimumWidth(120)
-        save_btn.setMinimumHeight(35)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
-        save_btn.clicked.connect(self._save_data_source_settings)
+        save_btn = self._make_save_button(self._save_data_source_settings)
         button_layout.addWidget(save_btn)
         button_layout.addStretch()
         
         scroll_layout.addWidget(button_frame)
         
         scroll_area.setWidget(scrollable_widget)
-        self.notebook.addTab(scroll_area, "数据源")
+        return scroll_area
     
+    # Fan Studio 单项数据源 URL（由「Fan Studio预警 / 速报」复选框整体启用或禁用）
+    FS_WARNING_URLS = FANSTUDIO_WARNING_URLS
+    FS_REPORT_URLS = FANSTUDIO_REPORT_URLS
+    # 气象预警（默认开启，不可关闭）
+    FS_WEATHER_URL = FANSTUDIO_WEATHER_URL
+
+    # 数据源分组：(分组标题, ((URL, 显示名称, 默认是否启用), ...))
+    WARNING_SOURCE_GROUPS = (
+        ("Fan Studio预警", (
+            # Fan Studio预警：只解析预警数据
+            ("fanstudio_warning", "Fan Studio预警（解析所有预警数据）", True),
+        )),
+        ("Wolfx 预警", (
+            ("https://api.wolfx.jp/sc_eew.json", "四川地震局预警 (HTTP)", False),
+            ("https://api.wolfx.jp/jma_eew.json", "日本气象厅预警 (HTTP)", False),
+            ("https://api.wolfx.jp/fj_eew.json", "福建地震局预警 (HTTP)", False),
+            ("https://api.wolfx.jp/cenc_eew.json", "中国地震预警网预警 (HTTP)", False),
+            ("https://api.wolfx.jp/cwa_eew.json", "台湾气象署预警 (HTTP)", False),
+            ("wss://ws-api.wolfx.jp/all_eew", "Wolfx 全预警 (WSS)", False),
+            ("wss://ws-api.wolfx.jp/sc_eew", "四川地震局预警 (WSS)", False),
+            ("wss://ws-api.wolfx.jp/jma_eew", "日本气象厅预警 (WSS)", False),
+            ("wss://ws-api.wolfx.jp/fj_eew", "福建地震局预警 (WSS)", False),
+            ("wss://ws-api.wolfx.jp/cenc_eew", "中国地震预警网预警 (WSS)", False),
+            ("wss://ws-api.wolfx.jp/cwa_eew", "台湾气象署预警 (WSS)", False),
+        )),
+        ("NIED 数据源", (
+            ("wss://sismotide.top/nied", "日本防災科研所预警 (WSS)", False),
+        )),
+    )
+    REPORT_SOURCE_GROUPS = (
+        ("Fan Studio速报", (
+            # Fan Studio速报：只解析速报数据
+            ("fanstudio_report", "Fan Studio速报（解析所有速报数据）", True),
+        )),
+        ("日本气象厅地震情报", (
+            ("https://api.p2pquake.net/v2/history?codes=551&limit=3", "日本气象厅地震情报", True),
+            ("https://api.p2pquake.net/v2/jma/tsunami?limit=1", "日本气象厅海啸预报", True),
+        )),
+        ("Wolfx 速报", (
+            ("https://api.wolfx.jp/cenc_eqlist.json", "中国地震台网中心速报 (HTTP)", False),
+            ("https://api.wolfx.jp/jma_eqlist.json", "日本气象厅速报 (HTTP)", False),
+            ("wss://ws-api.wolfx.jp/cenc_eqlist", "中国地震台网中心速报 (WSS)", False),
+            ("wss://ws-api.wolfx.jp/jma_eqlist", "日本气象厅速报 (WSS)", False),
+        )),
+    )
+    # 「恢复默认」时勾选的数据源（分组表中默认启用的项）
+    DEFAULT_SOURCE_URLS = frozenset(
+        sys.intern(url)
+        for _, sources in WARNING_SOURCE_GROUPS + REPORT_SOURCE_GROUPS
+        for url, _, default_value in sources
+        if default_value
+    )
+
+    def _add_source_groups(self, parent, groups, title_font):
+        """按分组表批量添加数据源复选框：先一次性补齐配置中缺失的默认值，再逐组创建标题与复选框"""
+        enabled_sources = self.config.enabled_sources
+        enabled_sources.update({
+            url: default_value
+            for _, sources in groups
+            for url, _, default_value in sources
+            if url not in enabled_sources and url not in _FANSTUDIO_GROUP_KEYS
+        })
+        layout = parent.layout()
+        for title, sources in groups:
+            group_label = QLabel(title)
+            group_label.setFont(title_font)
+            layout.addWidget(group_label)
+            for url, name, default_value in sources:
+                self._add_source_checkbox(parent, url, name, default_value=default_value)
+
     def _add_source_checkbox(self, parent, url, name, is_all_source=False, default_value=False):
         """添加数据源复选框"""
         # 特殊处理：fanstudio_warning和fanstudio_report
-        if url in ["fanstudio_warning", "fanstudio_report"]:
+        if url in _FANSTUDIO_GROUP_KEYS:
             # 所有数据源默认启用，所以fanstudio_warning和fanstudio_report也默认启用
-            base_domain = "fanstudio.tech"
-            
-            if url == "fanstudio_warning":
-                # 确保所有预警数据源启用
-                warning_sources = ['cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew']
-                for source in warning_sources:
-                    source_url = f"wss://ws.{base_domain}/{source}"
-                    self.config.enabled_sources[source_url] = True
-                initial_value = True
-            elif url == "fanstudio_report":
-                # 确保所有速报数据源启用
-                report_sources = ['cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'hko', 
-                                 'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn']
-                for source in report_sources:
-                    source_url = f"wss://ws.{base_domain}/{source}"
-                    self.config.enabled_sources[source_url] = True
-                initial_value = True
-            else:
-                initial_value = True
+            # 确保所有预警 / 速报数据源启用
+            source_urls = self.FS_WARNING_URLS if url == "fanstudio_warning" else self.FS_REPORT_URLS
+            self.config.enabled_sources.update(dict.fromkeys(source_urls, True))
+            initial_value = True
         else:
-            config_value = self.config.enabled_sources.get(url)
-            if config_value is None:
-                initial_value = default_value
-                self.config.enabled_sources[url] = default_value
-            else:
-                initial_value = config_value
-                self.config.enabled_sources[url] = config_value
+            # 缺失的默认值通常已由 _add_source_groups 批量补齐
+            initial_value = self.config.enabled_sources.setdefault(url, default_value)
         
+        # URL 键驻留：source_vars 及各 URL 集合的查找可直接按指针比较
+        url = sys.intern(url) if url else url
         checkbox = QCheckBox(name, parent)
         checkbox.setChecked(initial_value)
         self.source_vars[url] = checkbox
         
         # 如果不是All源，记录到单项数据源列表
-        if not is_all_source and url and url not in ["fanstudio_warning", "fanstudio_report"]:
-            self.individual_source_urls.append(url)
+        if not is_all_source and url and url not in _FANSTUDIO_GROUP_KEYS:
+            self.individual_source_urls.add(url)
             # 如果是Fan Studio数据源（WebSocket URL），记录到Fan Studio列表
-            if 'fanstudio.tech' in url or 'fanstudio.hk' in url:
-                self.fanstudio_source_urls.append(url)
+            if is_fanstudio_url(url):
+                self.fanstudio_source_urls.add(url)
         
         # 不再需要互斥逻辑，因为all数据源已隐藏，所有单项数据源都从all数据源解析
         
@@ -737,11 +956,11 @@ class SettingsWindow(QDialog):
             parent.layout().addWidget(checkbox)
 
     # Wolfx 预警 WSS：全预警(all_eew) 与 单项(sc_eew, jma_eew, ...) 互斥
-    WOLFX_ALL_EEW_URL = "wss://ws-api.wolfx.jp/all_eew"
-    WOLFX_WSS_EEW_INDIVIDUAL = [
+    WOLFX_ALL_EEW_URL = sys.intern("wss://ws-api.wolfx.jp/all_eew")
+    WOLFX_WSS_EEW_INDIVIDUAL = frozenset(map(sys.intern, (
         "wss://ws-api.wolfx.jp/sc_eew", "wss://ws-api.wolfx.jp/jma_eew", "wss://ws-api.wolfx.jp/fj_eew",
         "wss://ws-api.wolfx.jp/cenc_eew", "wss://ws-api.wolfx.jp/cwa_eew",
-    ]
+    )))
 
     def _setup_wolfx_eew_mutual_exclusion(self):
         """Wolfx 全预警 (WSS) 与 单项预警 (WSS) 互斥：勾选全预警则取消所有单项，勾选任一项单项则取消全预警"""
@@ -749,23 +968,43 @@ class SettingsWindow(QDialog):
             return
         all_cb = self.source_vars[self.WOLFX_ALL_EEW_URL]
         individual_cbs = [self.source_vars[u] for u in self.WOLFX_WSS_EEW_INDIVIDUAL if u in self.source_vars]
+        self._wolfx_individual_checked_count = sum(cb.isChecked() for cb in individual_cbs)
 
+        # 互斥处理中由代码触发的 toggled 由 _updating_mutual_exclusion 标志忽略，无需逐个 blockSignals
         def on_all_toggled(checked):
-            if not checked:
+            if not checked or self._updating_mutual_exclusion or not self._wolfx_individual_checked_count:
                 return
-            for cb in individual_cbs:
-                if cb.isChecked():
-                    cb.blockSignals(True)
+            checked_cbs = [cb for cb in individual_cbs if cb.isChecked()]
+            # 一次性取消所有单项，期间暂停数据源页重绘
+            page = self.notebook.widget(self.DATA_SOURCE_TAB_INDEX)
+            page.setUpdatesEnabled(False)
+            self._updating_mutual_exclusion = True
+            try:
+                for cb in checked_cbs:
                     cb.setChecked(False)
-                    cb.blockSignals(False)
+            finally:
+                self._updating_mutual_exclusion = False
+                page.setUpdatesEnabled(True)
+
+        def uncheck_all_cb():
+            if all_cb.isChecked() and self._wolfx_individual_checked_count:
+                self._updating_mutual_exclusion = True
+                try:
+                    all_cb.setChecked(False)
+                finally:
+                    self._updating_mutual_exclusion = False
+
+        # 单项勾选合并处理：同一轮事件循环内的多次勾选只在回到事件循环后处理一次
+        exclusion_timer = QTimer(all_cb)
+        exclusion_timer.setSingleShot(True)
+        exclusion_timer.setInterval(0)
+        exclusion_timer.timeout.connect(uncheck_all_cb)
 
         def on_individual_toggled(checked):
-            if not checked:
-                return
-            if all_cb.isChecked():
-                all_cb.blockSignals(True)
-                all_cb.setChecked(False)
-                all_cb.blockSignals(False)
+            # 单项选中计数随每次 toggled 增减（包括互斥处理中由代码取消的勾选）
+            self._wolfx_individual_checked_count += 1 if checked else -1
+            if checked and not self._updating_mutual_exclusion:
+                exclusion_timer.start()
 
         all_cb.toggled.connect(on_all_toggled)
         for cb in individual_cbs:
@@ -784,32 +1023,29 @@ class SettingsWindow(QDialog):
             self._is_all_selected = True
             self.select_all_btn.setText("恢复默认")
     
+    def _set_source_checks(self, is_checked: Callable[[str], bool]):
+        """批量设置数据源复选框的选中状态（直接设为最终状态，不经过互斥处理；期间暂停数据源页重绘）"""
+        page = self.notebook.widget(self.DATA_SOURCE_TAB_INDEX)
+        page.setUpdatesEnabled(False)
+        try:
+            for url, checkbox in self._source_items:
+                with QSignalBlocker(checkbox):
+                    checkbox.setChecked(is_checked(url))
+        finally:
+            page.setUpdatesEnabled(True)
+        # 信号被屏蔽，Wolfx 单项选中计数需按最终状态重新统计
+        self._wolfx_individual_checked_count = sum(
+            self.source_vars[url].isChecked()
+            for url in self.WOLFX_WSS_EEW_INDIVIDUAL if url in self.source_vars
+        )
+    
     def _select_all_sources(self):
-        """全选所有数据源（Wolfx 预警 WSS 取全预警，与单项互斥）"""
-        for url, checkbox in self.source_vars.items():
-            if url and url != self.all_source_url:  # 跳过空URL和all数据源
-                checkbox.setChecked(True)
-        # 全选时 Wolfx 预警 WSS 使用「全预警」，取消单项 WSS
-        if self.WOLFX_ALL_EEW_URL in self.source_vars:
-            self.source_vars[self.WOLFX_ALL_EEW_URL].setChecked(True)
+        """全选所有数据源（Wolfx 预警 WSS 取全预警，单项 WSS 不选）"""
+        self._set_source_checks(lambda url: url not in self.WOLFX_WSS_EEW_INDIVIDUAL)
     
     def _restore_default_selection(self):
-        """恢复默认选中状态"""
-        # 默认选中的数据源：Fan Studio预警、Fan Studio速报、日本气象厅地震情报
-        # 先全部取消选中
-        for url, checkbox in self.source_vars.items():
-            if url and url != self.all_source_url:
-                checkbox.setChecked(False)
-        
-        # 选中默认数据源（Fan Studio 预警/速报、日本气象厅地震情报、日本气象厅海啸预报；Wolfx/NIED 保持不选）
-        if "fanstudio_warning" in self.source_vars:
-            self.source_vars["fanstudio_warning"].setChecked(True)
-        if "fanstudio_report" in self.source_vars:
-            self.source_vars["fanstudio_report"].setChecked(True)
-        if "https://api.p2pquake.net/v2/history?codes=551&limit=3" in self.source_vars:
-            self.source_vars["https://api.p2pquake.net/v2/history?codes=551&limit=3"].setChecked(True)
-        if "https://api.p2pquake.net/v2/jma/tsunami?limit=1" in self.source_vars:
-            self.source_vars["https://api.p2pquake.net/v2/jma/tsunami?limit=1"].setChecked(True)
+        """恢复默认选中状态（Fan Studio 预警/速报、日本气象厅地震情报、日本气象厅海啸预报；Wolfx/NIED 不选）"""
+        self._set_source_checks(self.DEFAULT_SOURCE_URLS.__contains__)
     
     def _create_translation_tab(self):
         """创建翻译设置标签页"""
@@ -822,52 +1058,47 @@ class SettingsWindow(QDialog):
         main_layout = QVBoxLayout(scrollable_widget)
         main_layout.setContentsMargins(MARGIN_TAB, MARGIN_TAB, MARGIN_TAB, MARGIN_TAB)
         main_layout.setSpacing(SPACING_TAB)
+        main_layout.setSizeConstraint(QLayout.SetMinAndMaxSize)
         
-        mode_frame = QWidget()
-        mode_layout = QVBoxLayout(mode_frame)
-        mode_layout.setContentsMargins(0, 0, 0, 0)
+        mode_layout = QVBoxLayout()
         mode_layout.setSpacing(15)
         mode_title = QLabel("地名处理方式")
-        mode_title.setStyleSheet(STYLE_SECTION_TITLE)
+        mode_title.setProperty("role", "section")
         mode_layout.addWidget(mode_title)
         
         # 地名修正选项（用于速报）
-        fix_frame = QWidget()
-        fix_layout = QVBoxLayout(fix_frame)
-        fix_layout.setContentsMargins(0, 0, 0, 0)
+        fix_layout = QVBoxLayout()
         fix_layout.setSpacing(5)
         
         fix_checkbox = QCheckBox("速报使用地名修正")
         fix_checkbox.setChecked(self.config.translation_config.use_place_name_fix)
-        fix_checkbox.setStyleSheet("font-size: 14px; padding: 5px;")
+        fix_checkbox.setProperty("role", "translationOption")
         fix_layout.addWidget(fix_checkbox)
         
         fix_info = QLabel("速报消息根据经纬度自动修正地名（支持usgs, emsc, bcsf, gfz, usp, kma数据源）\n无需配置API密钥")
-        fix_info.setStyleSheet("color: #666666; font-size: 12px; padding-left: 25px; line-height: 1.5;")
+        fix_info.setProperty("role", "translationInfo")
         fix_info.setWordWrap(True)
         fix_layout.addWidget(fix_info)
-        mode_layout.addWidget(fix_frame)
+        mode_layout.addLayout(fix_layout)
         
         mode_layout.addSpacing(5)
         
         # 百度翻译选项（用于预警）
-        baidu_frame = QWidget()
-        baidu_layout = QVBoxLayout(baidu_frame)
-        baidu_layout.setContentsMargins(0, 0, 0, 0)
+        baidu_layout = QVBoxLayout()
         baidu_layout.setSpacing(5)
         
         baidu_checkbox = QCheckBox("预警使用百度翻译")
         baidu_checkbox.setChecked(self.config.translation_config.enabled)
-        baidu_checkbox.setStyleSheet("font-size: 14px; padding: 5px;")
+        baidu_checkbox.setProperty("role", "translationOption")
         baidu_layout.addWidget(baidu_checkbox)
         
         baidu_info = QLabel("预警消息将日语、韩语、英语地名翻译为中文\n需要配置百度翻译API密钥")
-        baidu_info.setStyleSheet("color: #666666; font-size: 12px; padding-left: 25px; line-height: 1.5;")
+        baidu_info.setProperty("role", "translationInfo")
         baidu_info.setWordWrap(True)
         baidu_layout.addWidget(baidu_info)
-        mode_layout.addWidget(baidu_frame)
+        mode_layout.addLayout(baidu_layout)
         
-        main_layout.addWidget(mode_frame)
+        main_layout.addLayout(mode_layout)
         
         # 分隔线
         separator = QFrame()
@@ -891,72 +1122,42 @@ class SettingsWindow(QDialog):
         config_title.setStyleSheet("color: #333333; margin-bottom: 5px;")
         config_layout.addWidget(config_title)
         
-        # 根据选择显示/隐藏API配置区域
-        def update_api_config_visibility():
-            if baidu_checkbox.isChecked():
-                config_frame.setVisible(True)
-            else:
-                config_frame.setVisible(False)
-        
-        baidu_checkbox.toggled.connect(update_api_config_visibility)
+        # 根据选择显示/隐藏API配置区域（toggled 的布尔参数直接作为可见性）
+        baidu_checkbox.toggled.connect(config_frame.setVisible)
         # 初始化显示状态
-        update_api_config_visibility()
+        config_frame.setVisible(baidu_checkbox.isChecked())
         
         # App ID 输入组
-        app_id_group = QWidget()
-        app_id_layout = QVBoxLayout(app_id_group)
-        app_id_layout.setContentsMargins(0, 0, 0, 0)
+        app_id_layout = QVBoxLayout()
         app_id_layout.setSpacing(5)
         
         app_id_label = QLabel("百度翻译 App ID:")
-        app_id_label.setStyleSheet("font-size: 13px; color: #555555;")
+        app_id_label.setProperty("role", "label")
         app_id_layout.addWidget(app_id_label)
         
         app_id_entry = QLineEdit()
         app_id_entry.setText(self.config.translation_config.baidu_app_id)
         app_id_entry.setEchoMode(QLineEdit.Password)
         app_id_entry.setMaxLength(100)
-        app_id_entry.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4A90E2;
-            }
-        """)
+        app_id_entry.setObjectName("apiEntry")
         app_id_layout.addWidget(app_id_entry)
-        config_layout.addWidget(app_id_group)
+        config_layout.addLayout(app_id_layout)
         
         # Secret Key 输入组
-        secret_key_group = QWidget()
-        secret_key_layout = QVBoxLayout(secret_key_group)
-        secret_key_layout.setContentsMargins(0, 0, 0, 0)
+        secret_key_layout = QVBoxLayout()
         secret_key_layout.setSpacing(5)
         
         secret_key_label = QLabel("百度翻译 Secret Key:")
-        secret_key_label.setStyleSheet("font-size: 13px; color: #555555;")
+        secret_key_label.setProperty("role", "label")
         secret_key_layout.addWidget(secret_key_label)
         
         secret_key_entry = QLineEdit()
         secret_key_entry.setText(self.config.translation_config.baidu_secret_key)
         secret_key_entry.setEchoMode(QLineEdit.Password)
         secret_key_entry.setMaxLength(100)
-        secret_key_entry.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4A90E2;
-            }
-        """)
+        secret_key_entry.setObjectName("apiEntry")
         secret_key_layout.addWidget(secret_key_entry)
-        config_layout.addWidget(secret_key_group)
+        config_layout.addLayout(secret_key_layout)
         
         # 获取API密钥链接
         link_label = QLabel('获取API密钥请访问: <a href="https://fanyi-api.baidu.com/" style="color: #4A90E2; text-decoration: none;">百度翻译开放平台</a>')
@@ -968,14 +1169,7 @@ class SettingsWindow(QDialog):
         
         # 提示信息区域
         hint_frame = QWidget()
-        hint_frame.setStyleSheet("""
-            QWidget {
-                background-color: #FFF9E6;
-                border: 1px solid #FFE082;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        hint_frame.setObjectName("translationHintFrame")
         hint_layout = QVBoxLayout(hint_frame)
         hint_layout.setContentsMargins(12, 10, 12, 10)
         hint_layout.setSpacing(5)
@@ -997,27 +1191,7 @@ class SettingsWindow(QDialog):
         button_layout.setContentsMargins(0, 10, 0, 0)
         button_layout.addStretch()  # 左侧弹性空间，使按钮居中
         
-        save_btn = QPushButton("保存")
-        save_btn.setMinimumWidth(120)
-        save_btn.setMinimumHeight(35)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
-        save_btn.clicked.connect(self._save_translation_settings)
+        save_btn = self._make_save_button(self._save_translation_settings)
         button_layout.addWidget(save_btn)
         button_layout.addStretch()  # 右侧弹性空间，使按钮居中
         
@@ -1032,7 +1206,7 @@ class SettingsWindow(QDialog):
         }
         
         scroll_area.setWidget(scrollable_widget)
-        self.notebook.addTab(scroll_area, "翻译")
+        return scroll_area
     
     def _create_log_tab(self):
         """创建日志设置标签页"""
@@ -1045,9 +1219,10 @@ class SettingsWindow(QDialog):
         layout = QVBoxLayout(scrollable_widget)
         layout.setContentsMargins(MARGIN_TAB, MARGIN_TAB, MARGIN_TAB, MARGIN_TAB)
         layout.setSpacing(SPACING_TAB)
+        layout.setSizeConstraint(QLayout.SetMinAndMaxSize)
         
         title_label = QLabel("日志设置")
-        title_label.setStyleSheet(STYLE_SECTION_TITLE)
+        title_label.setProperty("role", "section")
         layout.addWidget(title_label)
         
         # 说明文字
@@ -1058,43 +1233,25 @@ class SettingsWindow(QDialog):
         # 输出日志到文件
         output_file_checkbox = QCheckBox("输出日志到文件")
         output_file_checkbox.setChecked(self.config.log_config.output_to_file)
-        output_file_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        output_file_checkbox.setObjectName("logCheckBox")
         layout.addWidget(output_file_checkbox)
         
         # 说明
         output_file_desc = QLabel("启用后，日志将保存到 log.txt 文件中")
         output_file_desc.setWordWrap(True)  # 启用自动换行
-        output_file_desc.setStyleSheet("color: #888; font-size: 12px; padding-left: 30px; padding-bottom: 10px;")
+        output_file_desc.setProperty("role", "logDesc")
         layout.addWidget(output_file_desc)
         
         # 每次程序启动前清空日志
         clear_log_checkbox = QCheckBox("每次程序启动前清空日志")
         clear_log_checkbox.setChecked(self.config.log_config.clear_log_on_startup)
-        clear_log_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        clear_log_checkbox.setObjectName("logCheckBox")
         layout.addWidget(clear_log_checkbox)
         
         # 说明
         clear_log_desc = QLabel("启用后，每次启动程序时会清空日志文件")
         clear_log_desc.setWordWrap(True)  # 启用自动换行
-        clear_log_desc.setStyleSheet("color: #888; font-size: 12px; padding-left: 30px; padding-bottom: 10px;")
+        clear_log_desc.setProperty("role", "logDesc")
         layout.addWidget(clear_log_desc)
         
         # 分隔线
@@ -1107,22 +1264,13 @@ class SettingsWindow(QDialog):
         # 按日期分割日志
         split_date_checkbox = QCheckBox("按日期分割日志")
         split_date_checkbox.setChecked(self.config.log_config.split_by_date)
-        split_date_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        split_date_checkbox.setObjectName("logCheckBox")
         layout.addWidget(split_date_checkbox)
         
         # 说明
         split_date_desc = QLabel("启用后，日志文件将按日期命名（log_YYYYMMDD.txt），每天自动创建新文件")
         split_date_desc.setWordWrap(True)  # 启用自动换行
-        split_date_desc.setStyleSheet("color: #888; font-size: 12px; padding-left: 30px; padding-bottom: 10px;")
+        split_date_desc.setProperty("role", "logDesc")
         layout.addWidget(split_date_desc)
         
         # 日志大小设置
@@ -1136,14 +1284,7 @@ class SettingsWindow(QDialog):
         log_size_spinbox.setMaximum(1000)
         log_size_spinbox.setValue(self.config.log_config.max_log_size)
         log_size_spinbox.setSuffix(" MB")
-        log_size_spinbox.setStyleSheet("""
-            QSpinBox {
-                font-size: 14px;
-                padding: 5px;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-            }
-        """)
+        log_size_spinbox.setObjectName("logSpinBox")
         log_size_layout.addWidget(log_size_spinbox)
         log_size_layout.addStretch()
         layout.addLayout(log_size_layout)
@@ -1162,28 +1303,7 @@ class SettingsWindow(QDialog):
         button_layout.setContentsMargins(0, 10, 0, 0)  # 与其他标签页保持一致
         button_layout.addStretch()  # 左侧弹性空间，使按钮居中
         
-        # 为保持与其他标签页一致，统一保存按钮尺寸
-        save_btn = QPushButton("保存")
-        save_btn.setMinimumWidth(120)
-        save_btn.setMinimumHeight(35)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
-        save_btn.clicked.connect(lambda: self._save_log_settings(
+        save_btn = self._make_save_button(lambda: self._save_log_settings(
             output_file_checkbox, clear_log_checkbox, split_date_checkbox, log_size_spinbox
         ))
         button_layout.addWidget(save_btn)
@@ -1192,7 +1312,7 @@ class SettingsWindow(QDialog):
         layout.addWidget(button_frame)
         
         scroll_area.setWidget(scrollable_widget)
-        self.notebook.addTab(scroll_area, "日志")
+        return scroll_area
     
     def _save_log_settings(self, output_file_checkbox, clear_log_checkbox, split_date_checkbox, log_size_spinbox):
         """保存日志设置"""
@@ -1208,7 +1328,7 @@ class SettingsWindow(QDialog):
                 return
             
             # 保存到文件
-            self.config.save_config()
+            self._schedule_save()
             
             QMessageBox.information(self, "成功", "日志设置已保存！\n需要重启程序才能生效。")
             logger.debug("日志设置已保存")
@@ -1251,7 +1371,7 @@ class SettingsWindow(QDialog):
             self.config.translation_config.baidu_secret_key = secret_key
             
             # 保存到文件
-            self.config.save_config()
+            self._schedule_save()
             
             QMessageBox.information(
                 self,
@@ -1276,8 +1396,7 @@ class SettingsWindow(QDialog):
         layout = QVBoxLayout(scrollable_widget)
         layout.setContentsMargins(MARGIN_TAB, MARGIN_TAB, MARGIN_TAB, MARGIN_TAB)
         layout.setSpacing(SPACING_TAB)
-        sep_style = "background-color: #E0E0E0; max-height: 1px;"
-        body_style = "color: #555555; font-size: 13px; padding-left: 10px; padding-bottom: 2px;"
+        layout.setSizeConstraint(QLayout.SetMinAndMaxSize)
 
         # 标题与版本
         title_label = QLabel("地震预警及速报滚动实况")
@@ -1289,60 +1408,59 @@ class SettingsWindow(QDialog):
         sep1 = QFrame()
         sep1.setFrameShape(QFrame.HLine)
         sep1.setFrameShadow(QFrame.Sunken)
-        sep1.setStyleSheet(sep_style)
+        sep1.setProperty("role", "aboutSeparator")
         layout.addWidget(sep1)
         layout.addSpacing(4)
 
         # 数据源支持
         data_source_label = QLabel("数据源支持")
-        data_source_label.setStyleSheet(STYLE_SECTION_TITLE)
+        data_source_label.setProperty("role", "section")
         layout.addWidget(data_source_label)
-        for name in ["Fan Studio", "P2PQuake", "Wolfx防灾", "NIED 日本防災科研所"]:
-            lb = QLabel(f"• {name}")
-            lb.setStyleSheet(body_style)
-            layout.addWidget(lb)
+        # 列表各项合并为一个多行标签
+        data_source_list = QLabel("• " + "\n• ".join(("Fan Studio", "P2PQuake", "Wolfx防灾", "NIED 日本防災科研所")))
+        data_source_list.setProperty("role", "aboutBody")
+        layout.addWidget(data_source_list)
         layout.addSpacing(SPACING_BLOCK - 4)
         sep2 = QFrame()
         sep2.setFrameShape(QFrame.HLine)
         sep2.setFrameShadow(QFrame.Sunken)
-        sep2.setStyleSheet(sep_style)
+        sep2.setProperty("role", "aboutSeparator")
         layout.addWidget(sep2)
         layout.addSpacing(4)
 
         # 开发者
         developer_label = QLabel("开发者")
-        developer_label.setStyleSheet(STYLE_SECTION_TITLE)
+        developer_label.setProperty("role", "section")
         layout.addWidget(developer_label)
-        for name in ["星落"]:
-            lb = QLabel(f"• {name}")
-            lb.setStyleSheet(body_style)
-            layout.addWidget(lb)
+        developer_list = QLabel("• 星落")
+        developer_list.setProperty("role", "aboutBody")
+        layout.addWidget(developer_list)
         layout.addSpacing(SPACING_BLOCK - 4)
         sep2b = QFrame()
         sep2b.setFrameShape(QFrame.HLine)
         sep2b.setFrameShadow(QFrame.Sunken)
-        sep2b.setStyleSheet(sep_style)
+        sep2b.setProperty("role", "aboutSeparator")
         layout.addWidget(sep2b)
         layout.addSpacing(4)
 
         # QQ群
         qq_label = QLabel("QQ群")
-        qq_label.setStyleSheet(STYLE_SECTION_TITLE)
+        qq_label.setProperty("role", "section")
         layout.addWidget(qq_label)
         qq_value = QLabel("947523679")
-        qq_value.setStyleSheet(body_style)
+        qq_value.setProperty("role", "aboutBody")
         layout.addWidget(qq_value)
         layout.addSpacing(SPACING_BLOCK - 4)
         sep3 = QFrame()
         sep3.setFrameShape(QFrame.HLine)
         sep3.setFrameShadow(QFrame.Sunken)
-        sep3.setStyleSheet(sep_style)
+        sep3.setProperty("role", "aboutSeparator")
         layout.addWidget(sep3)
         layout.addSpacing(4)
 
         # 特别致谢
         thanks_label = QLabel("特别致谢")
-        thanks_label.setStyleSheet(STYLE_SECTION_TITLE)
+        thanks_label.setProperty("role", "section")
         layout.addWidget(thanks_label)
         thanks_frame = QWidget()
         thanks_frame.setStyleSheet(
@@ -1354,13 +1472,13 @@ class SettingsWindow(QDialog):
         for text in ["感谢所有数据源提供方为地震监测事业做出的贡献。", "感谢所有用户的支持与反馈。"]:
             tl = QLabel(text)
             tl.setWordWrap(True)
-            tl.setStyleSheet("color: #555555; font-size: 13px; line-height: 1.4;")
+            tl.setProperty("role", "thanksText")
             thanks_layout.addWidget(tl)
         layout.addWidget(thanks_frame)
         layout.addStretch()
 
         scroll_area.setWidget(scrollable_widget)
-        self.notebook.addTab(scroll_area, "关于")
+        return scroll_area
     
     def _create_bottom_buttons(self, main_layout):
         """创建底部按钮区域"""
@@ -1387,48 +1505,12 @@ class SettingsWindow(QDialog):
     def _restart_application(self):
         """重启应用程序。exe 下通过延迟或批处理先退出再启动新进程，避免 PyInstaller 解压冲突。"""
         import subprocess
-        from PyQt5.QtWidgets import QApplication
-        from PyQt5.QtCore import QTimer
+        self._flush_pending_save()
         try:
             exe_path = get_executable_path()
             if getattr(sys, 'frozen', False):
-                # 打包后的 exe：先退出，再由批处理延迟启动新进程，避免与当前进程共用解压目录
-                args = sys.argv[1:]
-                try:
-                    import tempfile
-                    fd, bat_path = tempfile.mkstemp(suffix=".bat", prefix="restart_")
-                    os.close(fd)
-                    # Windows 下 cmd 按系统 ANSI(如 GBK) 解析 .bat，用 gbk 写入以便中文路径正确
-                    bat_encoding = "gbk" if os.name == "nt" else "utf-8"
-                    exe_dir = os.path.dirname(exe_path)
-                    with open(bat_path, "w", encoding=bat_encoding) as f:
-                        f.write("@echo off\n")
-                        f.write("ping 127.0.0.1 -n 3 > nul\n")  # 约 2 秒延迟
-                        # 先切换到 exe 所在目录再启动，便于 onedir 下新进程正确找到同目录的 python313.dll 等
-                        f.write(f'cd /d "{exe_dir}"\n')
-                        arg_str = " ".join(f'"{a}"' for a in args)
-                        f.write(f'start "" "{exe_path}" {arg_str}\n')
-                        f.write("del \"%~f0\"\n")  # 批处理删除自身
-                    # 分离方式启动批处理，当前进程退出后批处理仍会执行
-                    subprocess.Popen(
-                        ["cmd", "/c", bat_path],
-                        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0,
-                    )
-                except Exception as e:
-                    logger.warning(f"批处理重启失败，改用延迟 Popen: {e}")
-                    exe_dir = os.path.dirname(exe_path)
-                    def _delayed_start():
-                        try:
-                            subprocess.Popen(
-                                [exe_path] + sys.argv[1:],
-                                cwd=exe_dir if exe_dir else None,
-                            )
-                        except Exception as e2:
-                            logger.error(f"延迟启动失败: {e2}")
-                        QApplication.instance().quit()
-                    QTimer.singleShot(2500, _delayed_start)
-                    return
-                QApplication.instance().quit()
+                # 打包后的 exe：批处理的写入与启动在工作线程中完成，成功后再退出，不阻塞界面
+                QThreadPool.globalInstance().start(_RestartBatchTask(self, exe_path, sys.argv[1:]))
                 return
             # Python 脚本：直接启动新进程并退出（解释器用 sys.executable，脚本用 exe_path 即 argv[0]）
             subprocess.Popen([sys.executable, exe_path] + sys.argv[1:])
@@ -1440,21 +1522,53 @@ class SettingsWindow(QDialog):
                 f"无法自动重启程序：{e}\n\n请手动关闭程序后重新打开以使设置生效。"
             )
     
+    def _restart_with_delayed_start(self, error: str):
+        """批处理重启失败时（主线程）：先退出，延迟后直接启动新进程"""
+        import subprocess
+        logger.warning(f"批处理重启失败，改用延迟 Popen: {error}")
+        exe_path = get_executable_path()
+        exe_dir = os.path.dirname(exe_path)
+        def _delayed_start():
+            try:
+                subprocess.Popen(
+                    [exe_path] + sys.argv[1:],
+                    cwd=exe_dir if exe_dir else None,
+                )
+            except Exception as e2:
+                logger.error(f"延迟启动失败: {e2}")
+            QApplication.instance().quit()
+        QTimer.singleShot(2500, _delayed_start)
+    
+    def _confirm(self, title: str, text: str, accept_text: str) -> bool:
+        """
+        显示「{accept_text} / 取消」提示框，返回是否点击了确认按钮
+        提示框首次使用时创建，之后复用同一实例，只更新标题、文本和按钮文字
+        """
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Information)
+            self._confirm_accept_btn = self._confirm_box.addButton(accept_text, QMessageBox.AcceptRole)
+            self._confirm_box.addButton("取消", QMessageBox.RejectRole)
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        self._confirm_accept_btn.setText(accept_text)
+        self._confirm_box.exec_()
+        return self._confirm_box.clickedButton() is self._confirm_accept_btn
+    
     def _restore_default_and_confirm(self):
         """恢复默认数据源选中，弹窗提供「保存」与「取消」；点保存则保存并重启。"""
-        if hasattr(self, '_restore_default_selection') and hasattr(self, 'source_vars'):
+        # 数据源页可能尚未打开过，先创建其控件
+        self._build_tab(self.DATA_SOURCE_TAB_INDEX)
+        if self._source_items:
             self._restore_default_selection()
             self._is_all_selected = False
-            if hasattr(self, 'select_all_btn'):
+            if self.select_all_btn is not None:
                 self.select_all_btn.setText("全选")
-            msg = QMessageBox(self)
-            msg.setWindowTitle("提示")
-            msg.setIcon(QMessageBox.Information)
-            msg.setText("数据源已恢复为默认选中（Fan Studio 预警/速报、日本气象厅地震情报、日本气象厅海啸预报）。点击「保存」将保存并重启软件。")
-            save_btn = msg.addButton("保存", QMessageBox.AcceptRole)
-            msg.addButton("取消", QMessageBox.RejectRole)
-            msg.exec_()
-            if msg.clickedButton() == save_btn:
+            if self._confirm(
+                "提示",
+                "数据源已恢复为默认选中（Fan Studio 预警/速报、日本气象厅地震情报、日本气象厅海啸预报）。点击「保存」将保存并重启软件。",
+                "保存",
+            ):
                 try:
                     self._save_data_source_settings(silent_restart=True)
                 except Exception as e:
@@ -1464,11 +1578,16 @@ class SettingsWindow(QDialog):
             QMessageBox.information(self, "提示", "当前页面无数据源选项，请切换到「数据源」标签页使用恢复默认。")
     
     def _save_all_settings(self):
-        """保存所有设置"""
+        """保存所有设置（只保存已创建的标签页；尚未打开过的标签页不会有修改）"""
         try:
-            self._save_data_source_settings()
-            self._save_appearance_settings()
-            self._save_translation_settings()
+            pending_builders = set(self._tab_builders.values())
+            for builder, save in (
+                (self._create_data_source_tab, self._save_data_source_settings),
+                (self._create_appearance_tab, self._save_appearance_settings),
+                (self._create_translation_tab, self._save_translation_settings),
+            ):
+                if builder not in pending_builders:
+                    save()
             QMessageBox.information(
                 self, "成功",
                 "所有设置已保存！\n数据源和翻译设置需要重启程序才能生效。"
@@ -1484,75 +1603,37 @@ class SettingsWindow(QDialog):
             self._update_base_urls()
             
             all_url = self.all_source_url
+            enabled_sources = self.config.enabled_sources
             
-            # 始终启用all数据源（隐藏但必须启用）
-            self.config.enabled_sources[all_url] = True
-            
-            # 检查Fan Studio预警和速报的启用状态
-            fanstudio_warning_enabled = self.source_vars.get("fanstudio_warning", None)
-            fanstudio_report_enabled = self.source_vars.get("fanstudio_report", None)
-            
-            # 根据选择启用相应的Fan Studio数据源
-            # 预警数据源列表
-            warning_sources = ['cea', 'cea-pr', 'sichuan', 'cwa-eew', 'jma', 'sa', 'kma-eew']
-            # 速报数据源列表
-            report_sources = ['cenc', 'ningxia', 'guangxi', 'shanxi', 'beijing', 'cwa', 'hko', 
-                             'usgs', 'emsc', 'bcsf', 'gfz', 'usp', 'kma', 'fssn']
-            # 气象预警
-            weather_source = 'weatheralarm'
-            
-            # 如果启用了Fan Studio预警，启用所有预警数据源
-            # 否则，禁用所有预警数据源（设置为False）
-            warning_checked = fanstudio_warning_enabled and fanstudio_warning_enabled.isChecked()
-            for source in warning_sources:
-                url = f"wss://ws.{self.base_domain}/{source}"
-                self.config.enabled_sources[url] = warning_checked
-                logger.debug(f"设置预警数据源 {source} 的状态为: {warning_checked}")
-            
-            # 如果启用了Fan Studio速报，启用所有速报数据源
-            # 否则，禁用所有速报数据源（设置为False）
-            report_checked = fanstudio_report_enabled and fanstudio_report_enabled.isChecked()
-            for source in report_sources:
-                url = f"wss://ws.{self.base_domain}/{source}"
-                self.config.enabled_sources[url] = report_checked
-                logger.debug(f"设置速报数据源 {source} 的状态为: {report_checked}")
+            # 始终启用all数据源（隐藏但必须启用）与气象预警（默认开启，不可关闭）
+            enabled_sources.update(dict.fromkeys((all_url, self.FS_WEATHER_URL), True))
             
-            # 始终启用气象预警（默认开启，不可关闭）
-            weather_url = f"wss://ws.{self.base_domain}/{weather_source}"
-            self.config.enabled_sources[weather_url] = True
+            # Fan Studio预警 / 速报 复选框整体启用或禁用对应的全部单项数据源
+            # （复选框不存在时视为未勾选，保证写入的是布尔值）
+            warning_box = self.source_vars.get("fanstudio_warning")
+            report_box = self.source_vars.get("fanstudio_report")
+            warning_checked = warning_box is not None and warning_box.isChecked()
+            report_checked = report_box is not None and report_box.isChecked()
+            enabled_sources.update(dict.fromkeys(self.FS_WARNING_URLS, warning_checked))
+            enabled_sources.update(dict.fromkeys(self.FS_REPORT_URLS, report_checked))
+            logger.debug("Fan Studio预警数据源: %s，速报数据源: %s", warning_checked, report_checked)
             
             # 更新其他数据源配置（P2PQuake等）
-            for url, checkbox in self.source_vars.items():
-                if url and url != all_url and url not in ["fanstudio_warning", "fanstudio_report"]:
-                    self.config.enabled_sources[url] = checkbox.isChecked()
+            enabled_sources.update({
+                url: checkbox.isChecked()
+                for url, checkbox in self.source_vars.items()
+                if url and url != all_url and url not in _FANSTUDIO_GROUP_KEYS
+            })
             
             # 更新WebSocket URL列表（只包含all数据源和其他非fanstudio数据源）
-            # all数据源必须包含，单项fanstudio数据源不直接连接，只作为过滤器
-            ws_urls = []
-            # 确保all数据源被包含（无论enabled_sources中的状态）
-            if all_url not in ws_urls:
-                ws_urls.append(all_url)
-                logger.debug(f"已添加all数据源到ws_urls: {all_url}")
-            
-            # 添加其他非fanstudio数据源
-            for url in self.config.enabled_sources.keys():
-                if url.startswith(('ws://', 'wss://')) and self.config.enabled_sources.get(url, False):
-                    # 跳过all数据源（已经添加）
-                    if url == all_url:
-                        continue
-                    # 如果是非fanstudio数据源，也包含
-                    if 'fanstudio.tech' not in url and 'fanstudio.hk' not in url:
-                        ws_urls.append(url)
-                        logger.debug(f"已添加非fanstudio数据源到ws_urls: {url}")
-            
-            self.config.ws_urls = ws_urls
+            ws_urls = self.config.rebuild_ws_urls()
             logger.info(f"已更新ws_urls，包含{len(ws_urls)}个WebSocket数据源: {ws_urls}")
             
             # 地震速报 / 自定义文本 二选一
             self.config.message_config.use_custom_text = self.radio_custom_text.isChecked()
             
             # 保存到文件
-            self.config.save_config()
+            self._schedule_save()
             
             logger.debug("数据源设置已保存")
             
@@ -1577,69 +1658,50 @@ class SettingsWindow(QDialog):
             color_type: 颜色类型，'report'、'warning' 或 'custom_text'
         """
         try:
-            if color_type == 'report':
-                initial_color = self.current_report_color
-                default_color = '#00FFFF'  # 默认青色
-            elif color_type == 'warning':
-                initial_color = self.current_warning_color
-                default_color = '#FF0000'  # 默认红色
-            elif color_type == 'custom_text':
-                initial_color = self.current_custom_text_color
-                default_color = '#01FF00'  # 默认绿色
-            else:
+            if color_type not in self.COLOR_TYPES:
                 logger.error(f"未知的颜色类型: {color_type}")
                 return
+            attr, default_color = self.COLOR_TYPES[color_type]
+            initial_color = getattr(self, attr)
             
-            # 创建颜色选择器对话框
-            color_picker = Color48Picker(initial_color, default_color, self)
-            color_picker.colorSelected.connect(lambda color: self._on_color_selected(color_type, color))
+            # 颜色选择器首次使用时才导入并创建，之后复用同一实例
+            if self._color_picker is None:
+                from .color_manager import Color48Picker
+                self._color_picker = Color48Picker(initial_color, default_color, self)
+                self._color_picker.colorSelected.connect(
+                    lambda color: self._on_color_selected(self._color_picker_type, color)
+                )
+            else:
+                self._color_picker.set_colors(initial_color, default_color)
+            self._color_picker_type = color_type
             
-            # 显示对话框
-            if color_picker.exec_() == QDialog.Accepted:
-                # 颜色已在信号中处理
-                pass
+            # 显示对话框（颜色已在信号中处理）
+            self._color_picker.exec_()
                 
         except Exception as e:
             logger.error(f"打开颜色选择器失败: {e}")
             QMessageBox.critical(self, "错误", f"打开颜色选择器失败: {e}")
     
+    def _apply_color(self, color_type: str, color: str):
+        """更新某颜色类型的当前值、预览色块与色值标签"""
+        attr, _ = self.COLOR_TYPES[color_type]
+        setattr(self, attr, color)
+        preview, value_label = self._color_widgets[color_type]
+        preview.set_color(color)
+        value_label.setText(color)
+    
     def _on_color_selected(self, color_type: str, color: str):
         """
         颜色选择回调
         
         Args:
-            color_type: 颜色类型，'report' 或 'warning'
+            color_type: 颜色类型，'report'、'warning' 或 'custom_text'
             color: 选中的颜色值（十六进制格式）
         """
         try:
             color_upper = color.upper()
-            
-            if color_type == 'report':
-                self.current_report_color = color_upper
-                self.report_color_preview.setStyleSheet(
-                    f"background-color: {color_upper}; "
-                    "border: 1px solid #000; "
-                    "border-radius: 3px;"
-                )
-                self.report_color_label.setText(color_upper)
-            elif color_type == 'warning':
-                self.current_warning_color = color_upper
-                self.warning_color_preview.setStyleSheet(
-                    f"background-color: {color_upper}; "
-                    "border: 1px solid #000; "
-                    "border-radius: 3px;"
-                )
-                self.warning_color_label.setText(color_upper)
-            elif color_type == 'custom_text':
-                self.current_custom_text_color = color_upper
-                self.custom_text_color_preview.setStyleSheet(
-                    f"background-color: {color_upper}; "
-                    "border: 1px solid #000; "
-                    "border-radius: 3px;"
-                )
-                self.custom_text_color_label.setText(color_upper)
-            
-            logger.debug(f"颜色已选择: {color_type} -> {color_upper}")
+            self._apply_color(color_type, color_upper)
+            logger.debug("颜色已选择: %s -> %s", color_type, color_upper)
             
         except Exception as e:
             logger.error(f"处理颜色选择失败: {e}")
@@ -1652,137 +1714,33 @@ class SettingsWindow(QDialog):
             color_type: 颜色类型，'report'、'warning' 或 'custom_text'
         """
         try:
-            if color_type == 'report':
-                default_color = '#00FFFF'  # 默认青色
-                self.current_report_color = default_color
-                self.report_color_preview.setStyleSheet(
-                    f"background-color: {default_color}; "
-                    "border: 1px solid #000; "
-                    "border-radius: 3px;"
-                )
-                self.report_color_label.setText(default_color)
-            elif color_type == 'warning':
-                default_color = '#FF0000'  # 默认红色
-                self.current_warning_color = default_color
-                self.warning_color_preview.setStyleSheet(
-                    f"background-color: {default_color}; "
-                    "border: 1px solid #000; "
-                    "border-radius: 3px;"
-                )
-                self.warning_color_label.setText(default_color)
-            elif color_type == 'custom_text':
-                default_color = '#01FF00'  # 默认绿色
-                self.current_custom_text_color = default_color
-                self.custom_text_color_preview.setStyleSheet(
-                    f"background-color: {default_color}; "
-                    "border: 1px solid #000; "
-                    "border-radius: 3px;"
-                )
-                self.custom_text_color_label.setText(default_color)
-            
-            logger.debug(f"颜色已恢复默认: {color_type} -> {default_color}")
+            default_color = self.COLOR_TYPES[color_type][1]
+            self._apply_color(color_type, default_color)
+            logger.debug("颜色已恢复默认: %s -> %s", color_type, default_color)
             
         except Exception as e:
             logger.error(f"恢复默认颜色失败: {e}")
     
-    def _save_display_settings(self):
-        """保存显示设置"""
-        try:
-            old_timezone = getattr(self.config.gui_config, 'timezone', 'Asia/Shanghai')
-            new_timezone = self.display_vars['timezone'].currentData()
-            if new_timezone is None:
-                new_timezone = self.display_vars['timezone'].currentText().strip()
-            timezone_changed = (old_timezone != new_timezone)
-            
-            # 更新GUI配置
-            self.config.gui_config.text_speed = self.display_vars['speed'].value() / 10.0
-            self.config.gui_config.font_size = self.display_vars['font_size'].value()
-            self.config.gui_config.window_width = self.display_vars['width'].value()
-            self.config.gui_config.window_height = self.display_vars['height'].value()
-            self.config.gui_config.opacity = self.display_vars['opacity'].value() / 10.0
-            self.config.gui_config.vsync_enabled = self.display_vars['vsync_enabled'].isChecked()
-            self.config.gui_config.target_fps = self.display_vars['target_fps'].value()
-            self.config.gui_config.timezone = new_timezone
-            
-            # 保存到文件
-            self.config.save_config()
-            
-            # 通知主窗口更新（热更新，立即生效）
-            self.config._notify_config_changed()
-            
-            if timezone_changed:
-                QMessageBox.information(self, "成功", "显示设置已保存。\n时区已变更，请重启软件后生效。")
-            else:
-                QMessageBox.information(self, "成功", "显示设置已保存！\n设置已立即生效，无需重启程序。")
-            logger.debug("显示设置已保存（热更新）")
-            
-        except Exception as e:
-            logger.error(f"保存显示设置失败: {e}")
-            QMessageBox.critical(self, "错误", f"保存设置失败: {e}")
-
-    def _save_render_settings(self):
-        """保存渲染方式设置（仅渲染方式页使用）"""
-        try:
-            self.config.gui_config.use_gpu_rendering = self.render_vars['use_gpu_rendering'].isChecked()
-            self.config.save_config()
-            self.config._notify_config_changed()
-            msg = QMessageBox(self)
-            msg.setWindowTitle("成功")
-            msg.setText("渲染方式已保存，请重启软件后生效。")
-            msg.setIcon(QMessageBox.Information)
-            cancel_btn = msg.addButton("取消", QMessageBox.RejectRole)
-            restart_btn = msg.addButton("重启", QMessageBox.AcceptRole)
-            msg.exec_()
-            if msg.clickedButton() == restart_btn:
-                logger.debug("用户选择重启，正在重启软件...")
-                _exe = get_executable_path()
-                os.execv(_exe, [_exe] + sys.argv)
-            logger.debug("渲染方式已保存")
-        except Exception as e:
-            logger.error(f"保存渲染方式失败: {e}")
-            QMessageBox.critical(self, "错误", f"保存设置失败: {e}")
-    
-    def _save_color_settings(self):
-        """保存字体颜色设置"""
-        try:
-            # 更新颜色配置
-            self.config.message_config.report_color = self.current_report_color
-            self.config.message_config.warning_color = self.current_warning_color
-            self.config.message_config.custom_text_color = self.current_custom_text_color
-            
-            # 保存到文件
-            self.config.save_config()
-            
-            # 通知主窗口更新（热更新，立即生效）
-            self.config._notify_config_changed()
-            
-            QMessageBox.information(self, "成功", "字体颜色设置已保存！\n设置已立即生效，无需重启程序。")
-            logger.debug("字体颜色设置已保存（热更新）")
-            
-        except Exception as e:
-            logger.error(f"保存字体颜色设置失败: {e}")
-            QMessageBox.critical(self, "错误", f"保存设置失败: {e}")
-    
     def _save_appearance_settings(self):
         """保存「外观与显示」页全部设置（显示、渲染、颜色、自定义文本），统一提示是否需重启。"""
         try:
-            old_timezone = getattr(self.config.gui_config, 'timezone', 'Asia/Shanghai')
-            new_timezone = self.display_vars['timezone'].currentData()
+            old_timezone = self.config.gui_config.timezone
+            new_timezone = self.display_vars.timezone.currentData()
             if new_timezone is None:
-                new_timezone = self.display_vars['timezone'].currentText().strip()
+                new_timezone = self.display_vars.timezone.currentText().strip()
             timezone_changed = (old_timezone != new_timezone)
             old_gpu = self.config.gui_config.use_gpu_rendering
             new_gpu = self.render_vars['use_gpu_rendering'].isChecked()
             render_changed = (old_gpu != new_gpu)
             
             # 写入 gui_config（显示 + 渲染）
-            self.config.gui_config.text_speed = self.display_vars['speed'].value() / 10.0
-            self.config.gui_config.font_size = self.display_vars['font_size'].value()
-            self.config.gui_config.window_width = self.display_vars['width'].value()
-            self.config.gui_config.window_height = self.display_vars['height'].value()
-            self.config.gui_config.opacity = self.display_vars['opacity'].value() / 10.0
-            self.config.gui_config.vsync_enabled = self.display_vars['vsync_enabled'].isChecked()
-            self.config.gui_config.target_fps = self.display_vars['target_fps'].value()
+            self.config.gui_config.text_speed = self.display_vars.speed.value() / 10.0
+            self.config.gui_config.font_size = self.display_vars.font_size.value()
+            self.config.gui_config.window_width = self.display_vars.width.value()
+            self.config.gui_config.window_height = self.display_vars.height.value()
+            self.config.gui_config.opacity = self.display_vars.opacity.value() / 10.0
+            self.config.gui_config.vsync_enabled = self.display_vars.vsync_enabled.isChecked()
+            self.config.gui_config.target_fps = self.display_vars.target_fps.value()
             self.config.gui_config.timezone = new_timezone
             self.config.gui_config.use_gpu_rendering = new_gpu
             
@@ -1792,20 +1750,15 @@ class SettingsWindow(QDialog):
             self.config.message_config.custom_text_color = self.current_custom_text_color
             self.config.message_config.custom_text = self.custom_text_edit.toPlainText().strip() or ""
             
-            self.config.save_config()
+            self._schedule_save()
             self.config._notify_config_changed()
             
             need_restart = timezone_changed or render_changed
             if need_restart:
-                msg = QMessageBox(self)
-                msg.setWindowTitle("成功")
-                msg.setText("外观与显示设置已保存。\n时区或渲染方式已变更，请重启软件后生效。")
-                msg.setIcon(QMessageBox.Information)
-                cancel_btn = msg.addButton("取消", QMessageBox.RejectRole)
-                restart_btn = msg.addButton("重启", QMessageBox.AcceptRole)
-                msg.exec_()
-                if msg.clickedButton() == restart_btn:
+                if self._confirm("成功", "外观与显示设置已保存。\n时区或渲染方式已变更，请重启软件后生效。", "重启"):
                     logger.debug("用户选择重启，正在重启软件...")
+                    self._flush_pending_save()
+                    logger.flush()  # os.execv 不会执行退出清理，先写完后台队列中的日志
                     _exe = get_executable_path()
                     os.execv(_exe, [_exe] + sys.argv)
             else:
@@ -1831,15 +1784,11 @@ class SettingsWindow(QDialog):
             if not headline:
                 return None
             
-            # 提取预警类型和颜色
-            # 例如："广东省阳江市发布暴雨橙色预警信号" -> "暴雨橙色预警"
-            # 匹配模式：{类型}{颜色}预警
-            pattern = r'发布(.+?)(红色|橙色|黄色|蓝色|白色)预警'
-            match = re.search(pattern, headline)
+            # 提取预警类型和颜色（匹配模式：{类型}{颜色}预警）
+            match = split_weather_headline(headline)
             
             if match:
-                warning_type = match.group(1)  # 预警类型，如"暴雨"
-                warning_color = match.group(2)  # 预警颜色，如"橙色"
+                warning_type, warning_color = match  # 预警类型，如"暴雨"；预警颜色，如"橙色"
                 
                 # 构建图片文件名
                 image_filename = f"{warning_type}{warning_color}预警.jpg"
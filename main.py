@@ -16,6 +16,8 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # 启动/崩溃日志：exe 同目录，使用统一 exe 路径以支持中文路径
+_startup_log_file = None  # 首次写入时解析并缓存
+
 def _startup_log_path():
     try:
         from utils.resource_path import get_executable_dir
@@ -28,10 +30,14 @@ def _startup_log_path():
         except Exception:
             return "启动日志.txt"
 
-def _write_startup_log(line):
+def _write_startup_log(*lines):
+    """追加写入启动日志，多行内容一次写入"""
+    global _startup_log_file
     try:
-        with open(_startup_log_path(), "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        if _startup_log_file is None:
+            _startup_log_file = _startup_log_path()
+        with open(_startup_log_file, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
     except Exception:
         pass
 
@@ -43,6 +49,8 @@ try:
     import websockets
     import requests
     from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt, QTimer, QTranslator, QLocale
+    from PyQt5.QtGui import QIcon, QSurfaceFormat
 except ImportError as e:
     _write_startup_log("ImportError: " + str(e))
     print(f"错误: 缺少必要的依赖包: {e}")
@@ -76,12 +84,23 @@ try:
     except Exception as e:
         logger.warning(f"应用websockets库修复时出错: {e}")
 except BaseException:
-    _write_startup_log("---")
-    _write_startup_log("导入阶段异常:")
-    _write_startup_log(traceback.format_exc())
+    _write_startup_log("---", "导入阶段异常:", traceback.format_exc())
     sys.exit(1)
 
 
+def _configure_opengl(vsync_enabled: bool):
+    """设置 OpenGL 默认表面格式（须在创建 QApplication 之前调用，每个进程设置一次）"""
+    QApplication.setAttribute(Qt.AA_UseDesktopOpenGL, True)  # 优先使用桌面 OpenGL
+    fmt = QSurfaceFormat()
+    fmt.setRenderableType(QSurfaceFormat.OpenGL)
+    fmt.setProfile(QSurfaceFormat.CompatibilityProfile)
+    fmt.setVersion(2, 1)
+    fmt.setSwapInterval(1 if vsync_enabled else 0)
+    fmt.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
+    QSurfaceFormat.setDefaultFormat(fmt)
+    logger.info(f"OpenGL 默认格式已设置（VSync: {'开启' if vsync_enabled else '关闭'}）")
+
+
 def main():
     """主函数"""
     try:
@@ -96,17 +115,7 @@ def main():
         # 部分机器无独显/驱动异常会导致 Qt 初始化失败，此处做回退
         if config.gui_config.use_gpu_rendering:
             try:
-                from PyQt5.QtCore import Qt
-                from PyQt5.QtGui import QSurfaceFormat
-                QApplication.setAttribute(Qt.AA_UseDesktopOpenGL, True)  # 优先使用桌面 OpenGL
-                fmt = QSurfaceFormat()
-                fmt.setRenderableType(QSurfaceFormat.OpenGL)
-                fmt.setProfile(QSurfaceFormat.CompatibilityProfile)
-                fmt.setVersion(2, 1)
-                fmt.setSwapInterval(1 if config.gui_config.vsync_enabled else 0)
-                fmt.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
-                QSurfaceFormat.setDefaultFormat(fmt)
-                logger.info(f"OpenGL 默认格式已设置（VSync: {'开启' if config.gui_config.vsync_enabled else '关闭'}）")
+                _configure_opengl(config.gui_config.vsync_enabled)
             except Exception as e:
                 logger.warning(f"OpenGL 设置失败，回退到默认渲染: {e}")
                 _write_startup_log("OpenGL 回退到默认渲染: " + str(e))
@@ -119,7 +128,6 @@ def main():
         # 设置应用程序图标（用于任务栏和窗口标题栏）
         # 使用try-except包装，避免文件系统操作阻塞
         try:
-            from PyQt5.QtGui import QIcon
             icon_path = os.path.join(os.path.dirname(__file__), 'logo', 'icon.ico')
             try:
                 if os.path.exists(icon_path):
@@ -136,36 +144,52 @@ def main():
         # 延迟加载翻译文件，避免阻塞启动
         def load_translator_async():
             try:
-                from PyQt5.QtCore import QTranslator, QLocale, QTimer
-                translator = QTranslator()
-                # 尝试加载Qt的中文翻译文件
-                # 翻译文件通常位于 PyQt5 安装目录的 translations 文件夹中
-                qt_translations_path = os.path.join(os.path.dirname(__file__), 'translations')
-                try:
-                    if os.path.exists(qt_translations_path):
-                        translator.load(QLocale(QLocale.Chinese, QLocale.China), 'qtbase_', '', qt_translations_path)
-                        app.installTranslator(translator)
-                        logger.info("已加载Qt中文翻译")
-                        return
-                except (OSError, PermissionError) as e:
-                    logger.debug(f"检查本地翻译文件时出错（非阻塞）: {e}")
-                
-                # 如果本地没有翻译文件，尝试从PyQt5安装目录加载
+                # 以 app 为父对象，避免函数返回后翻译器被回收
+                translator = QTranslator(app)
+                locale = QLocale(QLocale.Chinese, QLocale.China)
+                cached_dir = config.gui_config.qt_translation_dir
+                # 上次成功加载的目录：直接加载，跳过目录探测
+                if cached_dir and translator.load(locale, 'qtbase_', '', cached_dir):
+                    app.installTranslator(translator)
+                    logger.info(f"已加载Qt中文翻译: {cached_dir}")
+                    return
+                # 翻译文件优先使用程序目录下的 translations，其次为 PyQt5 安装目录的 translations
+                candidates = [os.path.join(os.path.dirname(__file__), 'translations')]
                 try:
                     import PyQt5
-                    pyqt5_path = os.path.dirname(PyQt5.__file__)
-                    translations_path = os.path.join(pyqt5_path, 'translations')
-                    if os.path.exists(translations_path):
-                        translator.load(QLocale(QLocale.Chinese, QLocale.China), 'qtbase_', '', translations_path)
+                    candidates.append(os.path.join(os.path.dirname(PyQt5.__file__), 'translations'))
+                except ImportError:
+                    pass
+                for translations_dir in candidates:
+                    if translations_dir == cached_dir:
+                        continue
+                    try:
+                        if not os.path.isdir(translations_dir):
+                            continue
+                    except (OSError, PermissionError) as e:
+                        logger.debug(f"检查翻译目录时出错（非阻塞）: {e}")
+                        continue
+                    if translator.load(locale, 'qtbase_', '', translations_dir):
                         app.installTranslator(translator)
-                        logger.info("已加载Qt中文翻译（从PyQt5安装目录）")
-                except (OSError, PermissionError) as e:
-                    logger.debug(f"检查PyQt5翻译文件时出错（非阻塞）: {e}")
+                        logger.info(f"已加载Qt中文翻译: {translations_dir}")
+                        # PyInstaller 单文件版每次启动解压到不同的临时目录（sys._MEIPASS），这类路径不缓存
+                        meipass = getattr(sys, '_MEIPASS', None)
+                        if meipass and os.path.normcase(os.path.abspath(translations_dir)).startswith(
+                                os.path.normcase(os.path.join(os.path.abspath(meipass), ''))):
+                            translations_dir = ""
+                        if translations_dir != cached_dir:
+                            config.gui_config.qt_translation_dir = translations_dir
+                            config.save_config()
+                        return
+                logger.debug("未找到Qt中文翻译文件")
+                if cached_dir:
+                    # 缓存的目录已失效（被移动或删除），清除后不再每次启动先尝试它
+                    config.gui_config.qt_translation_dir = ""
+                    config.save_config()
             except Exception as e:
                 logger.warning(f"加载Qt中文翻译失败: {e}，将使用系统默认语言")
         
         # 延迟执行翻译文件加载，避免阻塞启动
-        from PyQt5.QtCore import QTimer
         QTimer.singleShot(100, load_translator_async)
         
         # 创建主窗口
@@ -186,9 +210,7 @@ def main():
     except Exception as e:
         # 任何未捕获异常都写入 exe 同目录启动日志，便于无控制台时排查
         try:
-            _write_startup_log("---")
-            _write_startup_log("异常: " + str(e))
-            _write_startup_log(traceback.format_exc())
+            _write_startup_log("---", "异常: " + str(e), traceback.format_exc())
         except Exception:
             pass
         if logger and logger.logger:
@@ -206,9 +228,7 @@ if __name__ == "__main__":
     except Exception:
         # 捕获 main() 之外异常（如导入阶段崩溃），同样落盘
         try:
-            _write_startup_log("---")
-            _write_startup_log("启动或导入阶段异常:")
-            _write_startup_log(traceback.format_exc())
+            _write_startup_log("---", "启动或导入阶段异常:", traceback.format_exc())
         except Exception:
             pass
         sys.exit(1)
@@ -5,42 +5,114 @@
 提供统一的日志记录功能，支持文件和控制台输出
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import time
 from datetime import datetime
-from pathlib import Path
+
+# 数据目录：与配置文件、翻译缓存放在一起
+# 统一目录：C:\Users\账户名\AppData\Roaming\subtitl\
+# 模块加载时确定一次；创建失败时使用项目根目录下的 data 目录作为后备
+_LOG_DIR = os.path.join(os.path.expanduser('~'), 'AppData', 'Roaming', 'subtitl')
+if not os.path.isdir(_LOG_DIR):
+    try:
+        os.makedirs(_LOG_DIR, exist_ok=True)
+    except OSError:
+        _LOG_DIR = "data"
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    带 64 KB 写缓冲的 RotatingFileHandler
+    WARNING 及以上的记录立即写盘；更低级别的记录（文件级别被调低时）先写入缓冲区，
+    距上次刷新超过 FLUSH_INTERVAL 秒、flush() 或关闭时才写盘。
+    文件大小自行累计，避免基类每条记录 seek/tell 导致缓冲区被提前刷出。
+    """
+    BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 5.0  # 秒
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding)
+        self._size = stream.tell()
+        return stream
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            data_size = len(msg.encode(self.encoding or 'utf-8', 'replace'))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + data_size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += data_size
+            now = time.monotonic()
+            if record.levelno >= logging.WARNING or now - self._last_flush >= self.FLUSH_INTERVAL:
+                self.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    按秒缓存 asctime 的 Formatter
+    同一秒内的日志记录复用上次格式化好的时间字符串，不再逐条调用 time.strftime。
+    仅用于指定了 datefmt 的格式（不含毫秒）。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (整秒时间戳, 格式化结果)，整体替换以保证多线程读取时一致
+        self._time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if second != cached_second:
+            cached_text = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, cached_text)
+        return cached_text
 
 
 class Logger:
-    """日志管理器 - 单例模式"""
-    _instance = None
-    _initialized = False
+    """日志管理器 - 单例模式：模块加载时创建唯一实例 logger，之后 Logger() 直接返回该实例"""
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-        return cls._instance
+        return logger
     
-    def __init__(self):
-        if self._initialized:
-            return
-        
-        # 数据目录：与配置文件、翻译缓存放在一起
-        # 统一目录：C:\Users\账户名\AppData\Roaming\subtitl\
-        try:
-            # 使用与配置文件相同的目录
-            data_dir = Path.home() / 'AppData' / 'Roaming' / 'subtitl'
-            data_dir.mkdir(parents=True, exist_ok=True)
-            self.log_dir = str(data_dir)
-        except Exception:
-            # 如果失败，使用项目根目录下的 data 目录作为后备
-            self.log_dir = "data"
+    def _init(self):
+        """初始化唯一实例（仅在模块加载时调用一次）"""
+        self.log_dir = _LOG_DIR
         
         self.log_file = None
         self.logger = None
         self.console_handler = None
         self.file_handler = None
+        # 调用线程只把日志记录放入队列，控制台/文件输出由后台监听线程完成
+        self._log_queue = queue.SimpleQueue()
+        self._queue_handler = None
+        self._listener = None
+        # 各级别是否会有处理器输出的缓存标志，由 _refresh_levels 维护
+        self._threshold = logging.CRITICAL + 1
+        self._debug_on = False
+        self._info_on = False
+        self._warn_on = False
+        self._err_on = False
 
         # 不再在初始化时调用 Config()，避免与 config 的循环依赖及启动阶段崩溃
         # 使用与 config.LogConfig 一致的默认值；main 在 Config 加载后可调用 set_log_config 同步
@@ -55,6 +127,10 @@ class Logger:
         except Exception as e:
             # 如果日志初始化失败，至少设置控制台输出
             print(f"警告: 日志初始化失败: {e}")
+            self._stop_listener()
+            if self.logger and self._queue_handler:
+                self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
             self.logger = logging.getLogger('EarthquakeScroller')
             self.logger.setLevel(logging.INFO)
             self.console_handler = logging.StreamHandler()
@@ -62,27 +138,83 @@ class Logger:
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             self.console_handler.setFormatter(formatter)
             self.logger.addHandler(self.console_handler)
-        
-        self._initialized = True
+            self._refresh_levels()
     
     def _setup_logger(self):
         """设置日志记录器"""
         self.logger = logging.getLogger('EarthquakeScroller')
         self.logger.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
+        console_formatter = CachedTimeFormatter(
             '%(asctime)s [%(levelname)s] %(message)s',
             datefmt='%H:%M:%S'
         )
         self.console_handler = logging.StreamHandler()
         self.console_handler.setLevel(logging.INFO)
         self.console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(self.console_handler)
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        self.logger.addHandler(self._queue_handler)
+        atexit.register(self._stop_listener)
         self._setup_file_handler(clear_if_config=True)
 
+    def _stop_listener(self):
+        """停止后台监听线程（会先写完队列中剩余的日志）"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _restart_listener(self):
+        """按当前的控制台/文件处理器重建后台监听线程"""
+        self._stop_listener()
+        self._refresh_levels()
+        if self._queue_handler is None:
+            return
+        # 即使没有任何输出处理器也启动监听线程，保证队列被持续取空
+        handlers = [h for h in (self.console_handler, self.file_handler) if h is not None]
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def _refresh_levels(self):
+        """按 logger 级别和各输出处理器级别重新计算各级别是否启用。
+
+        日志经队列转交后台线程，处理器级别的过滤发生在入队之后；
+        这里取处理器中的最低级别作为门槛，低于门槛的调用直接返回，不再创建和格式化日志记录。
+        """
+        if self.logger is None:
+            threshold = logging.CRITICAL + 1
+        else:
+            handlers = [h for h in (self.console_handler, self.file_handler) if h is not None]
+            threshold = min((h.level for h in handlers), default=logging.CRITICAL + 1)
+            threshold = max(threshold, self.logger.getEffectiveLevel())
+        self._threshold = threshold
+        self._debug_on = threshold <= logging.DEBUG
+        self._info_on = threshold <= logging.INFO
+        self._warn_on = threshold <= logging.WARNING
+        self._err_on = threshold <= logging.ERROR
+
+    def flush(self):
+        """把队列中已提交的日志全部写出并刷新到文件（如进程被 os.execv 替换前调用）"""
+        if self._listener is not None:
+            self._restart_listener()
+        if self.file_handler is not None:
+            try:
+                self.file_handler.flush()
+            except Exception:
+                pass
+
     def _setup_file_handler(self, clear_if_config: bool = True):
         """创建或重建文件处理器。clear_if_config 为 True 时执行启动前清空逻辑。"""
-        if self.file_handler and self.logger:
-            self.logger.removeHandler(self.file_handler)
+        # 先停掉监听线程（写完队列中已有的日志），再替换文件处理器
+        self._stop_listener()
+        try:
+            self._create_file_handler(clear_if_config)
+        finally:
+            self._restart_listener()
+
+    def _create_file_handler(self, clear_if_config: bool):
+        """关闭旧的文件处理器并按当前配置创建新的（由 _setup_file_handler 在监听线程停止期间调用）"""
+        if self.file_handler:
             try:
                 self.file_handler.close()
             except Exception:
@@ -92,7 +224,7 @@ class Logger:
             self.log_file = None
             return
         try:
-            file_formatter = logging.Formatter(
+            file_formatter = CachedTimeFormatter(
                 '%(asctime)s [%(levelname)s] %(name)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
@@ -102,24 +234,24 @@ class Logger:
                 log_filename = os.path.join(self.log_dir, "log.txt")
             if clear_if_config and self.clear_log_on_startup:
                 try:
-                    log_dir = Path(self.log_dir)
-                    main_log_path = Path(log_filename).resolve()
-                    if log_dir.exists():
+                    main_log_path = os.path.abspath(log_filename)
+                    if os.path.isdir(self.log_dir):
                         try:
                             with open(log_filename, 'w', encoding='utf-8'):
                                 pass
                         except OSError as e:
                             print(f"警告: 无法清空日志文件 {log_filename}: {e}")
-                        for f in log_dir.glob('log.txt*'):
-                            if f.resolve() != main_log_path:
-                                try:
-                                    f.unlink()
-                                except OSError:
-                                    pass
-                        for f in log_dir.glob('log_*.txt'):
-                            if f.resolve() != main_log_path:
+                        # 一次遍历目录，删除轮转备份 log.txt* 和按日期分割的 log_*.txt（保留当前日志文件）
+                        with os.scandir(self.log_dir) as entries:
+                            for entry in entries:
+                                name = entry.name
+                                if not (name.startswith('log.txt')
+                                        or (name.startswith('log_') and name.endswith('.txt'))):
+                                    continue
+                                if not entry.is_file() or os.path.abspath(entry.path) == main_log_path:
+                                    continue
                                 try:
-                                    f.unlink()
+                                    os.unlink(entry.path)
                                 except OSError:
                                     pass
                 except Exception as e:
@@ -130,12 +262,11 @@ class Logger:
                     log_filename, when='midnight', interval=1, backupCount=30, encoding='utf-8'
                 )
             else:
-                self.file_handler = logging.handlers.RotatingFileHandler(
+                self.file_handler = BufferedRotatingFileHandler(
                     log_filename, maxBytes=max_bytes, backupCount=5, encoding='utf-8'
                 )
             self.file_handler.setLevel(logging.WARNING)
             self.file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(self.file_handler)
             self.log_file = log_filename
         except (OSError, PermissionError) as e:
             print(f"警告: 无法创建日志文件: {e}")
@@ -152,52 +283,81 @@ class Logger:
 
     def debug(self, message: str, *args, **kwargs):
         """记录调试信息"""
-        if self.logger:
+        if self._debug_on:
             self.logger.debug(message, *args, **kwargs)
     
     def info(self, message: str, *args, **kwargs):
         """记录一般信息"""
-        if self.logger:
+        if self._info_on:
             self.logger.info(message, *args, **kwargs)
     
     def warning(self, message: str, *args, **kwargs):
         """记录警告信息"""
-        if self.logger:
+        if self._warn_on:
             self.logger.warning(message, *args, **kwargs)
     
     def error(self, message: str, *args, **kwargs):
         """记录错误信息"""
-        if self.logger:
+        if self._err_on:
             self.logger.error(message, *args, **kwargs)
     
     def exception(self, message: str, *args, **kwargs):
         """记录异常信息"""
-        if self.logger:
+        if self._err_on:
             self.logger.exception(message, *args, **kwargs)
     
+    def log_simple(self, level: int, message: str):
+        """快速通道：记录已格式化好的单条消息（不带参数）。
+
+        不做 *args/**kwargs 打包，也不回溯调用栈查找文件名和行号（日志格式中未使用），
+        直接构造日志记录交给 logger 处理。适用于滚动刷新等频繁调用处的固定文本或 f-string 消息；
+        需要 % 参数或异常堆栈时仍使用 debug/info 等方法。
+        """
+        if level >= self._threshold:
+            self.logger.handle(self.logger.makeRecord(
+                self.logger.name, level, "(unknown file)", 0, message, (), None
+            ))
+
+    def debug_fast(self, message: str):
+        """快速通道记录调试信息，见 log_simple"""
+        if self._debug_on:
+            self.log_simple(logging.DEBUG, message)
+
+    def info_fast(self, message: str):
+        """快速通道记录一般信息，见 log_simple"""
+        if self._info_on:
+            self.log_simple(logging.INFO, message)
+
     def set_console_level(self, level: int):
         """设置控制台日志级别"""
         if self.console_handler:
             self.console_handler.setLevel(level)
+            self._refresh_levels()
 
     def disable_console(self):
         """关闭控制台输出（调试版启动完成后调用，使控制台只保留启动阶段日志）"""
         if self.logger and self.console_handler:
-            self.logger.removeHandler(self.console_handler)
+            console_handler = self.console_handler
+            if self._queue_handler is None:
+                # 初始化失败时的后备模式：控制台处理器直接挂在 logger 上
+                self.logger.removeHandler(console_handler)
+            self.console_handler = None
+            self._restart_listener()
             try:
-                self.console_handler.close()
+                console_handler.close()
             except Exception:
                 pass
-            self.console_handler = None
     
     def set_file_level(self, level: int):
         """设置文件日志级别"""
         if self.file_handler:
             self.file_handler.setLevel(level)
+            self._refresh_levels()
 
 
 # 全局日志实例
-logger = Logger()
+logger = object.__new__(Logger)
+logger._init()
 
 
 def get_logger() -> Logger:
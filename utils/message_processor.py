@@ -5,7 +5,7 @@
 负责将解析后的数据格式化为显示消息
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import re
 
 import sys
@@ -19,6 +19,50 @@ from utils import timezone_utils
 
 logger = get_logger()
 
+# 气象预警颜色 -> 字幕字体颜色
+_WEATHER_COLOR_MAP = {
+    '红色': '#FF0000',  # 红色
+    '橙色': '#FF8C00',  # 橙色（深橙色）
+    '黄色': '#FFFF00',  # 黄色
+    '蓝色': '#00BFFF',  # 蓝色（深蓝色）
+    '白色': '#FFFFFF',  # 白色
+}
+
+
+def split_weather_headline(headline: str) -> Optional[Tuple[str, str]]:
+    """
+    从气象预警 headline 中提取 (预警类型, 预警颜色)，未匹配时返回 None
+    例如："广东省阳江市发布暴雨橙色预警信号" -> ("暴雨", "橙色")
+    与正则 发布(.+?)(红色|橙色|黄色|蓝色|白色)预警 的结果一致，只用 str.find 扫描
+    """
+    start = headline.find('发布')
+    while start != -1:
+        type_start = start + 2
+        # 类型至少 1 个字符，颜色 2 个字符，取最靠前的「{颜色}预警」
+        warn = headline.find('预警', type_start + 3)
+        while warn != -1:
+            color = headline[warn - 2:warn]
+            if color in _WEATHER_COLOR_MAP:
+                warning_type = headline[type_start:warn - 2]
+                if '\n' in warning_type:
+                    break
+                return warning_type, color
+            warn = headline.find('预警', warn + 1)
+        start = headline.find('发布', start + 1)
+    return None
+
+
+# 气象预警匹配用正则（模块加载时编译一次）
+_WEATHER_COLOR_RE = re.compile(r'(红色|橙色|黄色|蓝色|白色)预警')
+# description：优先匹配带颜色的（如"大雾蓝色预警"），其次匹配"大雾Ⅳ级预警"或"大雾预警"
+_WEATHER_DESC_COLOR_RE = re.compile(r'([^，。：:；;]+?)(红色|橙色|黄色|蓝色|白色)预警')
+_WEATHER_DESC_RES = (
+    _WEATHER_DESC_COLOR_RE,
+    re.compile(r'([^，。：:；;]+?)(?:Ⅳ级|Ⅴ级|Ⅲ级|Ⅱ级|Ⅰ级)?预警'),
+)
+_WEATHER_TYPE_PREFIX_RE = re.compile(r'^(高速公路|发布|预计|根据|上述地区)')
+_CHINESE_CHAR_RE = re.compile(r'[\u4e00-\u9fff]')
+
 
 class MessageProcessor:
     """消息处理器"""
@@ -27,6 +71,8 @@ class MessageProcessor:
         self.config = Config()
         # 气象预警图片目录（兼容打包后的路径）
         self.weather_images_dir = get_resource_path("气象预警信号图片")
+        # 图片目录内容在运行期间不变：启动时扫描一次文件名，匹配时用集合查找代替逐次 stat
+        self._weather_image_names = self._scan_weather_image_names(self.weather_images_dir)
         
         # 初始化翻译服务
         try:
@@ -182,8 +228,7 @@ class MessageProcessor:
         # 预警地名翻译（仅对特定数据源进行翻译）
         try:
             if place_name:
-                import re
-                has_chinese = bool(re.search(r'[\u4e00-\u9fff]', place_name))
+                has_chinese = bool(_CHINESE_CHAR_RE.search(place_name))
                 
                 # CEA、CEA-PR、SICHUAN、CWA-EEW、Wolfx 部分为中文地名，无需翻译
                 chinese_sources = {'cea', 'cea-pr', 'sichuan', 'cwa-eew', 'wolfx_sc_eew', 'wolfx_fj_eew', 'wolfx_cenc_eew', 'wolfx_cenc_eqlist'}
@@ -463,6 +508,16 @@ class MessageProcessor:
         
         return "".join(message_parts)
     
+    @staticmethod
+    def _scan_weather_image_names(images_dir) -> frozenset:
+        """扫描气象预警图片目录，返回其中的文件名集合（目录不存在或不可读时为空集合）"""
+        try:
+            with os.scandir(images_dir) as it:
+                return frozenset(entry.name for entry in it if entry.is_file())
+        except OSError as e:
+            logger.error(f"无法读取气象预警图片目录 {images_dir}: {e}")
+            return frozenset()
+    
     def _match_weather_image(self, weather_data: Dict[str, Any]) -> Optional[str]:
         """
         根据气象预警数据匹配图片文件路径（快速匹配，不阻塞）
@@ -484,23 +539,21 @@ class MessageProcessor:
             
             logger.info(f"尝试匹配气象预警图片，headline: {headline}")
             
-            # 检查图片目录是否存在
-            if not self.weather_images_dir.exists():
-                logger.error(f"气象预警图片目录不存在: {self.weather_images_dir}")
+            # 检查图片目录是否存在（启动时扫描结果为空即目录不存在或为空）
+            if not self._weather_image_names:
+                logger.error(f"气象预警图片目录不存在或为空: {self.weather_images_dir}")
                 return None
             
             # 提取预警类型和颜色
             # 例如："广东省阳江市发布暴雨橙色预警信号" -> "暴雨橙色预警"
             # 匹配模式：{类型}{颜色}预警
-            pattern = r'发布(.+?)(红色|橙色|黄色|蓝色|白色)预警'
-            match = re.search(pattern, headline)
+            match = split_weather_headline(headline)
             
             warning_type = None
             warning_color = None
             
             if match:
-                warning_type = match.group(1)  # 预警类型，如"暴雨"
-                warning_color = match.group(2)  # 预警颜色，如"橙色"
+                warning_type, warning_color = match  # 预警类型，如"暴雨"；预警颜色，如"橙色"
                 
                 logger.info(f"从headline匹配到预警类型: {warning_type}, 颜色: {warning_color}")
                 
@@ -510,22 +563,15 @@ class MessageProcessor:
                 
                 logger.info(f"查找图片文件: {image_path}")
                 
-                # 快速检查文件是否存在（使用try-except避免阻塞）
-                try:
-                    if image_path.exists():
-                        logger.info(f"✓ 找到气象预警图片: {image_filename}, 完整路径: {image_path}")
-                        return str(image_path)
-                    else:
-                        logger.warning(f"✗ 气象预警图片文件不存在: {image_path}")
-                        # 如果headline中匹配到但文件不存在，继续尝试从description中匹配
-                        logger.info("headline中匹配到但图片不存在，尝试从description中匹配")
-                except (OSError, PermissionError) as e:
-                    # 文件系统错误，忽略
-                    logger.error(f"检查图片文件时出错: {e}")
-                    pass
+                if image_filename in self._weather_image_names:
+                    logger.info(f"✓ 找到气象预警图片: {image_filename}, 完整路径: {image_path}")
+                    return str(image_path)
+                logger.warning(f"✗ 气象预警图片文件不存在: {image_path}")
+                # 如果headline中匹配到但文件不存在，继续尝试从description中匹配
+                logger.info("headline中匹配到但图片不存在，尝试从description中匹配")
             else:
                 logger.warning(f"无法从headline匹配图片模式: {headline}")
-                logger.debug(f"尝试的正则表达式: {pattern}")
+                logger.debug("匹配模式: 发布{类型}{红色|橙色|黄色|蓝色|白色}预警")
                 # 如果headline中未匹配到，尝试从description中匹配
                 logger.info("headline中未匹配到，尝试从description中匹配")
             
@@ -533,7 +579,7 @@ class MessageProcessor:
             # 首先需要从headline中提取颜色（如果之前未提取）
             if not warning_color:
                 # 尝试从headline中提取颜色
-                color_match = re.search(r'(红色|橙色|黄色|蓝色|白色)预警', headline)
+                color_match = _WEATHER_COLOR_RE.search(headline)
                 if color_match:
                     warning_color = color_match.group(1)
                     logger.debug(f"从headline中提取到颜色: {warning_color}")
@@ -546,18 +592,13 @@ class MessageProcessor:
                 # 匹配description中的预警类型和颜色
                 # 例如："高速公路大雾Ⅳ级预警" -> "大雾"
                 # 支持多种格式：大雾预警、大雾Ⅳ级预警、暴雨预警、大雾蓝色预警等
-                desc_patterns = [
-                    r'([^，。：:；;]+?)(红色|橙色|黄色|蓝色|白色)预警',  # 优先匹配带颜色的，如"大雾蓝色预警"
-                    r'([^，。：:；;]+?)(?:Ⅳ级|Ⅴ级|Ⅲ级|Ⅱ级|Ⅰ级)?预警',  # 匹配"大雾Ⅳ级预警"或"大雾预警"
-                ]
-                
-                for desc_pattern in desc_patterns:
-                    desc_match = re.search(desc_pattern, description)
+                for desc_re in _WEATHER_DESC_RES:
+                    desc_match = desc_re.search(description)
                     if desc_match:
                         # 提取预警类型（去除常见的前缀词）
                         potential_type = desc_match.group(1).strip()
                         # 清理前缀词（如"高速公路"、"发布"、"预计"、"根据"等）
-                        potential_type = re.sub(r'^(高速公路|发布|预计|根据|上述地区)', '', potential_type)
+                        potential_type = _WEATHER_TYPE_PREFIX_RE.sub('', potential_type)
                         potential_type = potential_type.strip()
                         
                         # 如果匹配到颜色，使用匹配到的颜色（优先使用description中的颜色）
@@ -567,7 +608,7 @@ class MessageProcessor:
                         
                         # 如果还没有颜色，尝试从description中单独提取颜色
                         if not warning_color:
-                            color_match = re.search(r'(红色|橙色|黄色|蓝色|白色)预警', description)
+                            color_match = _WEATHER_COLOR_RE.search(description)
                             if color_match:
                                 warning_color = color_match.group(1)
                                 logger.info(f"从description中单独提取到颜色: {warning_color}")
@@ -587,16 +628,10 @@ class MessageProcessor:
                                 
                                 logger.info(f"查找图片文件: {image_path}")
                                 
-                                # 检查文件是否存在
-                                try:
-                                    if image_path.exists():
-                                        logger.info(f"✓ 从description中找到气象预警图片: {image_filename}, 完整路径: {image_path}")
-                                        return str(image_path)
-                                    else:
-                                        logger.warning(f"✗ description中匹配到但图片文件不存在: {image_path}")
-                                except (OSError, PermissionError) as e:
-                                    logger.error(f"检查图片文件时出错: {e}")
-                                    pass
+                                if image_filename in self._weather_image_names:
+                                    logger.info(f"✓ 从description中找到气象预警图片: {image_filename}, 完整路径: {image_path}")
+                                    return str(image_path)
+                                logger.warning(f"✗ description中匹配到但图片文件不存在: {image_path}")
                         break
                 else:
                     logger.debug("无法从description中匹配到预警类型")
@@ -604,13 +639,10 @@ class MessageProcessor:
                 logger.debug("description字段为空，无法从description中匹配")
             
             # 列出目录中的文件以便调试
-            try:
-                existing_files = list(self.weather_images_dir.glob("*.jpg"))
-                logger.debug(f"图片目录中的文件数量: {len(existing_files)}")
-                if len(existing_files) <= 10:
-                    logger.debug(f"图片目录中的文件: {[f.name for f in existing_files]}")
-            except Exception as e:
-                logger.debug(f"无法列出图片目录: {e}")
+            existing_files = [name for name in self._weather_image_names if name.endswith('.jpg')]
+            logger.debug(f"图片目录中的文件数量: {len(existing_files)}")
+            if len(existing_files) <= 10:
+                logger.debug(f"图片目录中的文件: {existing_files}")
             
             return None
             
@@ -728,22 +760,13 @@ class MessageProcessor:
             
             # 提取预警颜色
             # 例如："广东省阳江市发布暴雨橙色预警信号" -> "橙色"
-            pattern = r'发布(.+?)(红色|橙色|黄色|蓝色|白色)预警'
-            match = re.search(pattern, headline)
+            match = split_weather_headline(headline)
             
             if match:
-                warning_color = match.group(2)  # 预警颜色，如"橙色"
+                warning_color = match[1]  # 预警颜色，如"橙色"
                 
                 # 根据预警颜色返回对应的字体颜色
-                color_map = {
-                    '红色': '#FF0000',  # 红色
-                    '橙色': '#FF8C00',  # 橙色（深橙色）
-                    '黄色': '#FFFF00',  # 黄色
-                    '蓝色': '#00BFFF',  # 蓝色（深蓝色）
-                    '白色': '#FFFFFF',  # 白色
-                }
-                
-                color = color_map.get(warning_color)
+                color = _WEATHER_COLOR_MAP.get(warning_color)
                 if color:
                     logger.info(f"气象预警颜色: {warning_color} -> {color}")
                     return color
@@ -752,18 +775,10 @@ class MessageProcessor:
             description = raw_data.get('description', '')
             if description:
                 # 尝试从description中匹配预警颜色
-                desc_pattern = r'([^，。：:；;]+?)(红色|橙色|黄色|蓝色|白色)预警'
-                desc_match = re.search(desc_pattern, description)
+                desc_match = _WEATHER_DESC_COLOR_RE.search(description)
                 if desc_match:
                     warning_color = desc_match.group(2)
-                    color_map = {
-                        '红色': '#FF0000',
-                        '橙色': '#FF8C00',
-                        '黄色': '#FFFF00',
-                        '蓝色': '#00BFFF',
-                        '白色': '#FFFFFF',
-                    }
-                    color = color_map.get(warning_color)
+                    color = _WEATHER_COLOR_MAP.get(warning_color)
                     if color:
                         logger.info(f"从description提取气象预警颜色: {warning_color} -> {color}")
                         return color